@@ -0,0 +1,39 @@
+import argparse
+import os
+
+from aoc import instrument
+from aoc.cache import DEFAULT_DIR, MAX_BYTES, ResultCache
+from aoc.memory import MB
+from aoc.runner import run
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Runs the solutions of all (or selected) days in parallel")
+    parser.add_argument("days", nargs="*", type=int, help="days to run, all discovered days by default")
+    parser.add_argument("--input", default="input.txt", help="input file name inside each day directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, cpu count by default")
+    parser.add_argument("--format", choices=["table", "json"], default="table")
+    parser.add_argument("--no-cache", action="store_true", help="always compute, do not read or write the cache")
+    parser.add_argument("--cache-dir", default=DEFAULT_DIR)
+    parser.add_argument("--cache-size", type=int, default=MAX_BYTES, help="cache size limit in bytes")
+    parser.add_argument("--instrument", choices=["time", instrument.MEMORY],
+                        help="report calls, time (and allocations) of hot functions, disables the cache")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="write cProfile stats and folded stacks of every task to DIR, disables the cache")
+    parser.add_argument("--memory", action="store_true",
+                        help="report peak memory and top allocation sites of every task, disables the cache")
+    parser.add_argument("--memory-limit", type=float, metavar="MB",
+                        help="abort a task growing by more than MB megabytes instead of exhausting the host")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.instrument:
+        instrument.enable(args.instrument)
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+    use_cache = not (args.no_cache or args.instrument or args.profile or args.memory)
+    cache = ResultCache(args.cache_dir, args.cache_size) if use_cache else None
+    memory_limit = int(args.memory_limit * MB) if args.memory_limit else None
+    print(run(args.days, args.input, args.workers, args.format, cache, args.profile, args.memory, memory_limit))
@@ -0,0 +1,100 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from functools import partial
+from os import path
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+from aoc.days import get_input_path, load_day
+from aoc.generate import generate_file
+from aoc.runner import collect_tasks, run_task
+
+
+def list_inputs(source):
+    """All files of a directory, or the paths listed in a manifest file relative to the manifest"""
+    if path.isdir(source):
+        return [path.join(source, name) for name in sorted(os.listdir(source))
+                if path.isfile(path.join(source, name))]
+    base = path.dirname(path.abspath(source))
+    with open(source, "r", encoding="utf-8") as file:
+        return [path.join(base, line.strip()) for line in file if line.strip()]
+
+
+def warm_up(day):
+    """Imports the day once per worker, so its module level setup is shared by all inputs"""
+    load_day(day)
+
+
+def solve_input(tasks, fname):
+    return [dict(asdict(run_task(task, fname)), input=fname) for task in tasks]
+
+
+def solve_batch(day, inputs, workers=None, chunksize=4):
+    """Yields result dicts in the order of inputs, as soon as they are ready"""
+    tasks = collect_tasks([day])
+    inputs = [get_input_path(day, fname) for fname in inputs]
+    if workers == 1:
+        warm_up(day)
+        for fname in inputs:
+            yield from solve_input(tasks, fname)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_up, initargs=(day,)) as executor:
+        for results in executor.map(partial(solve_input, tasks), inputs, chunksize=chunksize):
+            yield from results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Solves many inputs of one day, printing JSON lines")
+    parser.add_argument("day", type=int)
+    parser.add_argument("source", help="directory of inputs or manifest file with one input path per line")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, cpu count by default")
+    parser.add_argument("--chunksize", type=int, default=4, help="inputs sent to a worker at once")
+    return parser.parse_args()
+
+
+def main(args):
+    inputs = list_inputs(args.source)
+    begin = time.perf_counter()
+    for result in solve_batch(args.day, inputs, args.workers, args.chunksize):
+        print(json.dumps(result, default=str), flush=True)
+    seconds = time.perf_counter() - begin
+    print(f"{len(inputs)} inputs in {seconds:.3f}s, {len(inputs) / seconds:.1f} inputs/s", file=sys.stderr)
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        for seed in range(3):
+            generate_file(path.join(self.directory.name, f"{seed}.txt"), 2, 0.1, seed)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_list_inputs_directory(self):
+        inputs = list_inputs(self.directory.name)
+        self.assertEqual([path.basename(i) for i in inputs], ["0.txt", "1.txt", "2.txt"])
+
+    def test_list_inputs_manifest(self):
+        manifest = path.join(self.directory.name, "manifest.list")
+        with open(manifest, "w", encoding="utf-8") as file:
+            file.write("2.txt\n\n0.txt\n")
+        inputs = list_inputs(manifest)
+        self.assertEqual(inputs, [path.join(self.directory.name, n) for n in ["2.txt", "0.txt"]])
+
+    def test_solve_batch(self):
+        inputs = list_inputs(self.directory.name)
+        serial = list(solve_batch(2, inputs, workers=1))
+        parallel = list(solve_batch(2, inputs, workers=2, chunksize=1))
+        self.assertEqual([r["input"] for r in parallel], inputs)
+        self.assertEqual([r["answer"] for r in parallel], [r["answer"] for r in serial])
+        self.assertTrue(all(r["error"] is None for r in parallel))
+
+
+if __name__ == '__main__':
+    main(parse_args())
@@ -0,0 +1,241 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from math import log
+from os import path
+import argparse
+import contextlib
+import io
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import unittest
+
+from aoc.days import ROOT, discover_days, load_day
+from aoc.generate import generate_file
+from aoc.runner import collect_tasks
+
+DEFAULT_SCALES = [0.25, 0.5, 1, 2]
+SCALES = {
+    11: [0.1, 0.2, 0.4],
+    16: [0.25, 0.5, 1],
+    19: [0.05, 0.1],
+    23: [0.1, 0.2, 0.4],
+    24: [0.25, 1, 4],
+}
+TOLERANCE = 0.25
+EXPONENT_TOLERANCE = 0.3
+IMPORT_BUDGET = 0.5
+IMPORT_SCRIPT = """
+import importlib, json, sys, time
+seconds = {}
+for day in sys.argv[1:]:
+    begin = time.perf_counter()
+    importlib.import_module(f"day{day}.solver")
+    seconds[day] = time.perf_counter() - begin
+print(json.dumps(seconds))
+"""
+
+
+@dataclass
+class Point:
+    scale: float
+    size: int
+    seconds: float
+    max_rss: int
+    allocated: int = None
+
+
+@dataclass
+class Curve:
+    day: int
+    part: str
+    points: list[Point]
+    exponent: float = None
+
+    @property
+    def key(self):
+        return f"{self.day}/{self.part}"
+
+
+def measure(task, fname, scale, allocations):
+    """Runs in a fresh worker process, so max RSS belongs to this run only"""
+    function = getattr(load_day(task.day), task.function)
+    with contextlib.redirect_stdout(io.StringIO()):
+        begin = time.perf_counter()
+        function(fname, *task.args)
+        seconds = time.perf_counter() - begin
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        allocated = None
+        if allocations:
+            tracemalloc.start()
+            function(fname, *task.args)
+            allocated = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    return Point(scale, path.getsize(fname), seconds, max_rss, allocated)
+
+
+def fit_exponent(points):
+    """Least squares slope in log-log space: seconds ~ size ** exponent"""
+    if len(points) < 2:
+        return None
+    xs = [log(p.size) for p in points]
+    ys = [log(max(p.seconds, 1e-6)) for p in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    dispersion = sum((x - mean_x) ** 2 for x in xs)
+    if dispersion == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / dispersion
+
+
+def benchmark(days=None, scales=None, seed=0, allocations=True, workers=1):
+    days = discover_days() if not days else days
+    curves = []
+    with tempfile.TemporaryDirectory() as directory, \
+            ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as executor:
+        for day in days:
+            tasks = collect_tasks([day])
+            futures = {task: [] for task in tasks}
+            for scale in scales or SCALES.get(day, DEFAULT_SCALES):
+                fname = generate_file(path.join(directory, f"day{day}-{scale}.txt"), day, scale, seed)
+                for task in tasks:
+                    futures[task].append(executor.submit(measure, task, fname, scale, allocations))
+            for task, task_futures in futures.items():
+                points = [f.result() for f in task_futures]
+                curves.append(Curve(task.day, task.part, points, fit_exponent(points)))
+    return curves
+
+
+def to_json(curves):
+    return {c.key: asdict(c) for c in curves}
+
+
+def from_json(data):
+    return [Curve(c["day"], c["part"], [Point(**p) for p in c["points"]], c["exponent"]) for c in data.values()]
+
+
+def compare(baseline, curves, tolerance=TOLERANCE):
+    """Returns messages about points slower than baseline by more than tolerance and about grown exponents"""
+    by_key = {c.key: c for c in baseline}
+    regressions = []
+    for curve in curves:
+        base = by_key.get(curve.key)
+        if base is None:
+            continue
+        base_points = {p.scale: p for p in base.points}
+        for point in curve.points:
+            base_point = base_points.get(point.scale)
+            if base_point is not None and point.seconds > base_point.seconds * (1 + tolerance):
+                regressions.append(
+                    f"day {curve.key} scale {point.scale}: {base_point.seconds:.3f}s -> {point.seconds:.3f}s"
+                )
+        if curve.exponent is not None and base.exponent is not None \
+                and curve.exponent > base.exponent + EXPONENT_TOLERANCE:
+            regressions.append(f"day {curve.key} exponent: {base.exponent:.2f} -> {curve.exponent:.2f}")
+    return regressions
+
+
+def measure_imports(days=None):
+    """Imports the solvers one by one in a fresh interpreter, shared modules are paid by the first day using them"""
+    days = discover_days() if not days else days
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT, *map(str, days)], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return {int(day): seconds for day, seconds in json.loads(output).items()}
+
+
+def format_imports(seconds):
+    lines = [f"{'day':>4} {'seconds':>9}"]
+    lines += [f"{day:>4} {s:>9.4f}" for day, s in seconds.items()]
+    lines.append(f"total {sum(seconds.values()):.3f}s")
+    return "\n".join(lines)
+
+
+def format_table(curves):
+    lines = [f"{'day':>8} {'exponent':>8}  seconds by scale"]
+    for curve in curves:
+        exponent = "-" if curve.exponent is None else f"{curve.exponent:.2f}"
+        times = ", ".join(f"{p.scale}: {p.seconds:.3f}" for p in curve.points)
+        lines.append(f"{curve.key:>8} {exponent:>8}  {times}")
+    return "\n".join(lines)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Measures how solutions scale with the input size")
+    parser.add_argument("days", nargs="*", type=int)
+    parser.add_argument("--scales", type=float, nargs="+", help="input scales, per day defaults otherwise")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--no-allocations", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--save", help="write results to this json file")
+    parser.add_argument("--compare", help="baseline json file to compare with")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--imports", action="store_true", help="measure import time of the solvers instead")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET,
+                        help="seconds allowed for importing all solvers, exit code 1 above it")
+    return parser.parse_args()
+
+
+def main(args):
+    if args.imports:
+        seconds = measure_imports(args.days)
+        print(format_imports(seconds))
+        return 1 if sum(seconds.values()) > args.import_budget else 0
+    curves = benchmark(args.days, args.scales, args.seed, not args.no_allocations, args.workers)
+    print(format_table(curves))
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(to_json(curves), file, indent=2)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = from_json(json.load(file))
+        regressions = compare(baseline, curves, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+class TestBenchmark(unittest.TestCase):
+
+    @staticmethod
+    def _curve(seconds, exponent=None):
+        points = [Point(scale, int(scale * 1000), s, 0) for scale, s in zip([1, 2, 4], seconds)]
+        return Curve(18, "both", points, exponent)
+
+    def test_fit_exponent(self):
+        self.assertAlmostEqual(fit_exponent(self._curve([1, 2, 4]).points), 1)
+        self.assertAlmostEqual(fit_exponent(self._curve([1, 4, 16]).points), 2)
+        self.assertIsNone(fit_exponent(self._curve([1]).points))
+
+    def test_compare(self):
+        baseline = [self._curve([1, 2, 4], 1)]
+        self.assertEqual(compare(baseline, [self._curve([1.1, 2.1, 4.1], 1)]), [])
+        self.assertEqual(
+            compare(baseline, [self._curve([1, 2, 8], 1.5)]),
+            ["day 18/both scale 4: 4.000s -> 8.000s", "day 18/both exponent: 1.00 -> 1.50"]
+        )
+
+    def test_json_round_trip(self):
+        curves = [self._curve([1, 2, 4], 1)]
+        self.assertEqual(from_json(json.loads(json.dumps(to_json(curves)))), curves)
+
+    def test_import_budget(self):
+        seconds = measure_imports()
+        self.assertEqual(list(seconds), discover_days())
+        self.assertLess(sum(seconds.values()), IMPORT_BUDGET)
+
+    def test_benchmark(self):
+        curves = benchmark([2], [0.5, 1])
+        self.assertEqual(len(curves), 1)
+        self.assertEqual([p.scale for p in curves[0].points], [0.5, 1])
+        self.assertGreater(curves[0].points[1].size, curves[0].points[0].size)
+        self.assertGreater(curves[0].points[0].max_rss, 0)
+        self.assertGreater(curves[0].points[0].allocated, 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main(parse_args()))
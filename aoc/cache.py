@@ -0,0 +1,179 @@
+from os import path
+import ast
+import glob
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+from aoc.days import ROOT, get_input_path
+from aoc.inputs import STDIN
+
+DEFAULT_DIR = os.environ.get("AOC_CACHE_DIR", path.join(ROOT, ".cache"))
+MAX_BYTES = 64 * 1024 * 1024
+SUFFIX = ".pickle"
+
+
+def file_digest(fname):
+    with open(fname, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def shared_imports(fname):
+    """Files of the aoc modules imported by a python file"""
+    with open(fname, "rb") as file:
+        tree = ast.parse(file.read(), fname)
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules.add(node.module)
+    files = (path.join(ROOT, *module.split(".")) + ".py" for module in modules if module.startswith("aoc."))
+    return {fname for fname in files if path.exists(fname)}
+
+
+def code_files(day):
+    """Python files of the day and of the aoc modules its solver imports, directly or not"""
+    files = set(glob.glob(path.join(ROOT, f"day{day}", "*.py")))
+    pending = {path.join(ROOT, f"day{day}", "solver.py")}
+    while pending:
+        fname = pending.pop()
+        files.add(fname)
+        pending |= shared_imports(fname) - files
+    return sorted(files)
+
+
+def code_digest(day):
+    """Hash of the code of the day and of the shared modules it uses, so any change of them invalidates its results"""
+    digest = hashlib.sha256()
+    for fname in code_files(day):
+        digest.update(path.relpath(fname, ROOT).encode("utf-8"))
+        with open(fname, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def task_key(task, fname):
+    """None when the input can not be hashed in advance, a missing input is then reported by the task itself"""
+    if fname == STDIN:
+        return None
+    try:
+        input_digest = file_digest(get_input_path(task.day, fname))
+    except OSError:
+        return None
+    parts = [task.day, task.part, task.function, list(task.args), input_digest, code_digest(task.day)]
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Answers stored as one file per key. The least recently used files are removed above max_bytes.
+    Several processes can share the directory, an entry removed by another one is a miss or already evicted.
+    """
+
+    def __init__(self, directory=DEFAULT_DIR, max_bytes=MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return path.join(self.directory, key + SUFFIX)
+
+    def get(self, key):
+        """The cached answer or None"""
+        fname = self._path(key)
+        try:
+            with open(fname, "rb") as file:
+                value = pickle.load(file)
+            os.utime(fname)
+        except FileNotFoundError:
+            return None
+        return value
+
+    def put(self, key, value):
+        os.makedirs(self.directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=self.directory, delete=False) as file:
+            pickle.dump(value, file)
+        os.replace(file.name, self._path(key))
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for fname in glob.glob(path.join(self.directory, "*" + SUFFIX)):
+            try:
+                stat = os.stat(fname)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, fname))
+        total = sum(e[1] for e in entries)
+        for _, size, fname in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(fname)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+def fill_cache(directory, worker, count=50):
+    cache = ResultCache(directory, 2000)
+    for i in range(count):
+        cache.put(f"{worker}-{i}", "x" * 100)
+        cache.get(f"{(worker + 1) % 8}-{i}")
+    return count
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_put(self):
+        cache = ResultCache(self.directory.name)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", (1, "x"))
+        self.assertEqual(cache.get("a"), (1, "x"))
+
+    def test_evict_least_recently_used(self):
+        cache = ResultCache(self.directory.name)
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, "x" * 100)
+            os.utime(cache._path(key), ns=(i, i))  # pylint: disable=protected-access
+        cache.get("a")
+        cache.max_bytes = 2 * path.getsize(cache._path("a"))  # pylint: disable=protected-access
+        cache.evict()
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_task_key(self):
+        # pylint: disable=import-outside-toplevel
+        from aoc.days import get_tasks
+        day6_first, day6_second = get_tasks(6)
+        day1 = get_tasks(1)[0]
+        self.assertEqual(task_key(day1, "input-test.txt"), task_key(day1, "input-test.txt"))
+        self.assertNotEqual(task_key(day1, "input-test.txt"), task_key(day1, "input.txt"))
+        self.assertNotEqual(task_key(day6_first, "input.txt"), task_key(day6_second, "input.txt"))
+        self.assertIsNone(task_key(day1, STDIN))
+        self.assertIsNone(task_key(day6_first, "missing.txt"))
+
+    def test_shared_by_processes(self):
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(fill_cache, self.directory.name, i) for i in range(8)]
+            self.assertEqual([f.result() for f in futures], [50] * 8)
+
+    def test_code_files(self):
+        files = [path.relpath(fname, ROOT) for fname in code_files(8)]
+        self.assertIn(path.join("day8", "solver.py"), files)
+        self.assertIn(path.join("aoc", "grid.py"), files)
+        self.assertIn(path.join("aoc", "inputs.py"), files)
+        self.assertIn(path.join("aoc", "instrument.py"), files)
+        self.assertNotIn(path.join("aoc", "server.py"), files)
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+from os import path
+import importlib
+import os
+import re
+import unittest
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+DAY_DIR_PATTERN = re.compile(r"day([0-9]+)")
+BOTH = "both"
+
+
+@dataclass(frozen=True)
+class Task:
+    day: int
+    part: str
+    function: str
+    args: tuple = ()
+
+
+TASKS = {
+    6: [Task(6, "1", "solve_file", (4,)), Task(6, "2", "solve_file", (14,))],
+    9: [Task(9, "1", "score_file", (2,)), Task(9, "2", "score_file", (10,))],
+    15: [Task(15, BOTH, "solve_file", (2000000, 4000000))],
+    17: [Task(17, "1", "solve_file", (2022,)), Task(17, "2", "solve_file", (1000000000000,))],
+    19: [Task(19, "1", "solve_file_p1"), Task(19, "2", "solve_file_p2")],
+}
+
+ENTRY_POINTS = ["solve_file", "score_file"]
+
+
+def discover_days():
+    days = []
+    for name in os.listdir(ROOT):
+        match = DAY_DIR_PATTERN.fullmatch(name)
+        if match and path.isfile(path.join(ROOT, name, "solver.py")):
+            days.append(int(match.group(1)))
+    return sorted(days)
+
+
+def load_day_module(day, name):
+    return importlib.import_module(f"day{day}.{name}")
+
+
+def load_day(day):
+    """Imports dayN/solver.py, the tests and the script part stay in dayN/__main__.py"""
+    return load_day_module(day, "solver")
+
+
+def get_tasks(day):
+    if day in TASKS:
+        return TASKS[day]
+    module = load_day(day)
+    for function in ENTRY_POINTS:
+        if hasattr(module, function):
+            return [Task(day, BOTH, function)]
+    raise Exception(f"No entry point found for day {day}")
+
+
+def get_input_path(day, fname):
+    return path.join(ROOT, f"day{day}", fname)
+
+
+class TestDays(unittest.TestCase):
+
+    def test_discover_days(self):
+        days = discover_days()
+        self.assertEqual(days[:3], [1, 2, 3])
+        self.assertIn(25, days)
+
+    def test_load_day(self):
+        module = load_day(1)
+        self.assertEqual(module.__name__, "day1.solver")
+        self.assertEqual(module.solve_file("input-test.txt"), (24000, 45000))
+
+    def test_get_tasks(self):
+        self.assertEqual(get_tasks(2), [Task(2, BOTH, "score_file")])
+        self.assertEqual(get_tasks(10), [Task(10, BOTH, "solve_file")])
+        self.assertEqual([t.part for t in get_tasks(17)], ["1", "2"])
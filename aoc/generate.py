@@ -0,0 +1,75 @@
+import argparse
+import random
+import sys
+import tempfile
+import unittest
+
+from aoc.days import discover_days, load_day_module
+
+
+def generate_lines(day, scale=1, seed=0):
+    """Input lines for the day. Scale 1 gives roughly the size of the puzzle input."""
+    module = load_day_module(day, "generate")
+    return module.generate(scale, random.Random(seed))
+
+
+def write_input(file, day, scale=1, seed=0):
+    """Lines are separated, but not terminated by new line, as several days split the whole file by it"""
+    for i, line in enumerate(generate_lines(day, scale, seed)):
+        if i > 0:
+            file.write("\n")
+        file.write(line)
+
+
+def generate_file(fname, day, scale=1, seed=0):
+    with open(fname, "w", encoding="utf-8") as file:
+        write_input(file, day, scale, seed)
+    return fname
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generates a synthetic input for the day")
+    parser.add_argument("day", type=int)
+    parser.add_argument("--scale", type=float, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="output file, stdout by default")
+    return parser.parse_args()
+
+
+class TestGenerate(unittest.TestCase):
+    """Generated inputs must be solvable. Slow days are checked on small scale only."""
+    SCALES = {11: 0.2, 15: 0.3, 16: 0.2, 19: 0.1, 23: 0.1, 24: 0.2}
+    SKIP = {19}
+
+    def test_deterministic(self):
+        for day in discover_days():
+            self.assertEqual(
+                list(generate_lines(day, 0.1, 7)),
+                list(generate_lines(day, 0.1, 7)),
+                f"day {day}"
+            )
+
+    def test_scale(self):
+        small = sum(len(line) for line in generate_lines(2, 1))
+        large = sum(len(line) for line in generate_lines(2, 10))
+        self.assertEqual(large, small * 10)
+
+    def test_solvable(self):
+        # pylint: disable=import-outside-toplevel
+        from aoc.runner import collect_tasks, run_task
+        days = [day for day in discover_days() if day not in self.SKIP]
+        with tempfile.TemporaryDirectory() as directory:
+            for day in days:
+                fname = generate_file(f"{directory}/day{day}.txt", day, self.SCALES.get(day, 0.3), day)
+                for task in collect_tasks([day]):
+                    result = run_task(task, fname)
+                    self.assertIsNone(result.error, f"day {day}, part {task.part}")
+                    self.assertIsNotNone(result.answer, f"day {day}, part {task.part}")
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.output:
+        generate_file(args.output, args.day, args.scale, args.seed)
+    else:
+        write_input(sys.stdout, args.day, args.scale, args.seed)
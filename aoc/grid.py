@@ -0,0 +1,85 @@
+from aoc.inputs import optional_numpy
+
+np = optional_numpy()
+
+OFFSETS_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+OFFSETS_8 = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def shift(array, d_row, d_col, fill=0):
+    """result[r, c] = array[r + d_row, c + d_col], fill outside of the array"""
+    result = np.full_like(array, fill)
+    rows, cols = array.shape
+    dst_rows = slice(max(0, -d_row), min(rows, rows - d_row))
+    dst_cols = slice(max(0, -d_col), min(cols, cols - d_col))
+    src_rows = slice(max(0, d_row), min(rows, rows + d_row))
+    src_cols = slice(max(0, d_col), min(cols, cols + d_col))
+    result[dst_rows, dst_cols] = array[src_rows, src_cols]
+    return result
+
+
+class Grid:
+    """Compact 2D grid over a contiguous uint8 ndarray. Coordinates are [row, col]."""
+
+    def __init__(self, data):
+        self.data = np.ascontiguousarray(data)
+
+    @staticmethod
+    def parse(lines, mapping=None, fill=" "):
+        """
+        Lines are str or bytes, shorter lines are padded with fill.
+        mapping translates chars to cell values, cells keep char codes without it.
+        """
+        lines = [line.encode() if isinstance(line, str) else bytes(line) for line in lines]
+        width = max((len(line) for line in lines), default=0)
+        raw = b"".join(line.ljust(width, fill.encode()) for line in lines)
+        data = np.frombuffer(raw, dtype=np.uint8).reshape(len(lines), width)
+        if mapping is not None:
+            table = np.zeros(256, dtype=np.uint8)
+            for char, value in mapping.items():
+                table[ord(char)] = value
+            data = table[data]
+        return Grid(data.copy())
+
+    @staticmethod
+    def digits(lines):
+        return Grid.parse(lines, {str(d): d for d in range(10)})
+
+    @property
+    def rows(self):
+        return self.data.shape[0]
+
+    @property
+    def cols(self):
+        return self.data.shape[1]
+
+    def __getitem__(self, pos):
+        return self.data[pos]
+
+    def __setitem__(self, pos, value):
+        self.data[pos] = value
+
+    def __eq__(self, other):
+        return isinstance(other, Grid) and np.array_equal(self.data, other.data)
+
+    def in_bounds(self, pos):
+        return 0 <= pos[0] < self.rows and 0 <= pos[1] < self.cols
+
+    def neighbours(self, pos, offsets=OFFSETS_4):
+        for d_row, d_col in offsets:
+            candidate = (pos[0] + d_row, pos[1] + d_col)
+            if self.in_bounds(candidate):
+                yield candidate
+
+    def shifted(self, d_row, d_col, fill=0):
+        return shift(self.data, d_row, d_col, fill)
+
+    def mask(self, value):
+        return self.data == value
+
+    def index(self, pos):
+        """Integer node id of the cell, row-major"""
+        return pos[0] * self.cols + pos[1]
+
+    def position(self, index):
+        return divmod(index, self.cols)
@@ -0,0 +1,145 @@
+from contextlib import contextmanager
+from os import path
+import bz2
+import gzip
+import lzma
+import mmap
+import re
+import sys
+
+STDIN = "-"
+OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+UNSIGNED = re.compile(rb"[0-9]+")
+SIGNED = re.compile(rb"-?[0-9]+")
+NEWLINE = re.compile(rb"\n")
+
+
+def optional_numpy():
+    """
+    numpy, or None when it is not installed. Called at import by the modules with array based paths only, so the
+    other solvers do not pay for importing it.
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return numpy
+
+
+def resolve(base_file, fname):
+    """Relative names are resolved against the directory of base_file, '-' stays stdin"""
+    if fname == STDIN:
+        return fname
+    return path.join(path.dirname(base_file), fname)
+
+
+def is_mappable(fname):
+    return fname != STDIN and path.splitext(fname)[1] not in OPENERS
+
+
+@contextmanager
+def open_stream(fname):
+    """Binary stream of the input, decompressed by file extension"""
+    if fname == STDIN:
+        yield sys.stdin.buffer
+        return
+    opener = OPENERS.get(path.splitext(fname)[1], open)
+    with opener(fname, "rb") as file:
+        yield file
+
+
+@contextmanager
+def open_buffer(fname):
+    """The whole input as bytes-like object. Plain files are memory mapped instead of being read."""
+    if not is_mappable(fname):
+        with open_stream(fname) as file:
+            yield file.read()
+        return
+    with open(fname, "rb") as file:
+        if path.getsize(fname) == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def split_lines(buffer):
+    begin, size = 0, len(buffer)
+    while begin < size:
+        end = buffer.find(b"\n", begin)
+        if end < 0:
+            end = size
+        line_end = end - 1 if end > begin and buffer[end - 1] == 13 else end
+        yield buffer[begin:line_end]
+        begin = end + 1
+
+
+def iter_chunks(buffer, size, boundary=NEWLINE, lines_per_record=1):
+    """
+    (begin, end) offsets of chunks of about size bytes, found one at a time. Every chunk ends right after a match of
+    boundary (or at the end) and holds whole records of lines_per_record lines.
+    """
+    begin = 0
+    while begin < len(buffer):
+        match = boundary.search(buffer, begin + max(1, size) - 1)
+        end = match.end() if match else len(buffer)
+        for _ in range(-buffer[begin:end].count(b"\n") % lines_per_record if end < len(buffer) else 0):
+            end = buffer.find(b"\n", end) + 1 or len(buffer)
+        yield begin, end
+        begin = end
+
+
+def iter_lines(fname):
+    """
+    Lines as bytes without line terminators. The final line terminator does not give an empty line.
+    Memory is bounded by the longest line, so files of any size can be streamed.
+    The file stays open until the lines are exhausted or the generator is closed; callers stopping early should
+    close it (or wrap it in contextlib.closing) instead of relying on garbage collection.
+    """
+    # Closing the generator raises GeneratorExit at the yield, which exits the contexts below.
+    # pylint: disable=contextmanager-generator-missing-cleanup
+    if is_mappable(fname):
+        with open_buffer(fname) as buffer:
+            yield from split_lines(buffer)
+    else:
+        with open_stream(fname) as file:
+            for line in file:
+                yield line.rstrip(b"\r\n")
+
+
+def as_lines(lines):
+    """Bytes lines without terminators from any iterable of str or bytes lines, e.g. a list or sys.stdin"""
+    for line in lines:
+        if isinstance(line, str):
+            line = line.encode("utf-8")
+        yield line.rstrip(b"\r\n")
+
+
+def iter_blocks(fname):
+    """Lists of lines separated by blank lines"""
+    block = []
+    for line in iter_lines(fname):
+        if line.strip():
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def ints_of_lines(lines, signed=False):
+    """Tuple of all integers of every bytes line"""
+    pattern = SIGNED if signed else UNSIGNED
+    for line in lines:
+        yield tuple(map(int, pattern.findall(line)))
+
+
+def iter_ints(fname, signed=False):
+    """Tuple of all integers of every line, parsed straight from bytes"""
+    return ints_of_lines(iter_lines(fname), signed)
+
+
+def read_text(fname):
+    with open_buffer(fname) as buffer:
+        return bytes(buffer).decode("utf-8")
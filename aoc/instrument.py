@@ -0,0 +1,158 @@
+"""
+Opt-in instrumentation of hot functions. Set AOC_INSTRUMENT=time (or memory, to also trace allocations)
+before the days are imported; otherwise the decorator returns functions untouched.
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import wraps
+import cProfile
+import inspect
+import os
+import sys
+import time
+import tracemalloc
+
+ENV = "AOC_INSTRUMENT"
+MEMORY = "memory"
+MODE = os.environ.get(ENV, "")
+ENABLED = MODE != ""
+
+
+@dataclass
+class Stat:
+    calls: int = 0
+    seconds: float = 0.0
+    allocated: int = 0
+
+
+STATS = defaultdict(Stat)
+_active = defaultdict(int)
+
+
+def enable(mode="time"):
+    """Must be called before the days are imported. Worker processes inherit the mode by the environment."""
+    global MODE, ENABLED  # pylint: disable=global-statement
+    MODE, ENABLED = mode, True
+    os.environ[ENV] = mode
+
+
+def reset():
+    STATS.clear()
+    if MODE == MEMORY and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def snapshot():
+    return {name: asdict(stat) for name, stat in sorted(STATS.items(), key=lambda i: -i[1].seconds)}
+
+
+@contextmanager
+def section(name, count=True):
+    """Counts the block under the name. Recursive entries add calls, but not time."""
+    stat = STATS[name]
+    stat.calls += count
+    if _active[name]:
+        yield
+        return
+    _active[name] += 1
+    tracing = tracemalloc.is_tracing()
+    memory_before = tracemalloc.get_traced_memory()[0] if tracing else 0
+    begin = time.perf_counter()
+    try:
+        yield
+    finally:
+        stat.seconds += time.perf_counter() - begin
+        if tracing:
+            stat.allocated += max(0, tracemalloc.get_traced_memory()[0] - memory_before)
+        _active[name] -= 1
+
+
+def instrumented(function):
+    """Generator functions are timed while they produce their items, one call per generator"""
+    name = f"{function.__module__}.{function.__qualname__}"
+
+    if inspect.isgeneratorfunction(function):
+        @wraps(function)
+        def generator_wrapper(*args, **kwargs):
+            STATS[name].calls += 1
+            generator = function(*args, **kwargs)
+            try:
+                while True:
+                    with section(name, count=False):
+                        try:
+                            item = next(generator)
+                        except StopIteration as stop:
+                            return stop.value
+                    yield item
+            finally:
+                generator.close()
+
+        return generator_wrapper
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with section(name):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+def hot(function):
+    """Marks a function worth measuring. Free when instrumentation is disabled."""
+    return instrumented(function) if ENABLED else function
+
+
+class FoldedStacks:
+    """Self time by call stack in the folded format of flamegraph.pl"""
+
+    def __init__(self):
+        self.stack = ()
+        self.totals = defaultdict(float)
+        self._last = 0
+
+    def _callback(self, frame, event, arg):
+        now = time.perf_counter()
+        if self.stack:
+            self.totals[self.stack] += now - self._last
+        if event == "call":
+            self.stack = self.stack + (f"{frame.f_globals.get('__name__')}:{frame.f_code.co_qualname}",)
+        elif event == "c_call":
+            self.stack = self.stack + (getattr(arg, "__qualname__", str(arg)),)
+        elif self.stack:
+            self.stack = self.stack[:-1]
+        self._last = time.perf_counter()
+
+    def run(self, function, *args):
+        self._last = time.perf_counter()
+        sys.setprofile(self._callback)
+        try:
+            return function(*args)
+        finally:
+            sys.setprofile(None)
+
+    def lines(self):
+        return [f"{';'.join(stack)} {round(seconds * 1000000)}" for stack, seconds in self.totals.items()]
+
+
+def profile_call(function, *args, stats_file=None, folded_file=None):
+    """Runs under cProfile and/or the folded stacks collector. Each of them needs its own run."""
+    result = None
+    if stats_file:
+        profiler = cProfile.Profile()
+        result = profiler.runcall(function, *args)
+        profiler.dump_stats(stats_file)
+    if folded_file:
+        folded = FoldedStacks()
+        result = folded.run(function, *args)
+        with open(folded_file, "w", encoding="utf-8") as file:
+            file.write("\n".join(folded.lines()))
+    return result
+
+
+def format_stats(stats, limit=10):
+    lines = []
+    for name, stat in list(stats.items())[:limit]:
+        allocated = f" {stat['allocated']:>12} B" if stat["allocated"] else ""
+        lines.append(f"    {stat['seconds']:>9.3f}s {stat['calls']:>10} calls{allocated}  {name}")
+    return "\n".join(lines)
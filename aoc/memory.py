@@ -0,0 +1,139 @@
+"""
+Peak memory reporting and a memory ceiling for solver runs.
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from os import path
+import resource
+import threading
+import traceback
+import tracemalloc
+
+from aoc.days import ROOT
+
+MB = 1024 * 1024
+TOP = 5
+GROWTH = 1.5
+INTERVAL = 0.01
+IGNORED = [
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+]
+
+
+@dataclass
+class Site:
+    location: str
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryReport:
+    peak_traced: int
+    peak_rss: int
+    top: list[Site] = field(default_factory=list)
+
+
+class MemoryCeilingExceeded(Exception):
+    pass
+
+
+def peak_rss():
+    """Max resident set size of this process so far, in bytes"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def address_space():
+    with open("/proc/self/statm", "r", encoding="utf-8") as file:
+        return int(file.read().split()[0]) * resource.getpagesize()
+
+
+def top_sites(snapshot, limit=TOP):
+    stats = snapshot.filter_traces(IGNORED).statistics("lineno")[:limit]
+    return [Site(f"{relative(s.traceback[0].filename)}:{s.traceback[0].lineno}", s.size, s.count) for s in stats]
+
+
+def relative(filename):
+    return path.relpath(filename, ROOT) if filename.startswith(ROOT) else filename
+
+
+class PeakSampler(threading.Thread):
+    """Takes a snapshot each time traced memory grows by GROWTH, so the last one shows the sites near the peak"""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.stopped = threading.Event()
+        self.snapshot = None
+        self.threshold = 0
+
+    def run(self):
+        while not self.stopped.wait(INTERVAL):
+            self.sample()
+
+    def sample(self):
+        current = tracemalloc.get_traced_memory()[0]
+        if current > self.threshold:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.threshold = current * GROWTH
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def measure(function, *args, limit=TOP):
+    """Runs the function under tracemalloc, returns its result and a MemoryReport"""
+    tracemalloc.start()
+    sampler = PeakSampler()
+    sampler.start()
+    try:
+        result = function(*args)
+    finally:
+        sampler.stop()
+        sampler.sample()
+        peak = tracemalloc.get_traced_memory()[1]
+        snapshot = sampler.snapshot
+        tracemalloc.stop()
+    top = top_sites(snapshot, limit) if snapshot is not None else []
+    return result, MemoryReport(peak, peak_rss(), top)
+
+
+def failure_site(error):
+    """Innermost frame of the puzzle code where the allocation failed"""
+    frames = [f for f in traceback.extract_tb(error.__traceback__) if f.filename.startswith(ROOT)]
+    if not frames:
+        return "unknown location"
+    frame = frames[-1]
+    return f"{relative(frame.filename)}:{frame.lineno} in {frame.name}"
+
+
+@contextmanager
+def ceiling(limit):
+    """Lets the process grow by at most limit bytes of address space, MemoryError becomes a diagnostic"""
+    if limit is None:
+        yield
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    wanted = address_space() + limit
+    resource.setrlimit(resource.RLIMIT_AS, (wanted if hard == resource.RLIM_INFINITY else min(wanted, hard), hard))
+    try:
+        yield
+    except MemoryError as e:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+        traced = f", peak traced {tracemalloc.get_traced_memory()[1] / MB:.1f} MB" if tracemalloc.is_tracing() else ""
+        raise MemoryCeilingExceeded(
+            f"grew past the ceiling of {limit / MB:.1f} MB at {failure_site(e)}"
+            f" (peak RSS {peak_rss() / MB:.1f} MB{traced})"
+        ) from e
+    finally:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def format_report(report):
+    lines = [f"    peak traced {report.peak_traced / MB:.1f} MB, peak RSS {report.peak_rss / MB:.1f} MB"]
+    for site in report.top:
+        lines.append(f"    {site.size / MB:>9.2f} MB {site.count:>10} blocks  {site.location}")
+    return "\n".join(lines)
@@ -0,0 +1,186 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+from aoc import instrument, memory
+from aoc.cache import ResultCache, task_key
+from aoc.days import discover_days, get_input_path, get_tasks, load_day
+from aoc.inputs import STDIN
+from aoc.memory import MemoryReport
+
+
+@dataclass
+class Result:
+    day: int
+    part: str
+    answer: object
+    seconds: float
+    error: str = None
+    cached: bool = False
+    stats: dict = None
+    memory: MemoryReport = None
+
+
+def call_task(function, task, fname, profile_dir):
+    if not profile_dir:
+        return function(fname, *task.args)
+    prefix = f"{profile_dir}/day{task.day}-{task.part}"
+    return instrument.profile_call(
+        function, fname, *task.args, stats_file=f"{prefix}.pstats", folded_file=f"{prefix}.folded"
+    )
+
+
+def run_task(task, fname, cache=None, profile_dir=None, trace_memory=False, memory_limit=None):
+    begin = time.perf_counter()
+    key = task_key(task, fname) if cache is not None else None
+    if key is not None:
+        answer = cache.get(key)
+        if answer is not None:
+            return Result(task.day, task.part, answer, time.perf_counter() - begin, cached=True)
+
+    module = load_day(task.day)
+    function = getattr(module, task.function)
+    if instrument.ENABLED:
+        instrument.reset()
+    report = None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), memory.ceiling(memory_limit):
+            if trace_memory:
+                answer, report = memory.measure(call_task, function, task, fname, profile_dir)
+            else:
+                answer = call_task(function, task, fname, profile_dir)
+        error = None
+    except Exception as e:  # pylint: disable=broad-except
+        answer = None
+        error = f"{type(e).__name__}: {e}"
+    if key is not None and error is None:
+        cache.put(key, answer)
+    stats = instrument.snapshot() if instrument.ENABLED else None
+    return Result(task.day, task.part, answer, time.perf_counter() - begin, error, stats=stats, memory=report)
+
+
+def collect_tasks(days=None):
+    days = discover_days() if not days else days
+    return [task for day in days for task in get_tasks(day)]
+
+
+def run_tasks(tasks, fname, workers=None, cache=None, profile_dir=None, trace_memory=False, memory_limit=None):
+    """
+    Runs every task in its own worker process. workers=1 runs them one by one in this process.
+    Tracing memory uses a fresh process per task, so the peak RSS belongs to that task.
+    """
+    options = (cache, profile_dir, trace_memory, memory_limit)
+    if workers == 1:
+        return [run_task(task, fname, *options) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1 if trace_memory else None) as executor:
+        futures = [executor.submit(run_task, task, fname, *options) for task in tasks]
+        return [future.result() for future in futures]
+
+
+def format_table(results, total):
+    lines = [f"{'day':>4} {'part':>5} {'seconds':>9}  answer"]
+    for r in results:
+        answer = r.answer if r.error is None else f"ERROR {r.error}"
+        cached = " (cached)" if r.cached else ""
+        lines.append(f"{r.day:>4} {r.part:>5} {r.seconds:>9.3f}  {answer}{cached}")
+        if r.stats:
+            lines.append(instrument.format_stats(r.stats))
+        if r.memory:
+            lines.append(memory.format_report(r.memory))
+    lines.append(f"total wall time {total:.3f}s, sum of tasks {sum(r.seconds for r in results):.3f}s")
+    return "\n".join(lines)
+
+
+def format_json(results, total):
+    return json.dumps({"total": total, "results": [asdict(r) for r in results]}, default=str)
+
+
+@contextlib.contextmanager
+def readable_by_every_task(fname):
+    """Standard input can be read only once and not at all by pool workers, so it is copied to a temporary file"""
+    if fname != STDIN:
+        yield fname
+        return
+    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as file:
+        shutil.copyfileobj(sys.stdin.buffer, file)
+    try:
+        yield file.name
+    finally:
+        os.remove(file.name)
+
+
+def run(days=None, fname="input.txt", workers=None, output="table", cache=None, profile_dir=None,
+        trace_memory=False, memory_limit=None):
+    tasks = collect_tasks(days)
+    begin = time.perf_counter()
+    with readable_by_every_task(fname) as readable:
+        results = run_tasks(tasks, readable, workers, cache, profile_dir, trace_memory, memory_limit)
+    total = time.perf_counter() - begin
+    if output == "json":
+        return format_json(results, total)
+    return format_table(results, total)
+
+
+class TestRunner(unittest.TestCase):
+
+    def test_run_task(self):
+        result = run_task(get_tasks(1)[0], "input-test.txt")
+        self.assertEqual(result.answer, (24000, 45000))
+        self.assertIsNone(result.error)
+
+    def test_run_task_error(self):
+        result = run_task(get_tasks(1)[0], "missing.txt")
+        self.assertIsNone(result.answer)
+        self.assertTrue(result.error.startswith("FileNotFoundError"))
+
+    def test_run_tasks_in_pool(self):
+        results = run_tasks(collect_tasks([1, 2, 9]), "input-test.txt", workers=2)
+        self.assertEqual(
+            [(r.day, r.part, r.answer) for r in results],
+            [(1, "both", (24000, 45000)), (2, "both", (15, 12)), (9, "1", 13), (9, "2", 1)]
+        )
+
+    def test_run_stdin(self):
+        from unittest import mock  # pylint: disable=import-outside-toplevel
+        with open(get_input_path(9, "input-test.txt"), "rb") as file:
+            data = file.read()
+        for workers in [1, 2]:
+            with mock.patch("sys.stdin", io.TextIOWrapper(io.BytesIO(data))):
+                output = json.loads(run([9], STDIN, workers, output="json"))
+            self.assertEqual([r["answer"] for r in output["results"]], [13, 1])
+
+    def test_run_task_cached(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory)
+            task = get_tasks(1)[0]
+            first = run_task(task, "input-test.txt", cache)
+            second = run_task(task, "input-test.txt", cache)
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertEqual(second.answer, first.answer)
+
+    def test_run_task_profile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            result = run_task(get_tasks(1)[0], "input-test.txt", profile_dir=directory)
+            with open(f"{directory}/day1-both.folded", "r", encoding="utf-8") as file:
+                folded = file.read()
+        self.assertEqual(result.answer, (24000, 45000))
+        self.assertIn("day1.solver:solve_file;day1.solver:solve", folded)
+
+    def test_run_task_memory(self):
+        result = run_task(get_tasks(1)[0], "input-test.txt", trace_memory=True, memory_limit=64 * memory.MB)
+        self.assertEqual(result.answer, (24000, 45000))
+        self.assertGreater(result.memory.peak_traced, 0)
+        self.assertTrue(any(site.location.startswith("day1") for site in result.memory.top))
+
+    def test_format_json(self):
+        parsed = json.loads(format_json([Result(2, "both", (15, 12), 0.5)], 1.0))
+        self.assertEqual(parsed["results"][0]["answer"], [15, 12])
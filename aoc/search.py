@@ -0,0 +1,92 @@
+from collections import deque
+from dataclasses import dataclass
+import heapq
+
+INF = float("+inf")
+
+
+@dataclass
+class SearchResult:
+    """Distances are indexed by node id, unreached nodes keep INF. Target is the first reached target or None."""
+    distances: list
+    target: int = None
+
+    @property
+    def target_distance(self):
+        return INF if self.target is None else self.distances[self.target]
+
+
+def bfs(count, sources, neighbours, targets=None):
+    """Unit weight search from the nearest source. neighbours(node) gives node ids."""
+    distances = [INF] * count
+    queue = deque()
+    for source in sources:
+        distances[source] = 0
+        queue.append(source)
+    while queue:
+        node = queue.popleft()
+        if targets is not None and node in targets:
+            return SearchResult(distances, node)
+        next_distance = distances[node] + 1
+        for other in neighbours(node):
+            if distances[other] == INF:
+                distances[other] = next_distance
+                queue.append(other)
+    return SearchResult(distances)
+
+
+def astar(count, sources, neighbours, targets=None, heuristic=None):
+    """
+    Binary heap search, neighbours(node) gives (node, weight) pairs. Without heuristic it is Dijkstra,
+    heuristic(node) must not overestimate the distance to the nearest target. Nodes reached again by a shorter path
+    are expanded again, so the heuristic does not have to be consistent.
+    """
+    distances = [INF] * count
+    heap = []
+    for source in sources:
+        distances[source] = 0
+        heapq.heappush(heap, (heuristic(source) if heuristic else 0, source, 0))
+    while heap:
+        _, node, distance = heapq.heappop(heap)
+        if distance > distances[node]:
+            continue
+        if targets is not None and node in targets:
+            return SearchResult(distances, node)
+        for other, weight in neighbours(node):
+            new_distance = distance + weight
+            if new_distance < distances[other]:
+                distances[other] = new_distance
+                estimate = new_distance + heuristic(other) if heuristic else new_distance
+                heapq.heappush(heap, (estimate, other, new_distance))
+    return SearchResult(distances)
+
+
+def dijkstra(count, sources, neighbours, targets=None):
+    return astar(count, sources, neighbours, targets)
+
+
+def time_expanded_bfs(count, period, sources, targets, moves, start_time=0):
+    """
+    Layered search over (node, time) states of a graph that changes with the given period.
+    moves(node, time) gives nodes available at time + 1, the node itself when waiting is allowed.
+    Returns the number of steps to the first target or None when no target can be reached.
+    """
+    seen = bytearray(count * period)
+    frontier = set(sources)
+    for node in frontier:
+        seen[node * period + start_time % period] = 1
+    time = start_time
+    while frontier:
+        if not frontier.isdisjoint(targets):
+            return time - start_time
+        next_phase = (time + 1) % period
+        next_frontier = set()
+        for node in frontier:
+            for other in moves(node, time):
+                state = other * period + next_phase
+                if not seen[state]:
+                    seen[state] = 1
+                    next_frontier.add(other)
+        frontier = next_frontier
+        time += 1
+    return None
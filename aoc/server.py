@@ -0,0 +1,279 @@
+from collections import defaultdict, deque
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import queue
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+
+from aoc.days import discover_days, get_input_path, get_tasks, load_day
+from aoc.runner import run_task
+
+DEFAULT_TIMEOUT = 30.0
+TIMEOUTS = {16: 120.0, 19: 600.0}
+QUEUE_TIMEOUT = 60.0
+LATENCY_WINDOW = 1000
+
+
+def solve_text(tasks, text):
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", encoding="utf-8", delete=False) as file:
+        file.write(text)
+    try:
+        return [asdict(run_task(task, file.name)) for task in tasks]
+    finally:
+        os.remove(file.name)
+
+
+def serve_worker(connection, days):
+    for day in days:
+        load_day(day)
+    connection.send("ready")
+    while True:
+        message = connection.recv()
+        if message is None:
+            return
+        connection.send(solve_text(*message))
+
+
+class Worker:
+    """Worker process with every day already imported, talking over a pipe"""
+
+    def __init__(self, days):
+        context = multiprocessing.get_context("spawn")
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=serve_worker, args=(child, days), daemon=True)
+        self.process.start()
+        child.close()
+        self.connection.recv()
+
+    def solve(self, tasks, text, timeout):
+        """
+        Returns None when the worker did not answer in time, the worker is killed then. A worker that died raises
+        EOFError or OSError.
+        """
+        self.connection.send((tasks, text))
+        if not self.connection.poll(timeout):
+            self.kill()
+            return None
+        return self.connection.recv()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def stop(self):
+        self.connection.send(None)
+        self.process.join()
+        self.connection.close()
+
+
+class WorkerPool:
+    """Fixed number of warm workers, requests wait in a queue for an idle one"""
+
+    def __init__(self, workers=None, days=None, timeouts=None, default_timeout=DEFAULT_TIMEOUT):
+        self.days = discover_days() if not days else days
+        self.timeouts = TIMEOUTS if timeouts is None else timeouts
+        self.default_timeout = default_timeout
+        self.idle = queue.Queue()
+        for _ in range(workers or os.cpu_count()):
+            self.idle.put(Worker(self.days))
+        self.latencies = defaultdict(lambda: deque(maxlen=LATENCY_WINDOW))
+        self.counters = defaultdict(lambda: defaultdict(int))
+        self.lock = threading.Lock()
+
+    def solve(self, day, text, part=None, queue_timeout=QUEUE_TIMEOUT):
+        """Returns the status and the results of all (or one) parts of the day"""
+        if day not in self.days:
+            return "not_found", None
+        tasks = [task for task in get_tasks(day) if part is None or task.part == part]
+        if not tasks:
+            return "not_found", None
+        begin = time.perf_counter()
+        try:
+            worker = self.idle.get(timeout=queue_timeout)
+        except queue.Empty:
+            return self.record(day, "busy", begin), None
+        try:
+            results = worker.solve(tasks, text, self.timeouts.get(day, self.default_timeout))
+            status = "timeout" if results is None else "ok"
+        except (EOFError, OSError):
+            worker.kill()
+            results, status = None, "error"
+        if results is None:
+            worker = Worker(self.days)
+        self.idle.put(worker)
+        return self.record(day, status, begin), results
+
+    def record(self, day, status, begin):
+        with self.lock:
+            self.latencies[day].append(time.perf_counter() - begin)
+            self.counters[day][status] += 1
+        return status
+
+    def metrics(self):
+        with self.lock:
+            return {
+                day: dict(
+                    self.counters[day],
+                    p50=percentile(latencies, 0.5),
+                    p99=percentile(latencies, 0.99),
+                )
+                for day, latencies in sorted(self.latencies.items())
+            }
+
+    def close(self):
+        for _ in range(self.idle.qsize()):
+            self.idle.get().stop()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+STATUS_CODES = {"ok": 200, "not_found": 404, "error": 500, "busy": 503, "timeout": 504}
+
+
+class SolveHandler(BaseHTTPRequestHandler):
+    """POST /solve?day=N[&part=P] with the puzzle input as body, GET /metrics"""
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path != "/solve" or "day" not in query:
+            self.reply(404, {"error": "expected POST /solve?day=N"})
+            return
+        text = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8")
+        if not query["day"][0].isdigit():
+            self.reply(400, {"error": "day must be a number"})
+            return
+        part = query.get("part", [None])[0]
+        status, results = self.server.pool.solve(int(query["day"][0]), text, part)
+        self.reply(STATUS_CODES[status], {"status": status, "results": results})
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        if urlparse(self.path).path != "/metrics":
+            self.reply(404, {"error": "expected GET /metrics"})
+            return
+        self.reply(200, self.server.pool.metrics())
+
+    def reply(self, code, body):
+        data = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+def make_server(pool, host="127.0.0.1", port=8022):
+    server = ThreadingHTTPServer((host, port), SolveHandler)
+    server.pool = pool
+    return server
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Serves solutions over HTTP from a pool of warm workers")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8022)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, cpu count by default")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="seconds per request for days without their own timeout")
+    return parser.parse_args()
+
+
+def main(args):
+    pool = WorkerPool(args.workers, default_timeout=args.timeout)
+    server = make_server(pool, args.host, args.port)
+    print(f"serving on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.close()
+
+
+class TestServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = WorkerPool(workers=1, days=[1, 2], timeouts={2: 0.01})
+        cls.server = make_server(cls.pool, port=0)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        with open(get_input_path(1, "input-test.txt"), "r", encoding="utf-8") as file:
+            cls.text = file.read()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.pool.close()
+
+    def request(self, path, data=None):
+        try:
+            with urllib.request.urlopen(self.url + path, data) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_solve(self):
+        code, body = self.request("/solve?day=1", self.text.encode("utf-8"))
+        self.assertEqual(code, 200)
+        self.assertEqual(body["results"][0]["answer"], [24000, 45000])
+
+    def test_timeout_restarts_worker(self):
+        code, body = self.request("/solve?day=2", b"A Y\n" * 500000)
+        self.assertEqual((code, body["status"]), (504, "timeout"))
+        code, _ = self.request("/solve?day=1", self.text.encode("utf-8"))
+        self.assertEqual(code, 200)
+
+    def test_worker_died(self):
+        worker = self.pool.idle.queue[0]
+        worker.process.kill()
+        worker.process.join()
+        code, body = self.request("/solve?day=1", self.text.encode("utf-8"))
+        self.assertEqual((code, body["status"]), (500, "error"))
+        code, _ = self.request("/solve?day=1", self.text.encode("utf-8"))
+        self.assertEqual(code, 200)
+
+    def test_unknown_day(self):
+        self.assertEqual(self.request("/solve?day=99", b"")[0], 404)
+        self.assertEqual(self.request("/solve?day=x", b"")[0], 400)
+
+    def test_unknown_part(self):
+        code, _ = self.request("/solve?day=1&part=3", b"")
+        self.assertEqual(code, 404)
+
+    def test_metrics(self):
+        self.request("/solve?day=1", self.text.encode("utf-8"))
+        code, body = self.request("/metrics")
+        self.assertEqual(code, 200)
+        self.assertGreaterEqual(body["1"]["ok"], 1)
+        self.assertLessEqual(body["1"]["p50"], body["1"]["p99"])
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([3], 0.99), 3)
+
+
+if __name__ == '__main__':
+    main(parse_args())
@@ -0,0 +1,35 @@
+import unittest
+
+from aoc.grid import Grid, OFFSETS_8, np
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestGrid(unittest.TestCase):
+    LINES = ["30373", "25512", "65332"]
+
+    def test_digits(self):
+        grid = Grid.digits(self.LINES)
+        self.assertEqual((grid.rows, grid.cols), (3, 5))
+        self.assertEqual(grid.data.dtype, np.uint8)
+        self.assertEqual(grid[1, 2], 5)
+        self.assertEqual(grid.data.tolist()[2], [6, 5, 3, 3, 2])
+
+    def test_parse_ragged(self):
+        grid = Grid.parse([b"#.", "#"], {"#": 1})
+        self.assertEqual(grid.data.tolist(), [[1, 0], [1, 0]])
+
+    def test_neighbours(self):
+        grid = Grid.digits(self.LINES)
+        self.assertEqual(list(grid.neighbours((0, 0))), [(1, 0), (0, 1)])
+        self.assertEqual(len(list(grid.neighbours((1, 1), OFFSETS_8))), 8)
+
+    def test_shifted(self):
+        grid = Grid.digits(["12", "34"])
+        self.assertEqual(grid.shifted(0, 1).tolist(), [[2, 0], [4, 0]])
+        self.assertEqual(grid.shifted(-1, 0, 9).tolist(), [[9, 9], [1, 2]])
+        self.assertEqual(grid.shifted(1, -1).tolist(), [[0, 3], [0, 0]])
+
+    def test_index(self):
+        grid = Grid.digits(self.LINES)
+        self.assertEqual(grid.index((2, 3)), 13)
+        self.assertEqual(grid.position(13), (2, 3))
@@ -0,0 +1,72 @@
+from os import path
+import io
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+from aoc.inputs import (
+    OPENERS, STDIN, as_lines, iter_blocks, iter_chunks, iter_ints, iter_lines, read_text, resolve,
+)
+
+
+class TestInputs(unittest.TestCase):
+    TEXT = b"1000\n2000\n\n-3,4 -> 5,6\r\n\nlast"
+    LINES = [b"1000", b"2000", b"", b"-3,4 -> 5,6", b"", b"last"]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, name, data, opener=open):
+        fname = path.join(self.directory.name, name)
+        with opener(fname, "wb") as file:
+            file.write(data)
+        return fname
+
+    def test_resolve(self):
+        self.assertEqual(resolve("/a/day1/__main__.py", "input.txt"), "/a/day1/input.txt")
+        self.assertEqual(resolve("/a/day1/__main__.py", "/tmp/x.txt"), "/tmp/x.txt")
+        self.assertEqual(resolve("/a/day1/__main__.py", STDIN), STDIN)
+
+    def test_iter_lines(self):
+        self.assertEqual(list(iter_lines(self._write("a.txt", self.TEXT))), self.LINES)
+        self.assertEqual(list(iter_lines(self._write("b.txt", self.TEXT + b"\n"))), self.LINES)
+        self.assertEqual(list(iter_lines(self._write("c.txt", b""))), [])
+
+    def test_iter_lines_compressed(self):
+        for extension, opener in OPENERS.items():
+            fname = self._write("a.txt" + extension, self.TEXT, opener)
+            self.assertEqual(list(iter_lines(fname)), self.LINES)
+
+    def test_iter_lines_stdin(self):
+        with mock.patch("sys.stdin", io.TextIOWrapper(io.BytesIO(self.TEXT))):
+            self.assertEqual(list(iter_lines(STDIN)), self.LINES)
+
+    def test_iter_chunks(self):
+        self.assertEqual(list(iter_chunks(b"1-2,3-4\n5-6,7-8\n", 4)), [(0, 8), (8, 16)])
+        self.assertEqual(list(iter_chunks(b"1-2,3-4\n5-6,7-8", 100)), [(0, 15)])
+        lines = b"a\nb\nc\nd\ne\nf\ng"
+        self.assertEqual(list(iter_chunks(lines, 1, lines_per_record=3)), [(0, 6), (6, 12), (12, 13)])
+        self.assertEqual(list(iter_chunks(lines, 7, lines_per_record=2)), [(0, 8), (8, 13)])
+        blocks = b"1\n2\n\n3\n\n4\r\n\r\n5"
+        self.assertEqual(list(iter_chunks(blocks, 4, re.compile(rb"\n\r?\n"))), [(0, 5), (5, 13), (13, 14)])
+        self.assertEqual(list(iter_chunks(b"", 4)), [])
+
+    def test_iter_blocks(self):
+        actual = list(iter_blocks(self._write("a.txt", self.TEXT)))
+        self.assertEqual(actual, [[b"1000", b"2000"], [b"-3,4 -> 5,6"], [b"last"]])
+
+    def test_iter_ints(self):
+        fname = self._write("a.txt", self.TEXT)
+        self.assertEqual(list(iter_ints(fname))[3], (3, 4, 5, 6))
+        self.assertEqual(list(iter_ints(fname, signed=True))[3], (-3, 4, 5, 6))
+
+    def test_as_lines(self):
+        self.assertEqual(list(as_lines(["1000\n", b"2000\r\n", "", "last"])), [b"1000", b"2000", b"", b"last"])
+        self.assertEqual(list(as_lines(io.StringIO(self.TEXT.decode()))), self.LINES)
+
+    def test_read_text(self):
+        self.assertEqual(read_text(self._write("a.txt", self.TEXT)), self.TEXT.decode())
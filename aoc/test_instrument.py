@@ -0,0 +1,63 @@
+import inspect
+import pstats
+import tempfile
+import time
+import unittest
+
+from aoc.instrument import ENABLED, STATS, hot, instrumented, profile_call, section, snapshot
+
+
+def _fib(n):
+    return n if n < 2 else _fib(n - 1) + _fib(n - 2)
+
+
+class TestInstrument(unittest.TestCase):
+
+    def setUp(self):
+        STATS.clear()
+
+    def test_hot_disabled(self):
+        if not ENABLED:
+            self.assertIs(hot(_fib), _fib)
+
+    def test_instrumented_recursion(self):
+        global _fib  # pylint: disable=global-statement
+        original = _fib
+        _fib = instrumented(original)
+        try:
+            self.assertEqual(_fib(10), 55)
+        finally:
+            _fib = original
+        stat = STATS[f"{__name__}._fib"]
+        self.assertEqual(stat.calls, 177)
+        self.assertGreater(stat.seconds, 0)
+
+    def test_instrumented_generator(self):
+        def slow_items():
+            for i in range(3):
+                time.sleep(0.01)
+                yield i
+
+        wrapped = instrumented(slow_items)
+        self.assertTrue(inspect.isgeneratorfunction(wrapped))
+        self.assertEqual(list(wrapped()), [0, 1, 2])
+        self.assertEqual(next(wrapped()), 0)
+        stat = STATS[f"{__name__}.{slow_items.__qualname__}"]
+        self.assertEqual(stat.calls, 2)
+        self.assertGreater(stat.seconds, 0.035)
+
+    def test_section(self):
+        with section("block"):
+            with section("block"):
+                pass
+        self.assertEqual(STATS["block"].calls, 2)
+        self.assertEqual(list(snapshot()), ["block"])
+
+    def test_profile_call(self):
+        with tempfile.TemporaryDirectory() as directory:
+            stats_file, folded_file = f"{directory}/a.pstats", f"{directory}/a.folded"
+            self.assertEqual(profile_call(_fib, 8, stats_file=stats_file, folded_file=folded_file), 21)
+            self.assertGreater(pstats.Stats(stats_file).total_calls, 60)
+            with open(folded_file, "r", encoding="utf-8") as file:
+                stacks = [line.rsplit(" ", 1)[0] for line in file.read().split("\n")]
+        self.assertIn(f"{__name__}:_fib;{__name__}:_fib", stacks)
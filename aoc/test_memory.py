@@ -0,0 +1,41 @@
+from os import path
+import tracemalloc
+import unittest
+
+from aoc.memory import MB, MemoryCeilingExceeded, MemoryReport, Site, ceiling, format_report, measure
+
+
+def allocate(count):
+    return [str(i) for i in range(count)]
+
+
+@unittest.skipUnless(path.exists("/proc/self/statm"), "needs procfs")
+class TestMemory(unittest.TestCase):
+
+    def test_measure(self):
+        result, report = measure(allocate, 100000)
+        self.assertEqual(len(result), 100000)
+        self.assertGreater(report.peak_traced, 100000 * 40)
+        self.assertGreaterEqual(report.peak_rss, report.peak_traced)
+        self.assertTrue(report.top[0].location.startswith(path.join("aoc", "test_memory.py")))
+        self.assertFalse(any(site.location.startswith(path.join("aoc", "memory.py")) for site in report.top))
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_ceiling(self):
+        with self.assertRaises(MemoryCeilingExceeded) as context:
+            with ceiling(64 * MB):
+                bytearray(256 * MB)
+        self.assertIn("ceiling of 64.0 MB at aoc/test_memory.py", str(context.exception))
+        self.assertIn("in test_ceiling", str(context.exception))
+        self.assertEqual(len(bytearray(128 * MB)), 128 * MB)
+
+    def test_ceiling_not_reached(self):
+        with ceiling(64 * MB):
+            self.assertEqual(len(allocate(1000)), 1000)
+
+    def test_format_report(self):
+        report = MemoryReport(2 * MB, 10 * MB, [Site("day1/solver.py:3", MB, 7)])
+        self.assertEqual(
+            format_report(report),
+            "    peak traced 2.0 MB, peak RSS 10.0 MB\n         1.00 MB          7 blocks  day1/solver.py:3"
+        )
@@ -0,0 +1,58 @@
+import unittest
+
+from aoc.search import INF, astar, bfs, dijkstra, time_expanded_bfs
+
+
+class TestSearch(unittest.TestCase):
+    """Nodes of a 3x3 grid, node 4 in the middle is a wall"""
+    COLS = 3
+    WALL = 4
+
+    def _neighbours(self, node):
+        row, col = divmod(node, self.COLS)
+        for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            r, c = row + d_row, col + d_col
+            if 0 <= r < self.COLS and 0 <= c < self.COLS and r * self.COLS + c != self.WALL:
+                yield r * self.COLS + c
+
+    def _weighted(self, node):
+        return ((other, 2 if other == 1 else 1) for other in self._neighbours(node))
+
+    def _heuristic(self, node):
+        row, col = divmod(node, self.COLS)
+        return abs(row - 2) + abs(col - 2)
+
+    def test_bfs(self):
+        result = bfs(9, [0], self._neighbours)
+        self.assertEqual(result.distances, [0, 1, 2, 1, INF, 3, 2, 3, 4])
+        self.assertIsNone(result.target)
+
+    def test_bfs_multi_source_target(self):
+        result = bfs(9, [0, 2], self._neighbours, targets={7})
+        self.assertEqual(result.target_distance, 3)
+
+    def test_dijkstra(self):
+        result = dijkstra(9, [0], self._weighted, targets={2})
+        self.assertEqual(result.target_distance, 3)
+        self.assertEqual(dijkstra(9, [0], self._weighted).distances[8], 4)
+
+    def test_astar(self):
+        result = astar(9, [0], self._weighted, targets={8}, heuristic=self._heuristic)
+        self.assertEqual(result.target_distance, 4)
+
+    def test_astar_inconsistent_heuristic(self):
+        # 0 -> 1 -> 3 -> 4 is shortest, but the estimate of 1 makes 3 first reached through 2
+        edges = {0: [(1, 1), (2, 1)], 1: [(3, 1)], 2: [(3, 2)], 3: [(4, 3)], 4: []}
+        estimates = [0, 4, 1, 0, 0]
+        result = astar(5, [0], edges.get, targets={4}, heuristic=estimates.__getitem__)
+        self.assertEqual(result.target_distance, 5)
+
+    def test_time_expanded_bfs(self):
+        # a line of 3 nodes, node 1 is open only at even times
+        def moves(node, time):
+            for other in (node - 1, node, node + 1):
+                if 0 <= other < 3 and (other != 1 or (time + 1) % 2 == 0):
+                    yield other
+        self.assertEqual(time_expanded_bfs(3, 2, [0], {2}, moves), 3)
+        self.assertEqual(time_expanded_bfs(3, 2, [0], {2}, moves, start_time=1), 2)
+        self.assertIsNone(time_expanded_bfs(3, 2, [0], {2}, lambda n, t: [n]))
@@ -1,64 +1,13 @@
-from dataclasses import dataclass
-from functools import reduce
-from itertools import chain
 from os import path
+import tempfile
 import unittest
 
-
-class LimitedSortedList:
-    """The first element is the max"""
-
-    def __init__(self, limit):
-        self.limit = limit
-        self.elements = []
-
-    def append(self, element):
-        inserted = False
-        for i, other in enumerate(self.elements):
-            if element > other:
-                self.elements.insert(i, element)
-                inserted = True
-                break
-
-        if inserted:
-            self.elements = self.elements[0:self.limit]
-        elif len(self.elements) < self.limit:
-            self.elements.append(element)
-
-
-@dataclass
-class State:
-    top3: LimitedSortedList
-    cur_sum: int
-
-    def apply(self, element):
-        if element is None:
-            self.top3.append(self.cur_sum)
-            return State(self.top3, 0)
-        return State(self.top3, self.cur_sum + element)
-
-
-def read_data(fname):
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        for line in file:
-            line = line.rstrip()
-            if len(line) > 0:
-                yield int(line)
-            else:
-                yield None
-
-
-def solve(data):
-    init = State(LimitedSortedList(3), 0)
-    elements = chain(data, [None])
-    result = reduce(lambda s, e: s.apply(e), elements, init)
-    top3 = result.top3.elements
-    return top3[0], sum(top3)
-
-
-def solve_file(fname):
-    return solve(read_data(fname))
+from aoc.generate import generate_file
+from aoc.inputs import resolve
+from day1.solver import (
+    LimitedSortedList, TopK, np, read_data, solve, solve_file, solve_file_numpy, solve_file_parallel,
+    solve_stream, top_groups, top_k, top_of_bytes, top_of_bytes_numpy,
+)
 
 
 class TestLimitedSortedList(unittest.TestCase):
@@ -82,6 +31,27 @@ class TestLimitedSortedList(unittest.TestCase):
         self.assertEqual(sample.elements, expected)
 
 
+class TestTopK(unittest.TestCase):
+
+    def test_same_as_limited_sorted_list(self):
+        values = [1, 5, 4, 4, 5, 3, 10, 1, 2]
+        for k in range(len(values) + 2):
+            expected = LimitedSortedList(k)
+            for value in values:
+                expected.append(value)
+            self.assertEqual(TopK(k).extend(values).elements, expected.elements)
+
+    def test_indices_and_stable_order(self):
+        self.assertEqual(top_k([3, 7, 3, 7, 1], 3), [(1, 7), (3, 7), (0, 3)])
+
+    def test_key(self):
+        self.assertEqual(top_k(["bb", "a", "ccc", "dd"], 2, key=len), [(2, "ccc"), (0, "bb")])
+
+    def test_top_groups(self):
+        self.assertEqual(top_groups(read_data("input-test.txt"), 2), [(3, 24000), (2, 11000)])
+        self.assertEqual(solve(read_data("input-test.txt"), k=1), (24000, 24000))
+
+
 class TestDay(unittest.TestCase):
 
     def test_read_data(self):
@@ -101,6 +71,37 @@ class TestDay(unittest.TestCase):
         data = read_data("input-test.txt")
         self.assertEqual(solve(data), (24000, 45000))
 
+    def test_solve_stream(self):
+        with open(resolve(__file__, "input-test.txt"), "r", encoding="utf-8") as file:
+            self.assertEqual(solve_stream(file), (24000, 45000))
+
+
+class TestParallel(unittest.TestCase):
+
+    def test_top_of_bytes(self):
+        self.assertEqual(top_of_bytes(b"1\n2\n\n7\r\n\r\n4\n\n", 2), [7, 4])
+
+    def test_solve_file_parallel(self):
+        self.assertEqual(solve_file_parallel("input-test.txt"), (24000, 45000))
+        with tempfile.TemporaryDirectory() as directory:
+            fname = generate_file(path.join(directory, "input.txt"), 1, 20, 0)
+            expected = solve_file(fname)
+            self.assertEqual(solve_file_parallel(fname, workers=2, min_chunk_size=1000), expected)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestNumpy(unittest.TestCase):
+
+    def test_top_of_bytes_numpy(self):
+        for data in [b"1\n2\n\n3\n\n\n4\r\n\r\n5\n\n", b"7", b"\n\n1\n\n2", b"10\n20\n\n5\n"]:
+            self.assertEqual(top_of_bytes_numpy(data, 3), top_of_bytes(data, 3))
+
+    def test_solve_file_numpy(self):
+        self.assertEqual(solve_file_numpy("input-test.txt"), (24000, 45000))
+        with tempfile.TemporaryDirectory() as directory:
+            fname = generate_file(path.join(directory, "input.txt"), 1, 20, 0)
+            self.assertEqual(solve_file_numpy(fname, k=5), solve(read_data(fname), k=5))
+
 
 if __name__ == '__main__':
     print(solve_file("input.txt"))
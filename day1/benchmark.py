@@ -0,0 +1,46 @@
+"""
+Compares TopK with LimitedSortedList on random group sums: python -m day1.benchmark --count 200000 --k 3 100 1000
+"""
+import argparse
+import random
+import time
+
+from day1.solver import LimitedSortedList, TopK
+
+
+def time_appends(container, values):
+    begin = time.perf_counter()
+    for value in values:
+        container.append(value)
+    return time.perf_counter() - begin, container.elements
+
+
+def compare(count, ks, seed=0):
+    rng = random.Random(seed)
+    values = [rng.randint(1000, 60000 * 14) for _ in range(count)]
+    rows = []
+    for k in ks:
+        list_seconds, expected = time_appends(LimitedSortedList(k), values)
+        heap_seconds, actual = time_appends(TopK(k), values)
+        if actual != expected:
+            raise Exception(f"TopK and LimitedSortedList differ for k={k}")
+        rows.append((k, list_seconds, heap_seconds))
+    return rows
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmarks top-k selection of day 1")
+    parser.add_argument("--count", type=int, default=200000, help="number of groups")
+    parser.add_argument("--k", type=int, nargs="+", default=[3, 10, 100, 1000])
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def main(args):
+    print(f"{'k':>6} {'sorted list':>12} {'heap':>9} {'speedup':>8}")
+    for k, list_seconds, heap_seconds in compare(args.count, args.k, args.seed):
+        print(f"{k:>6} {list_seconds:>11.3f}s {heap_seconds:>8.3f}s {list_seconds / heap_seconds:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main(parse_args())
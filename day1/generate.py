@@ -0,0 +1,7 @@
+def generate(scale, rng):
+    """About 250 elves per scale unit, each carrying 1-14 snacks"""
+    for i in range(max(3, int(250 * scale))):
+        if i > 0:
+            yield ""
+        for _ in range(rng.randint(1, 14)):
+            yield str(rng.randint(1000, 60000))
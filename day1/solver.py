@@ -0,0 +1,173 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+import heapq
+import os
+import re
+
+from aoc.inputs import as_lines, is_mappable, iter_chunks, iter_lines, open_buffer, optional_numpy, resolve
+from aoc.instrument import hot
+
+np = optional_numpy()
+
+BLANK_LINE = re.compile(rb"\n\r?\n")
+BLANK_LINES = re.compile(rb"\n(?:\r?\n)+")
+CHUNKS_PER_WORKER = 4
+MIN_CHUNK_SIZE = 1 << 20
+NUMPY_CHUNK_SIZE = 64 << 20
+
+
+class LimitedSortedList:
+    """The first element is the max"""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.elements = []
+
+    @hot
+    def append(self, element):
+        inserted = False
+        for i, other in enumerate(self.elements):
+            if element > other:
+                self.elements.insert(i, element)
+                inserted = True
+                break
+
+        if inserted:
+            self.elements = self.elements[0:self.limit]
+        elif len(self.elements) < self.limit:
+            self.elements.append(element)
+
+
+class TopK:
+    """
+    The k largest appended elements, kept in a min-heap: O(log k) per append.
+    Elements with equal keys keep their append order.
+    """
+
+    def __init__(self, k, key=None):
+        self.k = k
+        self.key = key
+        self.count = 0
+        self.heap = []
+
+    @hot
+    def append(self, element):
+        entry = (element if self.key is None else self.key(element), -self.count, element)
+        self.count += 1
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+        elif self.k > 0 and entry > self.heap[0]:
+            heapq.heapreplace(self.heap, entry)
+
+    def extend(self, elements):
+        for element in elements:
+            self.append(element)
+        return self
+
+    def items(self):
+        """(index, element) pairs, the largest first. index is the position in the appended sequence."""
+        return [(-index, element) for _, index, element in sorted(self.heap, reverse=True)]
+
+    @property
+    def elements(self):
+        return [element for _, element in self.items()]
+
+
+def top_k(elements, k, key=None):
+    return TopK(k, key).extend(elements).items()
+
+
+def parse_data(lines):
+    for line in lines:
+        line = line.rstrip()
+        if len(line) > 0:
+            yield int(line)
+        else:
+            yield None
+
+
+def read_data(fname):
+    return parse_data(iter_lines(resolve(__file__, fname)))
+
+
+def group_sums(data):
+    """Calories of every elf, data as produced by parse_data"""
+    total = 0
+    for element in data:
+        if element is None:
+            yield total
+            total = 0
+        else:
+            total += element
+    yield total
+
+
+def top_groups(data, k, key=None):
+    """(elf index, calories) of the k elves carrying the most"""
+    return top_k(group_sums(data), k, key)
+
+
+def solve(data, k=3):
+    top = TopK(k).extend(group_sums(data)).elements
+    return top[0], sum(top)
+
+
+def solve_stream(lines):
+    return solve(parse_data(as_lines(lines)))
+
+
+def solve_file(fname):
+    if np is not None:
+        return solve_file_numpy(fname)
+    return solve(read_data(fname))
+
+
+@hot
+def top_of_bytes(data, k):
+    """The k largest group sums of raw input bytes. int() skips the whitespace, so no per line objects are kept."""
+    return heapq.nlargest(k, (sum(map(int, group.split())) for group in BLANK_LINE.split(data) if group))
+
+
+def top_of_chunk(fname, begin, end, k):
+    with open_buffer(fname) as buffer:
+        return top_of_bytes(buffer[begin:end], k)
+
+
+def solve_file_parallel(fname, workers=None, k=3, min_chunk_size=MIN_CHUNK_SIZE):
+    """Same answer as solve_file, computed from chunks of the file in worker processes"""
+    fname = resolve(__file__, fname)
+    if not is_mappable(fname):
+        return solve_file(fname)
+    workers = workers or os.cpu_count()
+    with open_buffer(fname) as buffer:
+        count = max(1, min(workers * CHUNKS_PER_WORKER, len(buffer) // min_chunk_size))
+        chunks = list(iter_chunks(buffer, -(-len(buffer) // count), BLANK_LINE))
+        if len(chunks) <= 1 or workers == 1:
+            top = top_of_bytes(buffer, k)
+            return top[0], sum(top)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(top_of_chunk, fname, begin, end, k) for begin, end in chunks]
+        top = heapq.nlargest(k, chain.from_iterable(f.result() for f in futures))
+    return top[0], sum(top)
+
+
+@hot
+def top_of_bytes_numpy(data, k):
+    """Blank lines become -1 markers, so the whole chunk is converted by one np.fromstring call"""
+    data = bytes(data).lstrip()
+    values = np.fromstring(BLANK_LINES.sub(b"\n-1\n", data), dtype=np.int64, sep="\n")
+    markers = values < 0
+    values[markers] = 0
+    group_starts = np.concatenate(([0], np.flatnonzero(markers) + 1))
+    sums = np.add.reduceat(values, group_starts[group_starts < len(values)]) if len(values) else np.zeros(1, np.int64)
+    if len(sums) > k:
+        sums = np.partition(sums, len(sums) - k)[-k:]
+    return sorted(sums.tolist(), reverse=True)
+
+
+def solve_file_numpy(fname, k=3):
+    """Same answer as solve_file, parsing chunks of the input with array operations"""
+    with open_buffer(resolve(__file__, fname)) as buffer:
+        chunks = iter_chunks(buffer, NUMPY_CHUNK_SIZE, BLANK_LINE)
+        top = heapq.nlargest(k, chain.from_iterable(top_of_bytes_numpy(buffer[b:e], k) for b, e in chunks))
+    return top[0], sum(top)
@@ -1,79 +1,14 @@
-from dataclasses import dataclass
-from os import path
 import unittest
 
-
-@dataclass
-class Add:
-    value: int
-
-
-class Noop:
-    _instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if not cls._instance:
-            cls._instance = super(Noop, cls).__new__(cls, *args, **kwargs)
-        return cls._instance
-
-
-@dataclass
-class Result:
-    registry: list[int]
-    crt: str
-
-
-def parse_instruction(string):
-    parts = string.split()
-    if parts[0] == "noop":
-        return Noop()
-    return Add(int(parts[1]))
-
-
-def reshape_crt(crt):
-    return ["".join(crt[i * 40:(i + 1) * 40]) for i in range(6)]
-
-
-def need_draw(crt_pos, registry):
-    rem = crt_pos % 40
-    return rem - 1 <= registry <= rem + 1
-
-
-def execute(instructions):
-    registry = [1, 1]
-    crt = []
-    last = 1
-    i = -1
-    for instruction in instructions:
-        registry.append(last)
-        i = i + 1
-        draw = need_draw(i, last)
-        crt.append("#" if draw else ".")
-        if isinstance(instruction, Add):
-            i = i + 1
-            draw = need_draw(i, last)
-            crt.append("#" if draw else ".")
-            new_value = last + instruction.value
-            registry.append(new_value)
-            last = new_value
-
-    return Result(registry, reshape_crt(crt))
-
-
-def score_registry(results):
-    """(that is, during the 20th, 60th, 100th, 140th, 180th, and 220th cycles)"""
-    return sum(p * results[p] for p in [20, 60, 100, 140, 180, 220])
-
-
-def read_instructions(fname):
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        for s in file:
-            yield parse_instruction(s)
+from aoc.inputs import resolve
+from day10.solver import Add, Noop, execute, read_instructions, solve_file, solve_stream
 
 
 class TestDay(unittest.TestCase):
-    INSTRUCTIONS = list(read_instructions("input-test.txt"))
+
+    @classmethod
+    def setUpClass(cls):
+        cls.INSTRUCTIONS = list(read_instructions("input-test.txt"))
 
     def test_execute_small(self):
         """
@@ -107,11 +42,19 @@ class TestDay(unittest.TestCase):
         self.assertEqual(actual[180], 16)
         self.assertEqual(actual[220], 18)
 
+    def test_solve_file(self):
+        score, crt = solve_file("input-test.txt")
+        self.assertEqual(score, 13140)
+        self.assertEqual(crt[0], "##..##..##..##..##..##..##..##..##..##..")
+
+    def test_solve_stream(self):
+        with open(resolve(__file__, "input-test.txt"), "r", encoding="utf-8") as file:
+            self.assertEqual(solve_stream(file), solve_file("input-test.txt"))
+
 
 if __name__ == '__main__':
-    instructions = read_instructions("input.txt")
-    result = execute(instructions)
-    score_registry(result.registry)
-    for raw in result.crt:
+    score, crt = solve_file("input.txt")
+    print(score)
+    for raw in crt:
         print(raw)
     unittest.main()
@@ -0,0 +1,7 @@
+def generate(scale, rng):
+    """146 instructions per scale unit, but never fewer than needed to draw the whole screen"""
+    for _ in range(max(240, int(146 * scale))):
+        if rng.random() < 0.3:
+            yield "noop"
+        else:
+            yield f"addx {rng.randint(-20, 20) or 1}"
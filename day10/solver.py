@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+
+from aoc.inputs import as_lines, iter_lines, resolve
+from aoc.instrument import hot
+
+SIGNAL_CYCLES = [20, 60, 100, 140, 180, 220]
+SCREEN_SIZE = 240
+
+
+@dataclass
+class Add:
+    value: int
+
+
+class Noop:
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(Noop, cls).__new__(cls, *args, **kwargs)
+        return cls._instance
+
+
+@dataclass
+class Result:
+    registry: list[int]
+    crt: str
+
+
+def parse_instruction(string):
+    parts = string.split()
+    if parts[0] == "noop":
+        return Noop()
+    return Add(int(parts[1]))
+
+
+def reshape_crt(crt):
+    return ["".join(crt[i * 40:(i + 1) * 40]) for i in range(6)]
+
+
+def need_draw(crt_pos, registry):
+    rem = crt_pos % 40
+    return rem - 1 <= registry <= rem + 1
+
+
+@hot
+def iter_cycles(instructions):
+    """Registry value during every cycle, the last one is the value after the program"""
+    last = 1
+    for instruction in instructions:
+        yield last
+        if isinstance(instruction, Add):
+            yield last
+            last = last + instruction.value
+    yield last
+
+
+def execute(instructions):
+    registry = [1, *iter_cycles(instructions)]
+    crt = ["#" if need_draw(i, value) else "." for i, value in enumerate(registry[1:-1])]
+    return Result(registry, reshape_crt(crt))
+
+
+def score_registry(results):
+    """(that is, during the 20th, 60th, 100th, 140th, 180th, and 220th cycles)"""
+    return sum(p * results[p] for p in SIGNAL_CYCLES)
+
+
+def parse_instructions(lines):
+    for s in lines:
+        yield parse_instruction(s.decode())
+
+
+def read_instructions(fname):
+    return parse_instructions(iter_lines(resolve(__file__, fname)))
+
+
+def solve_instructions(instructions):
+    """Keeps only the screen, so the program can be of any length"""
+    score = 0
+    crt = []
+    for cycle, value in enumerate(iter_cycles(instructions), start=1):
+        if cycle in SIGNAL_CYCLES:
+            score += cycle * value
+        if cycle <= SCREEN_SIZE:
+            crt.append("#" if need_draw(cycle - 1, value) else ".")
+    return score, reshape_crt(crt)
+
+
+def solve_stream(lines):
+    return solve_instructions(parse_instructions(as_lines(lines)))
+
+
+def solve_file(fname):
+    return solve_instructions(read_instructions(fname))
@@ -0,0 +1,19 @@
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53]
+
+
+def generate(scale, rng):
+    """8 monkeys with about 5 * scale items each, more monkeys appear for scale > 1"""
+    monkeys = min(len(PRIMES), max(2, int(8 * scale ** 0.25)))
+    dividers = rng.sample(PRIMES, monkeys)
+    for i in range(monkeys):
+        if i > 0:
+            yield ""
+        items = [str(rng.randint(50, 99)) for _ in range(rng.randint(1, max(1, int(8 * scale))))]
+        operation = rng.choice(["* old", f"* {rng.randint(2, 19)}", f"+ {rng.randint(1, 8)}"])
+        others = [m for m in range(monkeys) if m != i]
+        yield f"Monkey {i}:"
+        yield f"  Starting items: {', '.join(items)}"
+        yield f"  Operation: new = old {operation}"
+        yield f"  Test: divisible by {dividers[i]}"
+        yield f"    If true: throw to monkey {rng.choice(others)}"
+        yield f"    If false: throw to monkey {rng.choice(others)}"
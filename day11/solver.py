@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+from functools import reduce
+
+from aoc.inputs import iter_lines, resolve
+from aoc.instrument import hot
+
+
+CALM_FACTOR = 3
+
+
+@dataclass
+class Monkey:
+    items: list[int]
+    operation: str
+    arg: int
+    divider: int
+    true_path: int
+    false_path: int
+    inspects: int = 0
+
+
+def remove_prefix(string, prefix):
+    string = string.strip()
+    if not string.startswith(prefix):
+        raise Exception(f"{string} is not started with {prefix}")
+    return string[len(prefix):]
+
+
+def parse_base(line):
+    return int(remove_prefix(line, "Test: divisible by "))
+
+
+def parse_monkey(lines):
+    items_str = remove_prefix(lines[1], "Starting items: ")
+    items = list(map(int, items_str.split(", ")))
+
+    operation_str = remove_prefix(lines[2], "Operation: new = old ")
+    if operation_str == "* old":
+        operation = "**"
+        arg = 2
+    elif operation_str.startswith("*"):
+        operation = "*"
+        arg = int(operation_str.split(" ")[1])
+    elif operation_str.startswith("+"):
+        operation = "+"
+        arg = int(operation_str.split(" ")[1])
+    else:
+        raise Exception("Can not parse operation {lines[2]}")
+
+    divider = int(remove_prefix(lines[3], "Test: divisible by "))
+    true_path = int(remove_prefix(lines[4], "If true: throw to monkey "))
+    false_path = int(remove_prefix(lines[5], "If false: throw to monkey "))
+    return Monkey(items, operation, arg, divider, true_path, false_path)
+
+
+def parse_monkeys(lines):
+    return [parse_monkey(lines[i: i + 6]) for i in range(0, len(lines), 7)]
+
+
+def read_lines(fname):
+    for line in iter_lines(resolve(__file__, fname)):
+        yield line.decode()
+
+
+def read_monkeys(fname):
+    lines = list(read_lines(fname))
+    return parse_monkeys(lines)
+
+
+def apply_operation(value, operation, arg):
+    if operation == "+":
+        return value + arg
+    if operation == "*":
+        return value * arg
+    if operation == "**" and arg == 2:
+        return value ** 2
+    raise Exception(f"Unknown operation {operation} for arg {arg}")
+
+
+@hot
+def calculate_new_value(item, operation, arg, calm, base):
+    item = apply_operation(item, operation, arg)
+    if calm:
+        item = item // CALM_FACTOR
+    item = item % base
+    return item
+
+
+@hot
+def simulate_round(monkeys, calm, base):
+    for monkey in monkeys:
+        items = monkey.items
+        monkey.inspects = monkey.inspects + len(items)
+        monkey.items = []
+        for item in items:
+            value = calculate_new_value(item, monkey.operation, monkey.arg, calm, base)
+            going = monkey.true_path if value % monkey.divider == 0 else monkey.false_path
+            monkeys[going].items.append(value)
+
+
+def business_level(monkeys, relif, rounds_number):
+    base = get_base(monkeys)
+    for i in range(rounds_number):
+        if i % 50 == 0:
+            print(f"{i}/{rounds_number}")
+        simulate_round(monkeys, relif, base)
+    all_inspects = map(lambda m: m.inspects, monkeys)
+    top2 = sorted(all_inspects)[-2:]
+    return top2[0] * top2[1]
+
+
+def get_base(monkeys):
+    return reduce(lambda a, b: a * b, map(lambda m: m.divider, monkeys))
+
+
+def score_file(fname):
+    return (
+        business_level(read_monkeys(fname), True, 20),
+        business_level(read_monkeys(fname), False, 10000),
+    )
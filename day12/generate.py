@@ -0,0 +1,21 @@
+from math import sqrt
+from string import ascii_lowercase
+
+
+def generate(scale, rng):
+    """41 x 171 cells per scale unit. Heights grow from left to right, some cells are dropped to 'a'."""
+    rows = max(2, int(41 * sqrt(scale)))
+    cols = max(len(ascii_lowercase), int(171 * sqrt(scale)))
+    start, end = rng.randrange(rows), rng.randrange(rows)
+    for row in range(rows):
+        line = []
+        for col in range(cols):
+            if col == 0 and row == start:
+                line.append("S")
+            elif col == cols - 1 and row == end:
+                line.append("E")
+            elif rng.random() < 0.1:
+                line.append("a")
+            else:
+                line.append(ascii_lowercase[col * len(ascii_lowercase) // cols])
+        yield "".join(line)
@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+
+from aoc.inputs import iter_lines, resolve
+from aoc.instrument import hot
+from aoc.search import bfs
+
+
+BASE_ORD = ord('a')
+START_CHAR = 'E'
+END_CHAR = 'S'
+MAX_HEIGHT = ord('z') - BASE_ORD
+
+
+@dataclass
+class MapGraph:
+    heights: list[list[int]]
+    start: tuple[int, int]
+    ends: set[tuple[int, int]]
+    rows: int
+    cols: int
+
+    def __init__(self, heights, start, ends):
+        self.heights = heights
+        self.start = start
+        self.ends = ends
+        self.rows = len(heights)
+        self.cols = len(heights[0])
+
+    def can_go(self, from_point, to_point):
+        from_height = self.heights[from_point[0]][from_point[1]]
+        to_height = self.heights[to_point[0]][to_point[1]]
+        return to_height >= from_height - 1
+
+
+def parse_map_graph(lines, many_ends):
+    heights = []
+    start = None
+    ends = set()
+
+    for i, line in enumerate(lines):
+        heights_line = []
+        for j, char in enumerate(line):
+            if char == START_CHAR:
+                heights_line.append(MAX_HEIGHT)
+                start = (i, j)
+            elif char == END_CHAR:
+                heights_line.append(0)
+                ends.add((i, j))
+            else:
+                height = ord(char) - BASE_ORD
+                heights_line.append(height)
+                if many_ends and height == 0:
+                    ends.add((i, j))
+        heights.append(heights_line)
+
+    return MapGraph(heights, start, ends)
+
+
+@hot
+def find_way(graph):
+    """Unit weights, so BFS from the start gives the nearest end first"""
+    start = graph.start[0] * graph.cols + graph.start[1]
+    ends = {row * graph.cols + col for row, col in graph.ends}
+    result = bfs(graph.rows * graph.cols, [start], lambda node: find_points_to_go(node, graph), ends)
+    if result.target is None:
+        raise Exception("Way not found")
+    return result.target_distance
+
+
+@hot
+def find_points_to_go(node, graph):
+    pointer = divmod(node, graph.cols)
+    for (i, j) in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        candidate = (pointer[0] + i, pointer[1] + j)
+        if candidate[0] < 0 or candidate[0] >= graph.rows:
+            continue
+        if candidate[1] < 0 or candidate[1] >= graph.cols:
+            continue
+        if not graph.can_go(pointer, candidate):
+            continue
+        yield candidate[0] * graph.cols + candidate[1]
+
+
+def read_lines(fname):
+    for line in iter_lines(resolve(__file__, fname)):
+        yield line.decode().rstrip()
+
+
+def solve_file(fname):
+    lines = list(read_lines(fname))
+    return find_way(parse_map_graph(lines, False)), find_way(parse_map_graph(lines, True))
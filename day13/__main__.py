@@ -1,76 +1,7 @@
-from os import path
 import unittest
-import json
 
-
-def in_order(a, b):
-    result = is_valid_step(a, b)
-    return result is None or result
-
-
-def is_valid_step(a, b):
-    if isinstance(a, int) and isinstance(b, int):
-        if a == b:
-            return None
-        return a < b
-
-    if isinstance(a, int):
-        a = [a]
-    elif isinstance(b, int):
-        b = [b]
-
-    for x, y in zip(a, b):
-        result = is_valid_step(x, y)
-        if result is not None:
-            return result
-    return is_valid_step(len(a), len(b))
-
-
-def valid_positions_score(data):
-    total = 0
-    for i in range(len(data)//2):
-        if in_order(data[i*2], data[i*2+1]):
-            total = total + i + 1
-    return total
-
-
-def read_lines(fname):
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        for line in file:
-            yield line
-
-
-def read_data(fname):
-    data = []
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        for line in file:
-            line = line.strip()
-            if len(line) == 0:
-                continue
-            pocket = json.loads(line)
-            data.append(pocket)
-    return data
-
-
-def find_decoder_key(data):
-    first = [[2]]
-    second = [[6]]
-    index_first = 1
-    index_second = 2
-    for item in data:
-        if in_order(item, first):
-            index_first = index_first + 1
-            index_second = index_second + 1
-        elif in_order(item, second):
-            index_second = index_second + 1
-    return index_first * index_second
-
-
-def solve_file(fname):
-    data = read_data(fname)
-    return valid_positions_score(data), find_decoder_key(data)
+from aoc.inputs import resolve
+from day13.solver import find_decoder_key, in_order, solve_file, solve_stream, valid_positions_score
 
 
 class TestDay(unittest.TestCase):
@@ -106,6 +37,10 @@ class TestDay(unittest.TestCase):
     def test_solve_file(self):
         self.assertEqual(solve_file("input-test.txt"), (13, 140))
 
+    def test_solve_stream(self):
+        with open(resolve(__file__, "input-test.txt"), "r", encoding="utf-8") as file:
+            self.assertEqual(solve_stream(file), (13, 140))
+
 
 if __name__ == '__main__':
     print(solve_file("input.txt"))
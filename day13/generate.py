@@ -0,0 +1,20 @@
+import json
+
+
+def generate_packet(rng, depth):
+    result = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            result.append(generate_packet(rng, depth + 1))
+        else:
+            result.append(rng.randint(0, 10))
+    return result
+
+
+def generate(scale, rng):
+    """150 pairs of packets per scale unit"""
+    for i in range(max(1, int(150 * scale))):
+        if i > 0:
+            yield ""
+        yield json.dumps(generate_packet(rng, 0), separators=(",", ":"))
+        yield json.dumps(generate_packet(rng, 0), separators=(",", ":"))
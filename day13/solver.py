@@ -0,0 +1,96 @@
+import json
+
+from aoc.inputs import as_lines, iter_lines, resolve
+from aoc.instrument import hot
+
+
+def in_order(a, b):
+    result = is_valid_step(a, b)
+    return result is None or result
+
+
+@hot
+def is_valid_step(a, b):
+    if isinstance(a, int) and isinstance(b, int):
+        if a == b:
+            return None
+        return a < b
+
+    if isinstance(a, int):
+        a = [a]
+    elif isinstance(b, int):
+        b = [b]
+
+    for x, y in zip(a, b):
+        result = is_valid_step(x, y)
+        if result is not None:
+            return result
+    return is_valid_step(len(a), len(b))
+
+
+def valid_positions_score(data):
+    total = 0
+    for i in range(len(data)//2):
+        if in_order(data[i*2], data[i*2+1]):
+            total = total + i + 1
+    return total
+
+
+def read_lines(fname):
+    for line in iter_lines(resolve(__file__, fname)):
+        yield line.decode()
+
+
+def parse_packets(lines):
+    for line in lines:
+        line = line.strip()
+        if len(line) == 0:
+            continue
+        yield json.loads(line)
+
+
+def read_data(fname):
+    return list(parse_packets(iter_lines(resolve(__file__, fname))))
+
+
+@hot
+def find_decoder_key(data):
+    first = [[2]]
+    second = [[6]]
+    index_first = 1
+    index_second = 2
+    for item in data:
+        if in_order(item, first):
+            index_first = index_first + 1
+            index_second = index_second + 1
+        elif in_order(item, second):
+            index_second = index_second + 1
+    return index_first * index_second
+
+
+@hot
+def score_packets(packets):
+    """Both parts in a single pass holding one pair at a time, so packets can be a one-shot iterator"""
+    total = 0
+    index_first = 1
+    index_second = 2
+    previous = None
+    for i, packet in enumerate(packets):
+        if in_order(packet, [[2]]):
+            index_first = index_first + 1
+            index_second = index_second + 1
+        elif in_order(packet, [[6]]):
+            index_second = index_second + 1
+        if i % 2 == 0:
+            previous = packet
+        elif in_order(previous, packet):
+            total = total + i // 2 + 1
+    return total, index_first * index_second
+
+
+def solve_stream(lines):
+    return score_packets(parse_packets(as_lines(lines)))
+
+
+def solve_file(fname):
+    return score_packets(parse_packets(iter_lines(resolve(__file__, fname))))
@@ -0,0 +1,17 @@
+MAX_Y = 170
+SPREAD = 60
+
+
+def generate(scale, rng):
+    """150 rock paths per scale unit. Depth is fixed, so the sand pile on the floor fits into the map."""
+    for _ in range(max(1, int(150 * scale))):
+        x, y = rng.randint(500 - SPREAD, 500 + SPREAD), rng.randint(10, MAX_Y)
+        points = [(x, y)]
+        for i in range(rng.randint(1, 6)):
+            step = rng.randint(-8, 8) or 1
+            if i % 2 == 0:
+                x = min(max(x + step, 500 - SPREAD), 500 + SPREAD)
+            else:
+                y = min(max(y + step, 10), MAX_Y)
+            points.append((x, y))
+        yield " -> ".join(f"{px},{py}" for px, py in points)
@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+
+from aoc.inputs import iter_ints, resolve
+from aoc.instrument import hot
+
+
+START = (500, 0)
+
+
+@dataclass
+class Map:
+    data: list[list[str]]
+    max_x: int
+    max_y: int
+
+    def __init__(self, max_x, max_y):
+        self.max_x = max_x
+        self.max_y = max_y
+        self.data = []
+        for _ in range(max_x + 1):
+            self.data.append(['.'] * (max_y + 1))
+
+    def __getitem__(self, key):
+        return self.data[key[0]][key[1]]
+
+    def __setitem__(self, key, value):
+        self.data[key[0]][key[1]] = value
+
+    def draw(self, offset):
+        for r in range(self.max_y):
+            for c in range(offset, self.max_x):
+                print(self.data[c][r], end="")
+            print()
+
+
+def simulate_sand_falling(m):
+    i = 0
+    while True:
+        if simulate_sand_path(m):
+            return i
+        i += 1
+
+
+def simulate_sand_on_floor(m):
+    i = 1
+    while True:
+        simulate_sand_path(m)
+        if m[START] == 'O':
+            return i
+        i += 1
+
+
+@hot
+def simulate_sand_path(m):
+    point = START
+    while True:
+        if point is None:
+            return False
+        if point[1] == m.max_y:
+            return True
+        point = simulate_sand_move(m, point[0], point[1])
+
+
+@hot
+def simulate_sand_move(map, x, y):
+    if map[x, y + 1] == '.':
+        return x, y + 1
+    if x > 0 and map[x - 1, y + 1] == '.':
+        return x - 1, y + 1
+    if x < map.max_x and map[x + 1, y + 1] == '.':
+        return x + 1, y + 1
+    map[x, y] = 'O'
+    return None
+
+
+def read_commands(fname):
+    return [list(zip(numbers[::2], numbers[1::2])) for numbers in iter_ints(resolve(__file__, fname))]
+
+
+def init_empty_map(commands):
+    max_y = max(max(p[1] for p in command) for command in commands)
+    return Map(1000, max_y + 2)
+
+
+def draw_line(map, p1, p2):
+    x1, y1 = p1
+    x2, y2 = p2
+
+    if x1 == x2:
+        begin, end = (y1, y2) if y2 > y1 else (y2, y1)
+        for y in range(begin, end + 1):
+            map[x1, y] = '#'
+    elif y1 == y2:
+        begin, end = (x1, x2) if x2 > x1 else (x2, x1)
+        for x in range(begin, end + 1):
+            map[x, y1] = '#'
+    else:
+        raise Exception(f"Invalid line {p1}->{p2}")
+
+
+def apply_commands(m, commands):
+    for command in commands:
+        for p1, p2 in zip(command, command[1:]):
+            draw_line(m, p1, p2)
+
+
+def init_map(commands, floor):
+    map = init_empty_map(commands)
+    apply_commands(map, commands)
+    if floor:
+        draw_line(map, (0, map.max_y), (map.max_x, map.max_y))
+    return map
+
+
+def score_file(fname):
+    commands = read_commands(fname)
+    return (
+        simulate_sand_falling(init_map(commands, False)),
+        simulate_sand_on_floor(init_map(commands, True)),
+    )
@@ -0,0 +1,29 @@
+MAX_COORD = 4000000
+
+
+def format_sensor(sensor, beacon):
+    return f"Sensor at x={sensor[0]}, y={sensor[1]}: closest beacon is at x={beacon[0]}, y={beacon[1]}"
+
+
+def generate(scale, rng):
+    """
+    30 sensors per scale unit. Four huge sensors around a hidden point cover the whole square except
+    that point. Other sensors are random, but never reach the hidden point.
+    """
+    hidden = (rng.randint(1, MAX_COORD - 1), rng.randint(1, MAX_COORD - 1))
+    k = MAX_COORD + 1
+    lines = []
+    for dx, dy in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+        sensor = (hidden[0] + dx * k, hidden[1] + dy * k)
+        lines.append(format_sensor(sensor, (sensor[0] + dx * (2 * k - 1), sensor[1])))
+
+    for _ in range(max(0, int(30 * scale) - 4)):
+        sensor = (rng.randint(0, MAX_COORD), rng.randint(0, MAX_COORD))
+        limit = abs(sensor[0] - hidden[0]) + abs(sensor[1] - hidden[1]) - 1
+        radius = rng.randint(0, min(limit, MAX_COORD // 4))
+        dx = rng.randint(-radius, radius)
+        dy = (radius - abs(dx)) * rng.choice((-1, 1))
+        lines.append(format_sensor(sensor, (sensor[0] + dx, sensor[1] + dy)))
+
+    rng.shuffle(lines)
+    yield from lines
@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+import re
+
+from aoc.inputs import as_lines, ints_of_lines, iter_ints, resolve
+from aoc.instrument import hot
+
+
+def distance(x1, y1, x2, y2):
+    return abs(x1 - x2) + abs(y1 - y2)
+
+
+@dataclass
+class Range:
+    begin: int
+    end: int
+
+    def overlap(self, other):
+        if self.begin <= other.begin <= self.end:
+            return True
+        if other.begin <= self.begin <= other.end:
+            return True
+        return False
+
+    def join(self, other):
+        return Range(min(self.begin, other.begin), max(self.end, other.end))
+
+
+@dataclass
+class Sensor:
+    own_x: int
+    own_y: int
+    beacon_x: int
+    beacon_y: int
+    distance: int
+
+    def __init__(self, own_x, own_y, beacon_x, beacon_y):
+        self.own_x = own_x
+        self.own_y = own_y
+        self.beacon_x = beacon_x
+        self.beacon_y = beacon_y
+        self.distance = distance(own_x, own_y, beacon_x, beacon_y)
+
+
+NUMBER_PATTERN = re.compile(r'-?\d+')
+
+
+def parse_sensor(line):
+    digits_groups = [(a.start(), a.end()) for a in NUMBER_PATTERN.finditer(line)]
+    numbers = []
+    for i in range(4):
+        begin = digits_groups[i][0]
+        end = digits_groups[i][1]
+        numbers.append(int(line[begin:end]))
+    return Sensor(*numbers)
+
+
+def read_sensors(fname):
+    return [Sensor(*numbers[:4]) for numbers in iter_ints(resolve(__file__, fname), signed=True)]
+
+
+@hot
+def append_range(others, new_range):
+    while True:
+        for i, other in enumerate(others):
+            if new_range.overlap(other):
+                new_range = new_range.join(other)
+                del others[i]
+                break
+        else:
+            others.append(new_range)
+            return others
+
+
+@hot
+def get_ranges_from_line(sensors, y, max_coord=None):
+    ranges = []
+    for sensor in sensors:
+        y_distance = abs(sensor.own_y - y)
+        max_x_distance = sensor.distance - y_distance
+        if max_x_distance >= 0:
+            begin = sensor.own_x - max_x_distance
+            end = sensor.own_x + max_x_distance
+            if max_coord is not None:
+                begin = max(0, begin)
+                end = min(max_coord, end)
+                if end <= begin:
+                    continue
+            new_range = Range(begin, end)
+            append_range(ranges, new_range)
+            if max_coord is not None:
+                if len(ranges) == 1 and ranges[0].begin == 0 and ranges[0].end == max_coord:
+                    break
+    return ranges
+
+
+def count_points_in_line(sensors, y):
+    ranges = get_ranges_from_line(sensors, y)
+    return sum(r.end - r.begin for r in ranges)
+
+
+def find_freq(sensors, max_coord):
+    for y in range(max_coord + 1):
+        ranges = get_ranges_from_line(sensors, y, max_coord)
+        if len(ranges) == 2:
+            ranges.sort(key=lambda r: r.begin)
+            return (ranges[0].end + 1) * 4000000 + y
+
+
+def solve_sensors(sensors, y, max_coord):
+    return count_points_in_line(sensors, y), find_freq(sensors, max_coord)
+
+
+def solve_stream(lines, y, max_coord):
+    """Both parts scan every sensor many times, so the sensors are kept"""
+    return solve_sensors([Sensor(*n[:4]) for n in ints_of_lines(as_lines(lines), signed=True)], y, max_coord)
+
+
+def solve_file(fname, y, max_coord):
+    return solve_sensors(read_sensors(fname), y, max_coord)
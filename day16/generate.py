@@ -0,0 +1,42 @@
+from math import log2
+from string import ascii_uppercase
+
+START = "AA"
+
+
+def generate(scale, rng):
+    """
+    60 valves per scale unit. Search is exponential in the number of valves with flow,
+    so it grows only logarithmically: 15 valves with flow at scale 1.
+    Like in the puzzle input, the valves with flow are joined by corridors of valves without flow,
+    so only some of them can be opened in time.
+    """
+    count = min(len(ascii_uppercase) ** 2, max(2, int(60 * scale)))
+    names = [a + b for a in ascii_uppercase for b in ascii_uppercase if a + b != START]
+    names = [START] + rng.sample(names, count - 1)
+    with_flow = max(1, min(count - 1, int(15 + 2 * log2(scale)) if scale >= 1 else int(15 * scale)))
+    rooms, corridor_valves = names[:with_flow + 1], names[with_flow + 1:]
+    flows = {name: 0 for name in names}
+    flows.update((name, rng.randint(1, 25)) for name in rooms[1:])
+
+    edges = [(rooms[i], rooms[rng.randrange(i)]) for i in range(1, len(rooms))]
+    for _ in range(len(rooms) // 4):
+        edges.append(tuple(rng.sample(rooms, 2)))
+    corridors = [[] for _ in edges]
+    for name in corridor_valves:
+        corridors[rng.randrange(len(edges))].append(name)
+
+    tunnels = {name: set() for name in names}
+    for (a, b), corridor in zip(edges, corridors):
+        path = [a, *corridor, b]
+        for x, y in zip(path, path[1:]):
+            tunnels[x].add(y)
+            tunnels[y].add(x)
+
+    rng.shuffle(names)
+    for name in names:
+        children = sorted(tunnels[name])
+        if len(children) == 1:
+            yield f"Valve {name} has flow rate={flows[name]}; tunnel leads to valve {children[0]}"
+        else:
+            yield f"Valve {name} has flow rate={flows[name]}; tunnels lead to valves {', '.join(children)}"
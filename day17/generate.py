@@ -0,0 +1,3 @@
+def generate(scale, rng):
+    """10091 jets per scale unit"""
+    yield "".join(rng.choice("<>") for _ in range(max(1, int(10091 * scale))))
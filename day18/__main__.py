@@ -1,88 +1,10 @@
-
-from os import path
 import unittest
 
-
-def parse_point(string):
-    coords = [int(s) for s in string.split(",")]
-    return coords[0], coords[1], coords[2]
-
-
-def read_points(fname):
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        return [parse_point(line.strip()) for line in file]
-
-
-def is_connected(point_a, point_b):
-    diff = [abs(x_a - x_b) for x_a, x_b in zip(point_a, point_b)]
-    return sum(diff) == 1
-
-
-def count_connections(points):
-    connections = 0
-    for i, point in enumerate(points):
-        for other in points[i+1:]:
-            if is_connected(point, other):
-                connections += 2
-    return connections
-
-
-def count_out_surface(points):
-    return 6 * len(points) - count_connections(points)
-
-
-def get_neighbors(point):
-    return (
-        (point[0] + 1, point[1], point[2]),
-        (point[0] - 1, point[1], point[2]),
-        (point[0], point[1] + 1, point[2]),
-        (point[0], point[1] - 1, point[2]),
-        (point[0], point[1], point[2] + 1),
-        (point[0], point[1], point[2] - 1),
-    )
-
-
-def visit(start, marked, points, maxs):
-    stack = [start]
-    while len(stack) > 0:
-        cur = stack.pop()
-        invalid = False
-        for dems in range(3):
-            if cur[dems] < 0 or cur[dems] > maxs[dems]:
-                invalid = True
-                break
-        if invalid or cur in points or cur in marked:
-            continue
-        marked.add(cur)
-        stack.extend(get_neighbors(cur))
-
-
-def get_surrounded(points):
-    maxs = [max(p[i] for p in points) for i in range(3)]
-    marked = set()
-    visit((0, 0, 0), marked, points, maxs)
-    result = []
-    for i in range(maxs[0] + 1):
-        for j in range(maxs[1] + 1):
-            for k in range(maxs[2] + 1):
-                p = (i, j, k)
-                if p in marked or p in points:
-                    continue
-                result.append(p)
-    return result
-
-
-def count_in_surface(points):
-    surrounded = get_surrounded(points)
-    return count_out_surface(surrounded)
-
-
-def solve_file(fname):
-    points = read_points(fname)
-    out_surface = count_out_surface(points)
-    in_surface = count_in_surface(points)
-    return out_surface, out_surface - in_surface
+from aoc.inputs import resolve
+from day18.solver import (
+    count_connections, count_in_surface, count_out_surface, get_surrounded, is_connected, read_points, solve_file,
+    solve_stream,
+)
 
 
 class TestDay(unittest.TestCase):
@@ -128,6 +50,10 @@ class TestDay(unittest.TestCase):
         actual = get_surrounded(self.POINTS)
         self.assertEqual(actual, [(2, 2, 5)])
 
+    def test_solve_stream(self):
+        with open(resolve(__file__, "input-test.txt"), "r", encoding="utf-8") as file:
+            self.assertEqual(solve_stream(file), (64, 58))
+
 
 if __name__ == '__main__':
     print(solve_file("input.txt"))
@@ -0,0 +1,9 @@
+def generate(scale, rng):
+    """2900 cubes per scale unit in a box that grows with scale, so the density stays about the same"""
+    count = max(1, int(2900 * scale))
+    side = max(2, round((count * 3) ** (1 / 3)))
+    points = set()
+    while len(points) < count:
+        points.add((rng.randint(1, side), rng.randint(1, side), rng.randint(1, side)))
+    for point in points:
+        yield ",".join(map(str, point))
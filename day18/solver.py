@@ -0,0 +1,104 @@
+from aoc.inputs import as_lines, ints_of_lines, iter_ints, resolve
+from aoc.instrument import hot
+from aoc.search import INF, bfs
+
+
+def parse_point(string):
+    coords = [int(s) for s in string.split(",")]
+    return coords[0], coords[1], coords[2]
+
+
+def read_points(fname):
+    return [numbers for numbers in iter_ints(resolve(__file__, fname)) if numbers]
+
+
+def is_connected(point_a, point_b):
+    diff = [abs(x_a - x_b) for x_a, x_b in zip(point_a, point_b)]
+    return sum(diff) == 1
+
+
+@hot
+def count_connections(points):
+    connections = 0
+    for i, point in enumerate(points):
+        for other in points[i+1:]:
+            if is_connected(point, other):
+                connections += 2
+    return connections
+
+
+def count_out_surface(points):
+    return 6 * len(points) - count_connections(points)
+
+
+def get_neighbors(point):
+    return (
+        (point[0] + 1, point[1], point[2]),
+        (point[0] - 1, point[1], point[2]),
+        (point[0], point[1] + 1, point[2]),
+        (point[0], point[1] - 1, point[2]),
+        (point[0], point[1], point[2] + 1),
+        (point[0], point[1], point[2] - 1),
+    )
+
+
+def is_inside(point, maxs):
+    return all(0 <= point[dems] <= maxs[dems] for dems in range(3))
+
+
+@hot
+def visit(start, points, maxs):
+    """Distances from start to every cell of the [0, maxs] box reachable around the points, by cell id"""
+    sizes = [m + 1 for m in maxs]
+
+    def to_id(point):
+        return (point[0] * sizes[1] + point[1]) * sizes[2] + point[2]
+
+    def to_point(node):
+        rest, z = divmod(node, sizes[2])
+        x, y = divmod(rest, sizes[1])
+        return x, y, z
+
+    def neighbours(node):
+        for other in get_neighbors(to_point(node)):
+            if is_inside(other, maxs) and other not in points:
+                yield to_id(other)
+
+    sources = [] if start in points else [to_id(start)]
+    return bfs(sizes[0] * sizes[1] * sizes[2], sources, neighbours).distances, to_id
+
+
+@hot
+def get_surrounded(points):
+    points = set(points)
+    maxs = [max(p[i] for p in points) for i in range(3)]
+    distances, to_id = visit((0, 0, 0), points, maxs)
+    result = []
+    for i in range(maxs[0] + 1):
+        for j in range(maxs[1] + 1):
+            for k in range(maxs[2] + 1):
+                p = (i, j, k)
+                if distances[to_id(p)] != INF or p in points:
+                    continue
+                result.append(p)
+    return result
+
+
+def count_in_surface(points):
+    surrounded = get_surrounded(points)
+    return count_out_surface(surrounded)
+
+
+def solve_points(points):
+    out_surface = count_out_surface(points)
+    in_surface = count_in_surface(points)
+    return out_surface, out_surface - in_surface
+
+
+def solve_stream(lines):
+    """The surfaces need the whole droplet, so memory grows with the number of cubes"""
+    return solve_points([numbers for numbers in ints_of_lines(as_lines(lines)) if numbers])
+
+
+def solve_file(fname):
+    return solve_points(read_points(fname))
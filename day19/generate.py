@@ -0,0 +1,10 @@
+def generate(scale, rng):
+    """30 blueprints per scale unit"""
+    for i in range(max(1, int(30 * scale))):
+        yield (
+            f"Blueprint {i + 1}: "
+            f"Each ore robot costs {rng.randint(2, 4)} ore. "
+            f"Each clay robot costs {rng.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. "
+            f"Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} obsidian."
+        )
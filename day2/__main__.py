@@ -1,104 +1,10 @@
-from os import path
-from enum import Enum
 import unittest
 
-
-class Outcome(Enum):
-    WIN = ("Z", 6)
-    DRAW = ("Y", 3)
-    LOSE = ("X", 0)
-
-    def __init__(self, code, points):
-        super().__init__()
-        self.code = code
-        self.points = points
-
-    @staticmethod
-    def from_code(code):
-        for outcome in Outcome:
-            if outcome.code == code:
-                return outcome
-        raise Exception(f"Unknown code {code}")
-
-
-class Shape(Enum):
-    """
-    Rock       A   X   1
-    Paper      B   Y   2
-    Scissors   C   Z   3
-    """
-    ROCK = ('A', 'X', 'Z', 1)
-    PAPER = ('B', 'Y', 'X', 2)
-    SCISSORS = ('C', 'Z', 'Y', 3)
-
-    def __init__(self, opponent_code, my_code, defeats_code, score):
-        self.opponent_code = opponent_code
-        self.my_code = my_code
-        self.defeats_code = defeats_code
-        self.score = score
-
-    @staticmethod
-    def from_my_code(code):
-        for shape in Shape:
-            if shape.my_code == code:
-                return shape
-        raise Exception(f"Unknown my code {code}")
-
-    @staticmethod
-    def from_opponent_code(code):
-        for shape in Shape:
-            if shape.opponent_code == code:
-                return shape
-        raise Exception(f"Unknown opponent code {code}")
-
-    def get_outcome(self, opponent_shape):
-        if self == opponent_shape:
-            return Outcome.DRAW
-        if self.defeats_code == opponent_shape.my_code:
-            return Outcome.WIN
-        return Outcome.LOSE
-
-
-def get_shape_from_opponent_code_and_outcome(opponent_shape, outcome):
-    for shape in Shape:
-        if shape.get_outcome(opponent_shape) == outcome:
-            return shape
-    raise Exception("Unexpected state")
-
-
-def score_pair_part1(opponent_code, my_code):
-    my_shape = Shape.from_my_code(my_code)
-    opponent_shape = Shape.from_opponent_code(opponent_code)
-    outcome = my_shape.get_outcome(opponent_shape)
-    return my_shape.score + outcome.points
-
-
-def score_pair_part2(opponent_code, outcome_code):
-    opponent_shape = Shape.from_opponent_code(opponent_code)
-    outcome = Outcome.from_code(outcome_code)
-    my_shape = get_shape_from_opponent_code_and_outcome(
-        opponent_shape, outcome)
-    return my_shape.score + outcome.points
-
-
-def score_part1(list_of_pairs):
-    return sum(score_pair_part1(*p) for p in list_of_pairs)
-
-
-def score_part2(list_of_pairs):
-    return sum(score_pair_part2(*p) for p in list_of_pairs)
-
-
-def read_paris(fname):
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        for s in file:
-            yield [s[0], s[2]]
-
-
-def score_file(fname):
-    pairs = list(read_paris(fname))
-    return score_part1(pairs), score_part2(pairs)
+from aoc.inputs import resolve
+from day2.solver import (
+    Game, Outcome, Shape, count_rounds, np, read_paris, score_counts, score_file, score_pair_part1, score_pair_part2,
+    score_part1, score_part2, score_table, solve_stream,
+)
 
 
 class TestDay(unittest.TestCase):
@@ -153,6 +59,62 @@ class TestDay(unittest.TestCase):
     def test_score_file(self):
         self.assertEqual(score_file("input-test.txt"), (15, 12))
 
+    def test_solve_stream(self):
+        with open(resolve(__file__, "input-test.txt"), "r", encoding="utf-8") as file:
+            self.assertEqual(solve_stream(file), (15, 12))
+
+    def test_score_table(self):
+        table = score_table()
+        self.assertEqual(len(table), 9)
+        self.assertEqual(table[b"A Y"], (8, 4))
+        self.assertEqual(table[b"C Z"], (6, 7))
+
+    def test_count_rounds(self):
+        data = b"A Y\nB X\r\nC Z\nA Y"
+        for chunk_size in [1, 3, 4, 5, 100]:
+            self.assertEqual(count_rounds(data, chunk_size), {b"A Y": 2, b"B X": 1, b"C Z": 1})
+        self.assertEqual(score_counts(count_rounds(data)), (23, 16))
+
+    def test_count_rounds_unexpected_line(self):
+        with self.assertRaises(Exception):
+            count_rounds(b"A Y\nD X\n")
+
+
+class TestGame(unittest.TestCase):
+    ROUNDS = [b"A Y", b"B X", b"C Z", b"A Y"]
+
+    def test_classic_game_matches_score_table(self):
+        game = Game.named("rps")
+        for pattern, scores in score_table().items():
+            self.assertEqual(game.score_counts({(pattern[0], pattern[2]): 1}), scores)
+
+    def test_every_shape_beats_half_of_the_others(self):
+        game = Game.named("rpsls")
+        for mine in range(game.size):
+            outcomes = [game.outcome(mine, opponent) for opponent in range(game.size)]
+            self.assertEqual(outcomes.count(Outcome.WIN), 2)
+            self.assertEqual(outcomes.count(Outcome.LOSE), 2)
+            for opponent in range(game.size):
+                self.assertEqual(game.outcome(game.respond(opponent, Outcome.WIN), opponent), Outcome.WIN)
+                self.assertEqual(game.outcome(game.respond(opponent, Outcome.LOSE), opponent), Outcome.LOSE)
+
+    def test_score_lines(self):
+        self.assertEqual(Game.named("rps").score_lines(self.ROUNDS), (23, 16))
+        self.assertEqual(Game.named("rpsls").score_lines(["A V", "B V", "C X", "E Z"]), (19, None))
+        with self.assertRaises(Exception):
+            Game.named("rps").score_lines(["A V"])
+
+    def test_even_number_of_shapes(self):
+        with self.assertRaises(Exception):
+            Game("AB", "XY")
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_score_buffer(self):
+        game = Game.named("rps")
+        self.assertEqual(game.score_buffer(b"\n".join(self.ROUNDS)), (23, 16))
+        self.assertEqual(game.score_buffer(b"\r\n".join(self.ROUNDS) + b"\r\n"), (23, 16))
+        self.assertEqual(game.score_file("input-test.txt"), (15, 12))
+
 
 if __name__ == '__main__':
     print(score_file("input.txt"))
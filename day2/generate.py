@@ -0,0 +1,4 @@
+def generate(scale, rng):
+    """2500 rounds per scale unit"""
+    for _ in range(max(1, int(2500 * scale))):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
@@ -0,0 +1,239 @@
+from collections import Counter
+from enum import Enum
+from functools import lru_cache
+
+from aoc.inputs import as_lines, iter_lines, open_buffer, optional_numpy, resolve
+from aoc.instrument import hot
+
+np = optional_numpy()
+
+CHUNK_SIZE = 16 << 20
+PATTERN_SIZE = 3
+GAMES = {
+    "rps": ("ABC", "XYZ"),
+    "rpsls": ("ABCDE", "VWXYZ"),
+}
+
+
+class Outcome(Enum):
+    WIN = ("Z", 6)
+    DRAW = ("Y", 3)
+    LOSE = ("X", 0)
+
+    def __init__(self, code, points):
+        super().__init__()
+        self.code = code
+        self.points = points
+
+    @staticmethod
+    def from_code(code):
+        for outcome in Outcome:
+            if outcome.code == code:
+                return outcome
+        raise Exception(f"Unknown code {code}")
+
+
+class Shape(Enum):
+    """
+    Rock       A   X   1
+    Paper      B   Y   2
+    Scissors   C   Z   3
+    """
+    ROCK = ('A', 'X', 'Z', 1)
+    PAPER = ('B', 'Y', 'X', 2)
+    SCISSORS = ('C', 'Z', 'Y', 3)
+
+    def __init__(self, opponent_code, my_code, defeats_code, score):
+        self.opponent_code = opponent_code
+        self.my_code = my_code
+        self.defeats_code = defeats_code
+        self.score = score
+
+    @staticmethod
+    def from_my_code(code):
+        for shape in Shape:
+            if shape.my_code == code:
+                return shape
+        raise Exception(f"Unknown my code {code}")
+
+    @staticmethod
+    def from_opponent_code(code):
+        for shape in Shape:
+            if shape.opponent_code == code:
+                return shape
+        raise Exception(f"Unknown opponent code {code}")
+
+    def get_outcome(self, opponent_shape):
+        if self == opponent_shape:
+            return Outcome.DRAW
+        if self.defeats_code == opponent_shape.my_code:
+            return Outcome.WIN
+        return Outcome.LOSE
+
+
+def get_shape_from_opponent_code_and_outcome(opponent_shape, outcome):
+    for shape in Shape:
+        if shape.get_outcome(opponent_shape) == outcome:
+            return shape
+    raise Exception("Unexpected state")
+
+
+@hot
+def score_pair_part1(opponent_code, my_code):
+    my_shape = Shape.from_my_code(my_code)
+    opponent_shape = Shape.from_opponent_code(opponent_code)
+    outcome = my_shape.get_outcome(opponent_shape)
+    return my_shape.score + outcome.points
+
+
+@hot
+def score_pair_part2(opponent_code, outcome_code):
+    opponent_shape = Shape.from_opponent_code(opponent_code)
+    outcome = Outcome.from_code(outcome_code)
+    my_shape = get_shape_from_opponent_code_and_outcome(
+        opponent_shape, outcome)
+    return my_shape.score + outcome.points
+
+
+def score_part1(list_of_pairs):
+    return sum(score_pair_part1(*p) for p in list_of_pairs)
+
+
+def score_part2(list_of_pairs):
+    return sum(score_pair_part2(*p) for p in list_of_pairs)
+
+
+@lru_cache(maxsize=None)
+def score_table():
+    """Scores of both parts for each of the nine possible rounds, keyed by the round as written: b"A X" """
+    return {
+        f"{shape.opponent_code} {code}".encode(): (
+            score_pair_part1(shape.opponent_code, code), score_pair_part2(shape.opponent_code, code)
+        )
+        for shape in Shape for code in "XYZ"
+    }
+
+
+def score_counts(counts):
+    """counts: number of rounds by pattern"""
+    table = score_table()
+    if any(pattern not in table for pattern in counts):
+        raise Exception(f"Unknown rounds {[p for p in counts if p not in table]}")
+    return tuple(sum(table[pattern][part] * count for pattern, count in counts.items()) for part in range(2))
+
+
+@hot
+def count_rounds(buffer, chunk_size=CHUNK_SIZE):
+    """
+    Occurrences of every round pattern in the raw bytes. Chunks overlap by PATTERN_SIZE - 1 bytes,
+    so a pattern crossing a chunk border is counted once, in the chunk where it starts.
+    """
+    counts = Counter()
+    newlines = 0
+    size = len(buffer)
+    for start in range(0, size, chunk_size):
+        chunk = buffer[start:start + chunk_size + PATTERN_SIZE - 1]
+        newlines += chunk.count(b"\n", 0, chunk_size)
+        for pattern in score_table():
+            counts[pattern] += chunk.count(pattern)
+    lines = newlines + (1 if size and buffer[size - 1:size] != b"\n" else 0)
+    if sum(counts.values()) != lines:
+        raise Exception(f"Expected one round per line, found {sum(counts.values())} rounds in {lines} lines")
+    return +counts
+
+
+def parse_pairs(lines):
+    for s in lines:
+        yield [chr(s[0]), chr(s[2])]
+
+
+def read_paris(fname):
+    return parse_pairs(iter_lines(resolve(__file__, fname)))
+
+
+def solve_stream(lines):
+    return score_counts(Counter(line[:PATTERN_SIZE] for line in as_lines(lines)))
+
+
+def score_file(fname):
+    with open_buffer(resolve(__file__, fname)) as buffer:
+        return score_counts(count_rounds(buffer))
+
+
+class Game:
+    """
+    Cyclic game of n shapes (n odd): each shape beats the (n - 1) / 2 shapes before it in the cycle, which is
+    rock, paper, scissors for n = 3. Codes give the shapes in cycle order, shape scores default to 1..n.
+    In part 2 the second column is an Outcome code: the next shape in the cycle wins, the previous one loses.
+    """
+
+    def __init__(self, opponent_codes, my_codes, shape_scores=None):
+        if len(opponent_codes) % 2 == 0 or len(opponent_codes) != len(my_codes):
+            raise Exception(f"Expected an odd number of shapes, got {opponent_codes} and {my_codes}")
+        self.size = len(opponent_codes)
+        self.shape_scores = shape_scores or list(range(1, self.size + 1))
+        self.opponent_index = {ord(code): i for i, code in enumerate(opponent_codes)}
+        self.my_index = {ord(code): i for i, code in enumerate(my_codes)}
+        self.outcomes = {ord(outcome.code): outcome for outcome in Outcome}
+        self.part1 = [[self.score(mine, opponent) for mine in range(self.size)] for opponent in range(self.size)]
+        self.part2 = [{code: self.score(self.respond(opponent, outcome), opponent)
+                       for code, outcome in self.outcomes.items()} for opponent in range(self.size)]
+
+    @staticmethod
+    def named(name):
+        return Game(*GAMES[name])
+
+    def outcome(self, mine, opponent):
+        difference = (mine - opponent) % self.size
+        if difference == 0:
+            return Outcome.DRAW
+        return Outcome.WIN if difference <= self.size // 2 else Outcome.LOSE
+
+    def respond(self, opponent, outcome):
+        return (opponent + {Outcome.WIN: 1, Outcome.DRAW: 0, Outcome.LOSE: -1}[outcome]) % self.size
+
+    def score(self, mine, opponent):
+        return self.shape_scores[mine] + self.outcome(mine, opponent).points
+
+    def score_counts(self, counts):
+        """
+        counts: rounds by (opponent code, second code) byte values. Returns the scores of both parts,
+        part 2 is None when the second column is not made of Outcome codes only.
+        """
+        part1 = part2 = 0
+        for (opponent_code, code), count in counts.items():
+            if opponent_code not in self.opponent_index or code not in self.my_index:
+                raise Exception(f"Unknown round {chr(opponent_code)} {chr(code)}")
+            opponent = self.opponent_index[opponent_code]
+            part1 += self.part1[opponent][self.my_index[code]] * count
+            if part2 is not None:
+                part2 = part2 + self.part2[opponent][code] * count if code in self.outcomes else None
+        return part1, part2
+
+    def score_lines(self, lines):
+        return self.score_counts(Counter((line[0], line[2]) for line in as_lines(lines)))
+
+    @hot
+    def score_buffer(self, buffer):
+        """All rounds of the raw bytes, counted by one np.bincount per chunk: the cost per round does not grow with n"""
+        counts = np.zeros(1 << 16, dtype=np.int64)
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        begin = 0
+        while begin < len(data):
+            end = min(len(data), begin + CHUNK_SIZE)
+            if end < len(data):
+                end = buffer.find(b"\n", end) + 1 or len(data)
+            chunk = data[begin:end]
+            starts = np.concatenate(([0], np.flatnonzero(chunk == ord("\n")) + 1))
+            starts = starts[starts + PATTERN_SIZE <= len(chunk)]
+            pairs = chunk[starts].astype(np.int64) << 8 | chunk[starts + 2]
+            counts += np.bincount(pairs, minlength=1 << 16)
+            begin = end
+        return self.score_counts({(int(pair) >> 8, int(pair) & 0xFF): int(counts[pair])
+                                  for pair in np.flatnonzero(counts)})
+
+    def score_file(self, fname):
+        if np is None:
+            return self.score_lines(iter_lines(resolve(__file__, fname)))
+        with open_buffer(resolve(__file__, fname)) as buffer:
+            return self.score_buffer(buffer)
@@ -0,0 +1,6 @@
+def generate(scale, rng):
+    """5000 numbers per scale unit, exactly one of them is zero"""
+    numbers = [rng.choice((-1, 1)) * rng.randint(1, 10000) for _ in range(max(1, int(5000 * scale)) - 1)]
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+    for number in numbers:
+        yield str(number)
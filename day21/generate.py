@@ -0,0 +1,79 @@
+from collections import deque
+from string import ascii_lowercase
+
+ROOT = "root"
+ME = "humn"
+MAX_VALUE = 10 ** 12
+
+
+def generate_name(rng, used):
+    length = 4 if len(used) < 100000 else 6
+    while True:
+        name = "".join(rng.choice(ascii_lowercase) for _ in range(length))
+        if name not in used:
+            used.add(name)
+            return name
+
+
+def split_value(rng, value):
+    """Returns (operation, first, second) so the operation on them gives the value, or None"""
+    options = ["+", "-", "/"]
+    if value > 2:
+        options.append("+")
+    if any(value % d == 0 for d in range(2, 10)) and value > 3:
+        options.append("*")
+    operation = rng.choice(options)
+    if operation == "+" and value > 1:
+        first = rng.randint(1, value - 1)
+        return operation, first, value - first
+    if operation == "-":
+        second = rng.randint(1, 1000)
+        return operation, value + second, second
+    if operation == "*" and value > 3:
+        divider = rng.choice([d for d in range(2, 10) if value % d == 0])
+        return operation, value // divider, divider
+    if operation == "/" and value * 9 < MAX_VALUE:
+        divider = rng.randint(2, 9)
+        return operation, value * divider, divider
+    return None
+
+
+def generate(scale, rng):
+    """
+    About 2000 monkeys per scale unit. Values are built top-down, so every division is exact,
+    and the human is never a divider.
+    """
+    count = max(3, int(2000 * scale))
+    used = {ROOT, ME}
+    monkeys = {}
+    candidates = []
+    todo = deque([(ROOT, rng.randint(1000, 100000), True)])
+    while todo:
+        name, value, may_be_human = todo.popleft()
+        split = split_value(rng, value) if len(monkeys) + len(todo) < count - 1 else None
+        if name == ROOT:
+            first = rng.randint(1, value - 1)
+            split = ("+", first, value - first)
+        if split is None:
+            monkeys[name] = value
+            if may_be_human:
+                candidates.append(name)
+            continue
+        operation, first, second = split
+        first_name, second_name = generate_name(rng, used), generate_name(rng, used)
+        monkeys[name] = (first_name, operation, second_name)
+        todo.append((first_name, first, may_be_human))
+        todo.append((second_name, second, may_be_human and operation != "/"))
+
+    human = rng.choice(candidates)
+
+    def rename(name):
+        return ME if name == human else name
+
+    lines = []
+    for name, body in monkeys.items():
+        if isinstance(body, tuple):
+            body = f"{rename(body[0])} {body[1]} {rename(body[2])}"
+        lines.append(f"{rename(name)}: {body}")
+    rng.shuffle(lines)
+    yield from lines
@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+
+from aoc.inputs import iter_lines, resolve
+from aoc.instrument import hot
+
+
+ROOT = "root"
+ME = "humn"
+
+
+@dataclass
+class Effect:
+    a: int
+    b: int
+
+
+@dataclass
+class NumberMonkey:
+    value: int
+
+    def calc(self, _):
+        return self.value
+
+    def get_effect(self, _, name):
+        if name == ME:
+            return Effect(1, 0)
+        return Effect(0, self.value)
+
+
+@dataclass
+class OperationMonkey():
+    first: str
+    operation: str
+    second: str
+    value: int = None
+    effect: str = None
+
+    @hot
+    def calc(self, data):
+        if self.value is None:
+            first_value = data[self.first].calc(data)
+            second_value = data[self.second].calc(data)
+            if self.operation == "*":
+                self.value = first_value * second_value
+            elif self.operation == "/":
+                self.value = first_value / second_value
+            elif self.operation == "+":
+                self.value = first_value + second_value
+            elif self.operation == "-":
+                self.value = first_value - second_value
+            else:
+                raise Exception(f"Unknown operation {self.operation}")
+        return self.value
+
+    @hot
+    def get_effect(self, data, _):
+        if self.effect is None:
+            first = data[self.first].get_effect(data, self.first)
+            second = data[self.second].get_effect(data, self.second)
+            if self.operation == "+" or self.operation == "-":
+                mul = 1 if self.operation == "+" else -1
+                self.effect = Effect(first.a + second.a * mul, first.b + second.b * mul)
+            elif self.operation == "*" or self.operation == "/":
+                if first.a != 0 and second.a != 0:
+                    raise Exception(f"Cant do powers")
+                if self.operation == "*":
+                    if first.a != 0:
+                        primary = first
+                        secondary = second.b
+                    else:
+                        primary = second
+                        secondary = first.b
+                    self.effect = Effect(primary.a * secondary, primary.b * secondary)
+                else:
+                    if second.a != 0:
+                        raise Exception(f"Cant do powers")
+                    self.effect = Effect(first.a / second.b, first.b / second.b)
+            else:
+                raise Exception(f"Unknown operation {self.operation}")
+        return self.effect
+
+
+def parse_monkey(line):
+    name, body = line.strip().split(": ")
+    body_parts = body.split(" ")
+    if len(body_parts) == 1:
+        return name, NumberMonkey(int(body_parts[0]))
+    else:
+        return name, OperationMonkey(*body_parts)
+
+
+def read_file(fname):
+    result = {}
+    for line in iter_lines(resolve(__file__, fname)):
+        name, monkey = parse_monkey(line.decode())
+        result[name] = monkey
+    return result
+
+
+def find_what_to_yell(data):
+    root = data[ROOT]
+    root_first = data[root.first]
+    root_second = data[root.second]
+
+    first_branch = root_first.get_effect(data, root.first)
+    second_branch = root_second.get_effect(data, root.second)
+
+    if first_branch.a != 0:
+        x_branch = first_branch
+        other_branch = second_branch
+    else:
+        other_branch = first_branch
+        x_branch = second_branch
+    result = (other_branch.b - x_branch.b)/x_branch.a
+    return int(result)
+
+
+def solve_file(fname):
+    data = read_file(fname)
+    p1 = int(data[ROOT].calc(data))
+    p2 = find_what_to_yell(data)
+    return p1, p2
@@ -0,0 +1,30 @@
+CUBE_SIDE = 50
+# 21
+# 3
+# 54
+# 6
+LAYOUT = [" ##", " #", "##", "#"]
+
+
+def generate(scale, rng):
+    """
+    The cube wrapping is hard-coded for 50-sided cube with the fixed layout, so only
+    the path grows with scale: 4000 turns per scale unit.
+    """
+    for sector_row, layout_line in enumerate(LAYOUT):
+        for row in range(CUBE_SIDE):
+            line = ""
+            for sector in layout_line:
+                if sector == " ":
+                    line += " " * CUBE_SIDE
+                else:
+                    line += "".join("#" if rng.random() < 0.05 else "." for _ in range(CUBE_SIDE))
+            if sector_row == 0 and row == 0:
+                line = line[:CUBE_SIDE] + "." + line[CUBE_SIDE + 1:]
+            yield line
+    yield ""
+    commands = [str(rng.randint(1, 50))]
+    for _ in range(max(1, int(4000 * scale))):
+        commands.append(rng.choice("RL"))
+        commands.append(str(rng.randint(1, 50)))
+    yield "".join(commands)
@@ -1,117 +1,9 @@
-from collections import defaultdict
-from enum import Enum
-from os import path
 import unittest
 
-
-class Direction(Enum):
-    N = ((-1, 0), ((-1, -1), (-1, 0), (-1, 1)))
-    S = ((1, 0), ((1, -1), (1, 0), (1, 1)))
-    W = ((0, -1), ((-1, -1), (0, -1), (1, -1)))
-    E = ((0, 1), ((-1, 1), (0, 1), (1, 1)))
-
-    def __init__(self, move_offset, check_offsets):
-        super().__init__()
-        self.move_offset = move_offset
-        self.check_offsets = check_offsets
-
-    @staticmethod
-    def all():
-        return [Direction.N, Direction.S, Direction.W, Direction.E]
-
-
-def read_map(fname):
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    map = set()
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        for i, line in enumerate(file):
-            for j, char in enumerate(line):
-                if char == "#":
-                    map.add((i, j))
-    return map
-
-
-def get_directions(turn):
-    length = len(Direction)
-    return [Direction.all()[(i + turn) % length] for i in range(length)]
-
-
-def get_new_pos(map, pos, directions):
-    canidate = None
-    found = False
-    for direction in directions:
-        if canidate is not None and found:
-            break
-        to_check = [(pos[0] + off[0], pos[1] + off[1])
-                    for off in direction.check_offsets]
-        if any(c in map for c in to_check):
-            found = True
-        elif canidate is None:
-            canidate = (pos[0] + direction.move_offset[0],
-                        pos[1] + direction.move_offset[1])
-    if not found or canidate is None:
-        return pos
-    return canidate
-
-
-def get_bounds(map):
-    min_row, min_col = float("+inf"), float("+inf")
-    max_row, max_col = float("-inf"), float("-inf")
-
-    for pos in map:
-        min_row = min(pos[0], min_row)
-        min_col = min(pos[1], min_col)
-        max_row = max(pos[0], max_row)
-        max_col = max(pos[1], max_col)
-
-    return min_row, max_row, min_col, max_col
-
-
-def score_map(map):
-    min_row, max_row, min_col, max_col = get_bounds(map)
-    size = (max_row - min_row + 1) * (max_col - min_col + 1)
-    return size - len(map)
-
-
-def draw(map):
-    min_row, max_row, min_col, max_col = get_bounds(map)
-    print("----")
-    for row in range(min_row, max_row + 1):
-        line = ""
-        for col in range(min_col, max_col + 1):
-            line += "#" if (row, col) in map else "."
-        print(line)
-    print("----")
-
-
-def do_steps(cur_map, max_round):
-    turn = 0
-    while max_round is None or turn < max_round:
-        new_positions = defaultdict(set)  # new pos -> set of prev pos
-        directions = get_directions(turn)
-        for pos in cur_map:
-            new_pos = get_new_pos(cur_map, pos, directions)
-            new_positions[new_pos].add(pos)
-
-        new_map = set()
-        for new_pos, old in new_positions.items():
-            if len(old) == 1:
-                new_map.add(new_pos)
-            else:
-                new_map.update(old)
-        turn += 1
-        if new_map == cur_map:
-            return cur_map, turn
-        cur_map = new_map
-    return cur_map, max_round
-
-
-def solve_file(fname):
-    init_map = read_map(fname)
-    return (
-        score_map(do_steps(init_map, 10)[0]),
-        do_steps(init_map, None)[1]
-    )
+from aoc.grid import np
+from day23.solver import (
+    Direction, do_steps, do_steps_grid, get_directions, read_grid, read_map, score_grid, score_map, solve_file,
+)
 
 
 class TestDay(unittest.TestCase):
@@ -133,6 +25,17 @@ class TestDay(unittest.TestCase):
     def test_solve_file(self):
         self.assertEqual(solve_file("input-test.txt"), (110, 20))
 
+    def test_do_steps(self):
+        init_map = read_map("input-test.txt")
+        self.assertEqual(score_map(do_steps(init_map, 10)[0]), 110)
+        self.assertEqual(do_steps(init_map, None)[1], 20)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_do_steps_grid(self):
+        init_grid = read_grid("input-test.txt")
+        self.assertEqual(score_grid(do_steps_grid(init_grid, 10)[0]), 110)
+        self.assertEqual(do_steps_grid(init_grid, None)[1], 20)
+
 
 if __name__ == '__main__':
     print(solve_file("input.txt"))
@@ -0,0 +1,8 @@
+from math import sqrt
+
+
+def generate(scale, rng):
+    """A square of 70 * sqrt(scale) per side, about a half of it covered by elves"""
+    side = max(2, int(70 * sqrt(scale)))
+    for _ in range(side):
+        yield "".join("#" if rng.random() < 0.5 else "." for _ in range(side))
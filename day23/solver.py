@@ -0,0 +1,177 @@
+from collections import defaultdict
+from enum import Enum
+
+from aoc.grid import OFFSETS_8, Grid, np, shift
+from aoc.inputs import iter_lines, resolve
+from aoc.instrument import hot
+
+
+ELF = ord("#")
+MARGIN = 10
+
+
+class Direction(Enum):
+    N = ((-1, 0), ((-1, -1), (-1, 0), (-1, 1)))
+    S = ((1, 0), ((1, -1), (1, 0), (1, 1)))
+    W = ((0, -1), ((-1, -1), (0, -1), (1, -1)))
+    E = ((0, 1), ((-1, 1), (0, 1), (1, 1)))
+
+    def __init__(self, move_offset, check_offsets):
+        super().__init__()
+        self.move_offset = move_offset
+        self.check_offsets = check_offsets
+
+    @staticmethod
+    def all():
+        return [Direction.N, Direction.S, Direction.W, Direction.E]
+
+
+def read_map(fname):
+    map = set()
+    for i, line in enumerate(iter_lines(resolve(__file__, fname))):
+        for j, char in enumerate(line):
+            if char == ELF:
+                map.add((i, j))
+    return map
+
+
+def get_directions(turn):
+    length = len(Direction)
+    return [Direction.all()[(i + turn) % length] for i in range(length)]
+
+
+@hot
+def get_new_pos(map, pos, directions):
+    canidate = None
+    found = False
+    for direction in directions:
+        if canidate is not None and found:
+            break
+        to_check = [(pos[0] + off[0], pos[1] + off[1])
+                    for off in direction.check_offsets]
+        if any(c in map for c in to_check):
+            found = True
+        elif canidate is None:
+            canidate = (pos[0] + direction.move_offset[0],
+                        pos[1] + direction.move_offset[1])
+    if not found or canidate is None:
+        return pos
+    return canidate
+
+
+def get_bounds(map):
+    min_row, min_col = float("+inf"), float("+inf")
+    max_row, max_col = float("-inf"), float("-inf")
+
+    for pos in map:
+        min_row = min(pos[0], min_row)
+        min_col = min(pos[1], min_col)
+        max_row = max(pos[0], max_row)
+        max_col = max(pos[1], max_col)
+
+    return min_row, max_row, min_col, max_col
+
+
+def score_map(map):
+    min_row, max_row, min_col, max_col = get_bounds(map)
+    size = (max_row - min_row + 1) * (max_col - min_col + 1)
+    return size - len(map)
+
+
+def draw(map):
+    min_row, max_row, min_col, max_col = get_bounds(map)
+    print("----")
+    for row in range(min_row, max_row + 1):
+        line = ""
+        for col in range(min_col, max_col + 1):
+            line += "#" if (row, col) in map else "."
+        print(line)
+    print("----")
+
+
+@hot
+def do_steps(cur_map, max_round):
+    turn = 0
+    while max_round is None or turn < max_round:
+        new_positions = defaultdict(set)  # new pos -> set of prev pos
+        directions = get_directions(turn)
+        for pos in cur_map:
+            new_pos = get_new_pos(cur_map, pos, directions)
+            new_positions[new_pos].add(pos)
+
+        new_map = set()
+        for new_pos, old in new_positions.items():
+            if len(old) == 1:
+                new_map.add(new_pos)
+            else:
+                new_map.update(old)
+        turn += 1
+        if new_map == cur_map:
+            return cur_map, turn
+        cur_map = new_map
+    return cur_map, max_round
+
+
+def read_grid(fname):
+    return Grid.parse(iter_lines(resolve(__file__, fname)), {"#": 1}).data.astype(bool)
+
+
+def ensure_margin(elves):
+    if elves[0].any() or elves[-1].any() or elves[:, 0].any() or elves[:, -1].any():
+        return np.pad(elves, MARGIN)
+    return elves
+
+
+@hot
+def do_steps_grid(elves, max_round):
+    """
+    Same rounds as do_steps over a boolean mask. Only elves coming from opposite sides
+    can propose the same cell, so a cell with two arrivals cancels both moves.
+    """
+    turn = 0
+    while max_round is None or turn < max_round:
+        elves = ensure_margin(elves)
+        occupied = {offset: shift(elves, *offset, False) for offset in OFFSETS_8}
+        candidates = elves & np.logical_or.reduce(list(occupied.values()))
+        proposals = {}
+        for direction in get_directions(turn):
+            blocked = np.logical_or.reduce([occupied[offset] for offset in direction.check_offsets])
+            proposals[direction] = candidates & ~blocked
+            candidates &= blocked
+
+        arrivals = sum(shift(p, -d.move_offset[0], -d.move_offset[1], False).astype(np.uint8)
+                       for d, p in proposals.items())
+        conflicts = arrivals > 1
+        moved_from = np.zeros_like(elves)
+        moved_to = np.zeros_like(elves)
+        for direction, proposal in proposals.items():
+            row, col = direction.move_offset
+            valid = proposal & ~shift(conflicts, row, col, False)
+            moved_from |= valid
+            moved_to |= shift(valid, -row, -col, False)
+        turn += 1
+        if not moved_from.any():
+            return elves, turn
+        elves = (elves & ~moved_from) | moved_to
+    return elves, max_round
+
+
+def score_grid(elves):
+    rows = np.flatnonzero(elves.any(axis=1))
+    cols = np.flatnonzero(elves.any(axis=0))
+    size = (rows[-1] - rows[0] + 1) * (cols[-1] - cols[0] + 1)
+    return int(size - elves.sum())
+
+
+def solve_file(fname):
+    if np is not None:
+        init_grid = read_grid(fname)
+        return (
+            score_grid(do_steps_grid(init_grid, 10)[0]),
+            do_steps_grid(init_grid, None)[1]
+        )
+    init_map = read_map(fname)
+    return (
+        score_map(do_steps(init_map, 10)[0]),
+        do_steps(init_map, None)[1]
+    )
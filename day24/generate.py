@@ -0,0 +1,20 @@
+from math import sqrt
+
+
+def generate(scale, rng):
+    """
+    The valley is 25 x 120 per scale unit of area. Sides are multiples of 5 x 24,
+    so the blizzard period grows linearly with the side instead of jumping to the product of the sides.
+    Start and finish columns have no vertical blizzards, as in the puzzle input.
+    """
+    factor = max(1, round(5 * sqrt(scale)))
+    height, width = 5 * factor, 24 * factor
+    start_col, final_col = 1, width
+    yield "#." + "#" * width
+    for _ in range(height):
+        line = []
+        for col in range(1, width + 1):
+            chars = "<>" if col in (start_col, final_col) else "<>^v"
+            line.append(rng.choice(chars) if rng.random() < 0.5 else ".")
+        yield "#" + "".join(line) + "#"
+    yield "#" * width + ".#"
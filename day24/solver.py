@@ -0,0 +1,135 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from math import gcd
+
+from aoc.inputs import iter_lines, resolve
+from aoc.instrument import hot
+from aoc.search import time_expanded_bfs
+
+
+OFFSETS = {
+    "<": (0, -1),
+    "^": (-1, 0),
+    "+": (0, 0),
+    ">": (0, 1),
+    "v": (1, 0),
+}
+
+
+@dataclass
+class BlizzardStore:
+    states: list[dict[tuple[int, int], list[str]]]
+    period: int
+
+    def __init__(self, field, first_value):
+        self.states = [first_value]
+        self.period = lcm(field.width - 2, field.height - 2)
+        for _ in range(self.period - 1):
+            self.states.append(self._get_next_blizzards(field, self.states[-1]))
+
+    @hot
+    def _get_next_blizzards(self, field, current):
+        result = defaultdict(list)
+        for pos, chars in current.items():
+            for char in chars:
+                next_pos = self._get_next_blizzard_pos(pos, char, field)
+                result[next_pos].append(char)
+        return result
+
+    @staticmethod
+    def _get_next_blizzard_pos(pos, char, field):
+        offset = OFFSETS[char]
+        candidate = (pos[0] + offset[0], pos[1] + offset[1])
+        if field.is_open(candidate):
+            return candidate
+        if char == '>':
+            return pos[0], 1
+        if char == '<':
+            return pos[0], field.width - 2
+        if char == '^':
+            return field.height - 2, pos[1]
+        if char == 'v':
+            return 1, pos[1]
+        raise Exception(f"Unexpected char {char}")
+
+
+@dataclass
+class Field:
+    height: int
+    width: int
+    start_col: int
+    final_col: int
+
+    def is_open(self, pos):
+        row, col = pos
+        if col <= 0 or col >= self.width - 1:
+            return False
+        if row == 0:
+            return col == self.start_col
+        if row == self.height - 1:
+            return col == self.final_col
+        if row < 0 or row >= self.height:
+            return False
+        return True
+
+
+def parse_field(lines):
+    return Field(
+        height=len(lines),
+        width=len(lines[0]),
+        start_col=lines[0].index("."),
+        final_col=lines[-1].index("."),
+    )
+
+
+def parse_blizzards(lines, field):
+    blizzards = defaultdict(list)
+    for row, line in enumerate(lines[1:-1]):
+        for col, char in enumerate(line[1:-1]):
+            if char == ".":
+                continue
+            blizzards[(row + 1, col + 1)].append(char)
+    return BlizzardStore(field, blizzards)
+
+
+@hot
+def solve(field, start, finish, b_period, bs):
+    """Steps from start to finish, starting at the b_period phase of blizzards"""
+    width = field.width
+
+    def moves(node, time):
+        pos = divmod(node, width)
+        next_blizzards = bs.states[(time + 1) % bs.period]
+        for offset in OFFSETS.values():
+            move = (pos[0] + offset[0], pos[1] + offset[1])
+            if field.is_open(move) and not next_blizzards.get(move):
+                yield move[0] * width + move[1]
+
+    steps = time_expanded_bfs(
+        field.height * width, bs.period, [start[0] * width + start[1]], {finish[0] * width + finish[1]},
+        moves, b_period
+    )
+    return float("+inf") if steps is None else steps
+
+
+def read_lines(fname):
+    return [line.decode() for line in iter_lines(resolve(__file__, fname))]
+
+
+def solve_file(fname):
+    lines = read_lines(fname)
+    field = parse_field(lines)
+    bs = parse_blizzards(lines, field)
+
+    orig_start = (0, field.start_col)
+    orig_finish = (field.height - 1, field.final_col)
+
+    p1 = solve(field, orig_start, orig_finish, 0, bs)
+
+    p2 = p1 + solve(field, orig_finish, orig_start, p1 % bs.period, bs)
+    p2 += solve(field, orig_start, orig_finish, p2 % bs.period, bs)
+    return p1, p2
+
+
+def lcm(a, b):
+    return (a * b) // gcd(a, b)
@@ -1,80 +1,7 @@
 import unittest
-from dataclasses import dataclass
-from os import path
 
-DIGIT_MAPPING = {"2": 2, "1": 1, "0": 0, "-": -1, "=": -2}
-INVERSE_MAPPING = {2: "2", 1: "1", 0: "0", -1: "-", -2: "="}
-
-
-@dataclass
-class SnafuNumber:
-    digits: [int]
-
-    @staticmethod
-    def parse(string):
-        return SnafuNumber([DIGIT_MAPPING[c] for c in string[::-1]])
-
-    def __add__(self, other):
-        result_digits = []
-
-        a, b = self.digits.copy(), other.digits.copy()
-        while len(a) < len(b):
-            a.append(0)
-        while len(b) < len(a):
-            b.append(0)
-        carry = 0
-        for x, y in zip(a, b):
-            s = x + y + carry
-            if -2 <= s <= 2:
-                cur = s
-                carry = 0
-            elif s > 2:
-                cur = s - 5
-                carry = 1
-            else:
-                cur = s + 5
-                carry = -1
-
-            result_digits.append(cur)
-
-        if carry != 0:
-            result_digits.append(carry)
-        result = SnafuNumber(result_digits)
-        if self.to_normal() + other.to_normal() != result.to_normal():
-            raise Exception(f"{self.to_normal()} + {other.to_normal()} = {result.to_normal()}")
-        return result
-
-    def __str__(self):
-        return "".join(INVERSE_MAPPING[d] for d in self.digits[::-1])
-
-    def __repr__(self):
-        return f"Snafu:{str(self)}"
-
-    def to_normal(self):
-        powers = get_powers(50)
-        return sum(power * digit for power, digit in zip(powers, self.digits))
-
-
-def get_powers(num):
-    result = []
-    cur = 1
-    for i in range(num):
-        result.append(cur)
-        cur *= 5
-    return result
-
-
-def to_normal(powers, string):
-    return sum(power * DIGIT_MAPPING[digit] for power, digit in zip(powers, string[::-1]))
-
-
-def solve_file(fname):
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    total = SnafuNumber.parse("0")
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        for line in file.read().split("\n"):
-            total = total + SnafuNumber.parse(line)
-    return str(total)
+from aoc.inputs import resolve
+from day25.solver import SnafuNumber, get_powers, solve_file, solve_stream
 
 
 class TestDay(unittest.TestCase):
@@ -104,6 +31,10 @@ class TestDay(unittest.TestCase):
     def test_solve_file(self):
         self.assertEqual(solve_file("input-test.txt"), "2=-1=0")
 
+    def test_solve_stream(self):
+        with open(resolve(__file__, "input-test.txt"), "r", encoding="utf-8") as file:
+            self.assertEqual(solve_stream(file), "2=-1=0")
+
 
 if __name__ == '__main__':
     print(solve_file("input.txt"))  # 2=222-2---22=1=--1-2
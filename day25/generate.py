@@ -0,0 +1,16 @@
+INVERSE_MAPPING = {2: "2", 1: "1", 0: "0", -1: "-", -2: "="}
+
+
+def to_snafu(number):
+    digits = []
+    while number:
+        rem = (number + 2) % 5 - 2
+        digits.append(INVERSE_MAPPING[rem])
+        number = (number - rem) // 5
+    return "".join(reversed(digits)) or "0"
+
+
+def generate(scale, rng):
+    """110 numbers per scale unit"""
+    for _ in range(max(1, int(110 * scale))):
+        yield to_snafu(rng.randint(1, 5 ** rng.randint(1, 20)))
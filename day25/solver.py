@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+
+from aoc.inputs import as_lines, iter_lines, resolve
+from aoc.instrument import hot
+
+
+DIGIT_MAPPING = {"2": 2, "1": 1, "0": 0, "-": -1, "=": -2}
+INVERSE_MAPPING = {2: "2", 1: "1", 0: "0", -1: "-", -2: "="}
+
+
+@dataclass
+class SnafuNumber:
+    digits: [int]
+
+    @staticmethod
+    def parse(string):
+        return SnafuNumber([DIGIT_MAPPING[c] for c in string[::-1]])
+
+    @hot
+    def __add__(self, other):
+        result_digits = []
+
+        a, b = self.digits.copy(), other.digits.copy()
+        while len(a) < len(b):
+            a.append(0)
+        while len(b) < len(a):
+            b.append(0)
+        carry = 0
+        for x, y in zip(a, b):
+            s = x + y + carry
+            if -2 <= s <= 2:
+                cur = s
+                carry = 0
+            elif s > 2:
+                cur = s - 5
+                carry = 1
+            else:
+                cur = s + 5
+                carry = -1
+
+            result_digits.append(cur)
+
+        if carry != 0:
+            result_digits.append(carry)
+        result = SnafuNumber(result_digits)
+        if self.to_normal() + other.to_normal() != result.to_normal():
+            raise Exception(f"{self.to_normal()} + {other.to_normal()} = {result.to_normal()}")
+        return result
+
+    def __str__(self):
+        return "".join(INVERSE_MAPPING[d] for d in self.digits[::-1])
+
+    def __repr__(self):
+        return f"Snafu:{str(self)}"
+
+    def to_normal(self):
+        powers = get_powers(50)
+        return sum(power * digit for power, digit in zip(powers, self.digits))
+
+
+def get_powers(num):
+    result = []
+    cur = 1
+    for i in range(num):
+        result.append(cur)
+        cur *= 5
+    return result
+
+
+def to_normal(powers, string):
+    return sum(power * DIGIT_MAPPING[digit] for power, digit in zip(powers, string[::-1]))
+
+
+def sum_lines(lines):
+    total = SnafuNumber.parse("0")
+    for line in lines:
+        total = total + SnafuNumber.parse(line.decode())
+    return str(total)
+
+
+def solve_stream(lines):
+    return sum_lines(as_lines(lines))
+
+
+def solve_file(fname):
+    return sum_lines(iter_lines(resolve(__file__, fname)))
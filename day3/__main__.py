@@ -1,67 +1,12 @@
-from os import path
+from itertools import chain, repeat
 import unittest
 
-LOWERCASE_SHIFT = - ord("a") + 1
-UPPERCASE_SHIFT = - ord("A") + 27
-FIRST_LOWER_CASE = ord("a")
-
-
-def find_item_in_line(line):
-    l = len(line) // 2
-    a, b = line[:l], line[l:]
-    b_set = set(b)
-    for i in a:
-        if i in b_set:
-            return i
-    raise Exception("At least one item expected")
-
-
-def find_badge_in_group(group):
-    x, y, z = group
-    y = set(y)
-    z = set(z)
-    for c in x:
-        if c in y and c in z:
-            return c
-    raise Exception("At least one item expected")
-
-
-def score_item(item):
-    initial_value = ord(item)
-    if initial_value >= FIRST_LOWER_CASE:
-        return initial_value + LOWERCASE_SHIFT
-    else:
-        return initial_value + UPPERCASE_SHIFT
-
-
-def score_lines(lines):
-    return sum(score_item(find_item_in_line(l)) for l in lines)
-
-
-def score_groups(lines):
-    return sum(score_item(find_badge_in_group(c)) for c in chunks(lines, 3))
-
-
-def chunks(seq, size):
-    res = []
-    for element in seq:
-        res.append(element)
-        if len(res) == size:
-            yield res
-            res = []
-    if res:
-        yield res
-
-
-def read_lines(fname):
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        return file.read().split("\n")
-
-
-def score_file(fname):
-    lines = list(read_lines(fname))
-    return score_lines(lines), score_groups(lines)
+from aoc.inputs import resolve
+from day3.solver import (
+    find_badge_in_group, find_item_in_line, item_mask, np, read_lines, score_file, score_file_numpy, score_groups,
+    score_groups_bits, score_item, score_line_bits, score_lines, score_lines_bits, score_lines_numpy, score_both,
+    solve_stream,
+)
 
 
 class TestDay(unittest.TestCase):
@@ -121,6 +66,50 @@ class TestDay(unittest.TestCase):
     def test_score_file(self):
         self.assertEqual(score_file("input-test.txt"), (157, 70))
 
+    def test_solve_stream(self):
+        with open(resolve(__file__, "input-test.txt"), "r", encoding="utf-8") as file:
+            self.assertEqual(solve_stream(file), (157, 70))
+
+    def test_score_both_consumes_an_iterator(self):
+        lines = read_lines("input-test.txt")
+        self.assertEqual(score_both(chain.from_iterable(repeat(lines, 100))), (15700, 7000))
+
+    def test_group_size(self):
+        lines = ["abXa", "cdXc", "efYe", "ghYg"]
+        self.assertEqual(find_badge_in_group(lines[:2]), "X")
+        self.assertEqual(score_both(iter(lines), group_size=2), (16, 101))
+        self.assertEqual(score_groups_bits(lines, group_size=2), 101)
+        with self.assertRaises(Exception):
+            score_both(iter(lines), group_size=3)
+
+
+class TestBits(unittest.TestCase):
+
+    def test_item_mask(self):
+        self.assertEqual(item_mask(b"aac"), 0b101)
+        self.assertEqual(item_mask(b"Z").bit_length(), 52)
+
+    def test_score_line_bits(self):
+        for line in ["vJrwpWtwJgWrhcsFMMfFFhFp", "PmmdzqPrVvPwwTWBwg", "CrZsJsPPZsGzwwsLwLmpwMDw"]:
+            self.assertEqual(score_line_bits(line), score_item(find_item_in_line(line)))
+
+    def test_same_as_sets(self):
+        lines = read_lines("input-test.txt")
+        self.assertEqual(score_lines_bits(lines), score_lines(lines))
+        self.assertEqual(score_groups_bits(lines), score_groups(lines))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_score_lines_numpy(self):
+        lines = read_lines("input-test.txt")
+        expected = score_lines(lines), score_groups(lines)
+        self.assertEqual(score_lines_numpy("\n".join(lines).encode()), expected)
+        self.assertEqual(score_lines_numpy(("\r\n".join(lines) + "\r\n").encode()), expected)
+        self.assertEqual(score_file_numpy("input-test.txt"), expected)
+        self.assertEqual(score_file_numpy("input-test.txt", chunk_size=1), expected)
+        self.assertEqual(score_lines_numpy(b"abXa\ncdXc\nefYe\nghYg\n", group_size=2), (16, 101))
+        with self.assertRaises(Exception):
+            score_lines_numpy(b"abXa\ncdXc\nefYe\nghYg\n", group_size=3)
+
 
 if __name__ == '__main__':
     print(score_file("input.txt"))
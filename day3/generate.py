@@ -0,0 +1,23 @@
+from string import ascii_letters
+
+
+def generate_group(rng, pool_size):
+    """Only the badge is common for the whole group and only one item is shared by compartments of a rucksack"""
+    letters = list(ascii_letters)
+    rng.shuffle(letters)
+    badge, shared, rest = letters[0], letters[1:4], letters[4:]
+    pools = [rest[i * pool_size:(i + 1) * pool_size] for i in range(6)]
+    for i in range(3):
+        length = rng.randint(2, 15)
+        left = [shared[i], badge] + [rng.choice(pools[2 * i]) for _ in range(length)]
+        right = [shared[i]] + [rng.choice(pools[2 * i + 1]) for _ in range(length + 1)]
+        rng.shuffle(left)
+        rng.shuffle(right)
+        yield "".join(left) + "".join(right)
+
+
+def generate(scale, rng):
+    """100 groups of three rucksacks per scale unit"""
+    pool_size = (len(ascii_letters) - 4) // 6
+    for _ in range(max(1, int(100 * scale))):
+        yield from generate_group(rng, pool_size)
@@ -0,0 +1,164 @@
+from functools import reduce
+from operator import and_, or_
+from string import ascii_letters
+
+from aoc.inputs import as_lines, iter_chunks, iter_lines, open_buffer, optional_numpy, resolve
+from aoc.instrument import hot
+
+np = optional_numpy()
+
+LOWERCASE_SHIFT = - ord("a") + 1
+UPPERCASE_SHIFT = - ord("A") + 27
+FIRST_LOWER_CASE = ord("a")
+LETTER_BITS = {ord(letter): 1 << i for i, letter in enumerate(ascii_letters)}
+BITS = [LETTER_BITS.get(byte, 0) for byte in range(256)]
+GROUP_SIZE = 3
+CHUNK_SIZE = 1 << 18
+
+
+@hot
+def find_item_in_line(line):
+    l = len(line) // 2
+    a, b = line[:l], line[l:]
+    b_set = set(b)
+    for i in a:
+        if i in b_set:
+            return i
+    raise Exception("At least one item expected")
+
+
+@hot
+def find_badge_in_group(group):
+    x, *others = group
+    others = [set(other) for other in others]
+    for c in x:
+        if all(c in other for other in others):
+            return c
+    raise Exception("At least one item expected")
+
+
+def score_item(item):
+    initial_value = ord(item)
+    if initial_value >= FIRST_LOWER_CASE:
+        return initial_value + LOWERCASE_SHIFT
+    else:
+        return initial_value + UPPERCASE_SHIFT
+
+
+def score_lines(lines):
+    return sum(score_item(find_item_in_line(l)) for l in lines)
+
+
+def score_groups(lines, group_size=GROUP_SIZE):
+    return sum(score_item(find_badge_in_group(c)) for c in chunks(lines, group_size))
+
+
+def chunks(seq, size):
+    res = []
+    for element in seq:
+        res.append(element)
+        if len(res) == size:
+            yield res
+            res = []
+    if res:
+        yield res
+
+
+def item_mask(items):
+    """Bit priority - 1 is set for every item of the bytes, so the priority of a single item mask is its bit_length"""
+    return reduce(or_, map(BITS.__getitem__, items), 0)
+
+
+def common_priority(*masks):
+    common = reduce(and_, masks)
+    if common == 0 or common & (common - 1):
+        raise Exception("Exactly one common item expected")
+    return common.bit_length()
+
+
+def as_bytes(line):
+    return line.encode() if isinstance(line, str) else line
+
+
+@hot
+def score_line_bits(line):
+    line = as_bytes(line)
+    half = len(line) // 2
+    return common_priority(item_mask(line[:half]), item_mask(line[half:]))
+
+
+def score_lines_bits(lines):
+    """Same as score_lines, with bit masks instead of sets"""
+    return sum(score_line_bits(line) for line in lines)
+
+
+def score_groups_bits(lines, group_size=GROUP_SIZE):
+    """Same as score_groups, with bit masks instead of sets"""
+    return sum(common_priority(*map(item_mask, map(as_bytes, group))) for group in chunks(lines, group_size))
+
+
+def score_both(lines, group_size=GROUP_SIZE):
+    """
+    Both parts in a single pass over a one-shot iterator of lines: only the current group is kept,
+    so memory does not depend on the number of lines
+    """
+    part1 = part2 = 0
+    for group in chunks(lines, group_size):
+        if len(group) < group_size:
+            raise Exception(f"Last group has {len(group)} of {group_size} rucksacks")
+        part1 += score_lines(group)
+        part2 += score_item(find_badge_in_group(group))
+    return part1, part2
+
+
+def read_lines(fname):
+    return [line.decode() for line in iter_lines(resolve(__file__, fname))]
+
+
+def solve_stream(lines, group_size=GROUP_SIZE):
+    return score_both((line.decode() for line in as_lines(lines)), group_size)
+
+
+def bit_priorities(masks):
+    """Priorities of single item masks: log2 is exact for powers of two"""
+    if not masks.all() or (masks & (masks - 1)).any():
+        raise Exception("Exactly one common item expected")
+    return np.log2(masks).astype(np.int64) + 1
+
+
+@hot
+def score_lines_numpy(data, group_size=GROUP_SIZE):
+    """Both parts for whole groups of lines of the raw bytes, without any per line python object"""
+    chars = np.frombuffer(data, dtype=np.uint8)
+    chars = chars[chars != ord("\r")]
+    ends = np.flatnonzero(chars == ord("\n"))
+    if len(chars) and chars[-1] != ord("\n"):
+        ends = np.append(ends, len(chars))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    starts, ends = starts[ends > starts], ends[ends > starts]
+    bits = np.array(BITS, dtype=np.uint64)[chars]
+    middles = starts + (ends - starts) // 2
+    halves = np.bitwise_or.reduceat(bits, np.stack([starts, middles], axis=1).ravel()).reshape(-1, 2)
+    # the reduction of the second half runs until the next line start, which only adds the zero newline bit
+    part1 = bit_priorities(halves[:, 0] & halves[:, 1]).sum()
+    rucksacks = halves[:, 0] | halves[:, 1]
+    if len(rucksacks) % group_size:
+        raise Exception(f"Last group has {len(rucksacks) % group_size} of {group_size} rucksacks")
+    part2 = bit_priorities(np.bitwise_and.reduce(rucksacks.reshape(-1, group_size), axis=1)).sum()
+    return int(part1), int(part2)
+
+
+def score_file_numpy(fname, chunk_size=CHUNK_SIZE, group_size=GROUP_SIZE):
+    """Peak memory is about 12 times the chunk size, whatever the size of the input"""
+    part1 = part2 = 0
+    with open_buffer(resolve(__file__, fname)) as buffer:
+        for begin, end in iter_chunks(buffer, chunk_size, lines_per_record=group_size):
+            scores = score_lines_numpy(buffer[begin:end], group_size)
+            part1, part2 = part1 + scores[0], part2 + scores[1]
+    return part1, part2
+
+
+def score_file(fname, group_size=GROUP_SIZE):
+    if np is not None:
+        return score_file_numpy(fname, group_size=group_size)
+    return solve_stream(iter_lines(resolve(__file__, fname)), group_size)
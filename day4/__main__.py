@@ -1,54 +1,12 @@
-from os import path
-from dataclasses import dataclass
+import random
 import unittest
 
-
-@dataclass
-class Range:
-    begin: int
-    end: int
-
-    def include(self, other):
-        return self.begin <= other.begin and self.end >= other.end
-
-    def include_or_included_by(self, other):
-        return self.include(other) or other.include(self)
-
-    def overlap(self, other):
-        if self.begin <= other.begin <= self.end:
-            return True
-        if other.begin <= self.begin <= other.end:
-            return True
-        return False
-
-
-def read_pairs(fname):
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        for s in file:
-            yield line_to_pair(s)
-
-
-def line_to_pair(line):
-    first, second = line.split(",")
-    return range_from_string(first), range_from_string(second)
-
-
-def range_from_string(s):
-    begin, end = map(int, s.split("-"))
-    return Range(begin, end)
-
-
-def score_file(fname):
-    part_1 = 0
-    part_2 = 0
-    for pair in read_pairs(fname):
-        if pair[0].include_or_included_by(pair[1]):
-            part_1 += 1
-            part_2 += 1
-        elif pair[0].overlap(pair[1]):
-            part_2 += 1
-    return part_1, part_2
+from aoc.inputs import resolve
+from day4.generate import generate
+from day4.solver import (
+    Range, RangeIndex, index_pairs, line_to_pair, np, range_from_string, read_pairs, score_file, score_file_numpy,
+    score_pairs, score_pairs_numpy, solve_stream,
+)
 
 
 class TestDay(unittest.TestCase):
@@ -97,6 +55,56 @@ class TestDay(unittest.TestCase):
     def test_score_file(self):
         self.assertEqual(score_file("input-test.txt"), (2, 4))
 
+    def test_solve_stream(self):
+        with open(resolve(__file__, "input-test.txt"), "r", encoding="utf-8") as file:
+            self.assertEqual(solve_stream(file), (2, 4))
+
+
+class TestRangeIndex(unittest.TestCase):
+
+    def test_queries(self):
+        index = index_pairs(read_pairs("input-test.txt"))
+        self.assertEqual(len(index), 12)
+        self.assertEqual(index.stabbing(3), [Range(2, 4), Range(2, 3), Range(2, 8), Range(2, 6), Range(3, 7)])
+        self.assertEqual(
+            index.containing(Range(4, 6)), [Range(2, 8), Range(2, 6), Range(3, 7), Range(4, 6), Range(4, 8)]
+        )
+        self.assertEqual(index.overlapping(Range(8, 10)), [Range(2, 8), Range(4, 8), Range(6, 8), Range(7, 9)])
+        self.assertEqual(index.count_overlapping(Range(8, 10)), 4)
+        self.assertEqual(index.count_stabbing(1), 0)
+
+    def test_same_as_scan(self):
+        rng = random.Random(22)
+        ranges = [Range(b, b + rng.randint(0, 20)) for b in (rng.randint(1, 100) for _ in range(300))]
+        index = RangeIndex(ranges)
+        for begin in range(-5, 130, 7):
+            other = Range(begin, begin + 3)
+            self.assertEqual(index.overlapping(other), [r for r in index.ranges if r.overlap(other)])
+            self.assertEqual(index.containing(other), [r for r in index.ranges if r.include(other)])
+            self.assertEqual(index.count_overlapping(other), sum(r.overlap(other) for r in ranges))
+            self.assertEqual(index.stabbing(begin), [r for r in index.ranges if r.begin <= begin <= r.end])
+
+    def test_empty(self):
+        index = RangeIndex([])
+        self.assertEqual((index.stabbing(1), index.count_stabbing(1)), ([], 0))
+
+
+class TestNumpy(unittest.TestCase):
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_score_pairs_numpy(self):
+        lines = list(generate(5, random.Random(4)))
+        expected = score_pairs(line_to_pair(line) for line in lines)
+        self.assertEqual(score_pairs_numpy("\n".join(lines).encode()), expected)
+        self.assertEqual(score_pairs_numpy(("\r\n".join(lines) + "\r\n").encode()), expected)
+        with self.assertRaises(Exception):
+            score_pairs_numpy(b"1-2,3-4\n5-6\n")
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_score_file_numpy(self):
+        self.assertEqual(score_file_numpy("input-test.txt"), (2, 4))
+        self.assertEqual(score_file_numpy("input-test.txt", chunk_size=10), (2, 4))
+
 
 if __name__ == '__main__':
     print(score_file("input.txt"))
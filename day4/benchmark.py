@@ -0,0 +1,66 @@
+"""
+Compares RangeIndex queries with scans using Range.overlap: python -m day4.benchmark --count 1000000 --queries 20
+"""
+import argparse
+import random
+import time
+
+from day4.solver import Range, RangeIndex
+
+
+def generate_ranges(count, sections, max_length, rng):
+    for _ in range(count):
+        begin = rng.randint(1, sections)
+        yield Range(begin, min(sections, begin + rng.randint(0, max_length)))
+
+
+def time_queries(query, arguments):
+    begin = time.perf_counter()
+    results = [query(argument) for argument in arguments]
+    return time.perf_counter() - begin, results
+
+
+def compare(count, queries, sections, max_length, seed=0):
+    rng = random.Random(seed)
+    ranges = list(generate_ranges(count, sections, max_length, rng))
+    targets = list(generate_ranges(queries, sections, max_length, rng))
+    points = [target.begin for target in targets]
+    begin = time.perf_counter()
+    index = RangeIndex(ranges)
+    rows = [("build", 0.0, time.perf_counter() - begin)]
+    naive = {
+        "stabbing": lambda point: [r for r in ranges if r.overlap(Range(point, point))],
+        "containing": lambda other: [r for r in ranges if r.include(other)],
+        "overlapping": lambda other: [r for r in ranges if r.overlap(other)],
+        "count_overlapping": lambda other: sum(1 for r in ranges if r.overlap(other)),
+    }
+    for name, scan in naive.items():
+        arguments = points if name == "stabbing" else targets
+        scan_seconds, expected = time_queries(scan, arguments)
+        index_seconds, actual = time_queries(getattr(index, name), arguments)
+        if not isinstance(expected[0], int):
+            expected = [sorted(found, key=id) for found in expected]
+            actual = [sorted(found, key=id) for found in actual]
+        if actual != expected:
+            raise Exception(f"RangeIndex.{name} differs from the scan")
+        rows.append((name, scan_seconds, index_seconds))
+    return rows
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmarks the range index of day 4")
+    parser.add_argument("--count", type=int, default=1000000, help="number of indexed ranges")
+    parser.add_argument("--queries", type=int, default=20, help="queries of each kind")
+    parser.add_argument("--sections", type=int, default=10000000)
+    parser.add_argument("--max-length", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    print(f"{'query':>18} {'scan':>9} {'index':>9} {'speedup':>8}")
+    for query_name, scan_time, index_time in compare(args.count, args.queries, args.sections, args.max_length,
+                                                     args.seed):
+        speedup = f"{scan_time / index_time:>7.0f}x" if scan_time else ""
+        print(f"{query_name:>18} {scan_time:>8.3f}s {index_time:>8.3f}s {speedup}")
@@ -0,0 +1,9 @@
+def generate_range(rng):
+    begin = rng.randint(1, 99)
+    return f"{begin}-{rng.randint(begin, 99)}"
+
+
+def generate(scale, rng):
+    """1000 assignment pairs per scale unit"""
+    for _ in range(max(1, int(1000 * scale))):
+        yield f"{generate_range(rng)},{generate_range(rng)}"
@@ -0,0 +1,153 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from itertools import chain
+
+from aoc.inputs import as_lines, ints_of_lines, iter_chunks, iter_ints, open_buffer, optional_numpy, resolve
+from aoc.instrument import hot
+
+np = optional_numpy()
+
+SEPARATORS = bytes.maketrans(b"-,", b"  ")
+NUMPY_CHUNK_SIZE = 64 << 20
+
+
+@dataclass
+class Range:
+    begin: int
+    end: int
+
+    def include(self, other):
+        return self.begin <= other.begin and self.end >= other.end
+
+    @hot
+    def include_or_included_by(self, other):
+        return self.include(other) or other.include(self)
+
+    @hot
+    def overlap(self, other):
+        if self.begin <= other.begin <= self.end:
+            return True
+        if other.begin <= self.begin <= other.end:
+            return True
+        return False
+
+
+class RangeIndex:
+    """
+    Ranges sorted by begin with a tree of the largest end below each node on top. A range overlaps [lo, hi] when it
+    begins at most at hi and ends at least at lo, so stabbing, containment and overlap queries all report the ranges
+    of a sorted prefix that end late enough, skipping every subtree that ends too early.
+    """
+
+    def __init__(self, ranges):
+        self.ranges = sorted(ranges, key=lambda r: r.begin)
+        self.begins = [r.begin for r in self.ranges]
+        self.ends = sorted(r.end for r in self.ranges)
+        self.size = 1 << max(0, len(self.ranges) - 1).bit_length()
+        self.tree = [float("-inf")] * (2 * self.size)
+        self.tree[self.size:self.size + len(self.ranges)] = [r.end for r in self.ranges]
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def __len__(self):
+        return len(self.ranges)
+
+    def stabbing(self, point):
+        """Ranges holding the point"""
+        return self.report(bisect_right(self.begins, point), point)
+
+    def containing(self, other):
+        """Ranges including the other range"""
+        return self.report(bisect_right(self.begins, other.begin), other.end)
+
+    def overlapping(self, other):
+        return self.report(bisect_right(self.begins, other.end), other.begin)
+
+    def count_overlapping(self, other):
+        """Ranges ending before other begins all begin before it too, so two bisections are enough"""
+        return bisect_right(self.begins, other.end) - bisect_left(self.ends, other.begin)
+
+    def count_stabbing(self, point):
+        return self.count_overlapping(Range(point, point))
+
+    @hot
+    def report(self, count, min_end):
+        """Ranges among the first count ones ending at min_end or later, in begin order"""
+        found = []
+        stack = [(1, 0, self.size)]
+        while stack:
+            node, begin, end = stack.pop()
+            if begin >= count or self.tree[node] < min_end:
+                continue
+            if node >= self.size:
+                found.append(self.ranges[begin])
+                continue
+            middle = (begin + end) // 2
+            stack.append((2 * node + 1, middle, end))
+            stack.append((2 * node, begin, middle))
+        return found
+
+
+def index_pairs(pairs):
+    return RangeIndex(chain.from_iterable(pairs))
+
+
+def to_pairs(numbers):
+    for a, b, c, d in numbers:
+        yield Range(a, b), Range(c, d)
+
+
+def read_pairs(fname):
+    return to_pairs(iter_ints(resolve(__file__, fname)))
+
+
+def line_to_pair(line):
+    first, second = line.split(",")
+    return range_from_string(first), range_from_string(second)
+
+
+def range_from_string(s):
+    begin, end = map(int, s.split("-"))
+    return Range(begin, end)
+
+
+def score_pairs(pairs):
+    part_1 = 0
+    part_2 = 0
+    for pair in pairs:
+        if pair[0].include_or_included_by(pair[1]):
+            part_1 += 1
+            part_2 += 1
+        elif pair[0].overlap(pair[1]):
+            part_2 += 1
+    return part_1, part_2
+
+
+def solve_stream(lines):
+    return score_pairs(to_pairs(ints_of_lines(as_lines(lines))))
+
+
+def score_pairs_numpy(data):
+    """Same as score_pairs for raw "a-b,c-d" lines, parsed into four columns by one np.fromstring call"""
+    values = np.fromstring(data.translate(SEPARATORS), dtype=np.int64, sep=" ")
+    if len(values) % 4:
+        raise Exception(f"Expected 4 numbers per line, got {len(values)} numbers")
+    a, b, c, d = values.reshape(-1, 4).T
+    include = ((a <= c) & (b >= d)) | ((c <= a) & (d >= b))
+    overlap = (a <= d) & (c <= b)
+    return int(np.count_nonzero(include)), int(np.count_nonzero(overlap))
+
+
+def score_file_numpy(fname, chunk_size=NUMPY_CHUNK_SIZE):
+    part_1 = part_2 = 0
+    with open_buffer(resolve(__file__, fname)) as buffer:
+        for begin, end in iter_chunks(buffer, chunk_size):
+            scores = score_pairs_numpy(buffer[begin:end])
+            part_1, part_2 = part_1 + scores[0], part_2 + scores[1]
+    return part_1, part_2
+
+
+def score_file(fname):
+    if np is not None:
+        return score_file_numpy(fname)
+    return score_pairs(read_pairs(fname))
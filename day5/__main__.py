@@ -1,89 +1,12 @@
-from dataclasses import dataclass
-from os import path
+import random
 import unittest
 
-
-@dataclass
-class Command:
-    amount: int
-    source: int
-    target: int
-
-
-def parse_state(lines):
-    value_lines = lines[:-1]
-    numbers_line = lines[-1]
-    number = len(numbers_line.split())
-    state = []
-    for i in range(number):
-        state.append([])
-    for line in reversed(value_lines):
-        for i in range(number):
-            pos = 4 * i + 1
-            value = line[pos]
-            if value != ' ':
-                state[i].append(value)
-    return state
-
-
-def parse_commands(lines):
-    for line in lines:
-        parts = line.split()
-        yield Command(int(parts[1]), int(parts[3]) - 1, int(parts[5]) - 1)
-
-
-def read_lines(fname):
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        for line in file:
-            yield line
-
-
-def separate_state_and_command_lines(lines):
-    state = []
-    commands = []
-    commands_mode = False
-    for line in lines:
-        if len(line.strip()) == 0:
-            commands_mode = True
-        elif commands_mode:
-            commands.append(line)
-        else:
-            state.append(line)
-    return state, commands
-
-
-def apply_commands_9000(state, commands):
-    for command in commands:
-        for _ in range(command.amount):
-            state[command.target].append(state[command.source].pop())
-
-
-def apply_commands_9001(state, commands):
-    for command in commands:
-        source = state[command.source]
-        moved = source[-command.amount:]
-        state[command.source] = state[command.source][:-command.amount]
-        state[command.target].extend(moved)
-
-
-def string_of_tops(state):
-    return "".join(map(lambda s: s[-1], state))
-
-
-def solve_file(fname):
-    lines = read_lines(fname)
-    state_lines, command_lines = separate_state_and_command_lines(lines)
-    commands = list(parse_commands(command_lines))
-
-    state_9000 = parse_state(state_lines)
-    state_9001 = [s.copy() for s in state_9000]
-    apply_commands_9000(state_9000, commands)
-    apply_commands_9001(state_9001, commands)
-    tops9000 = string_of_tops(state_9000)
-    tops9001 = string_of_tops(state_9001)
-
-    return tops9000, tops9001
+from day5.generate import generate
+from day5.solver import (
+    Command, Rope, apply_commands_9000, apply_commands_9001, apply_commands_rope, final_heights, parse_commands,
+    parse_stacks, parse_state, read_lines, reversed_segments, separate_state_and_command_lines, solve_file,
+    solve_stream, string_of_rope_tops, string_of_tops, tops_backwards,
+)
 
 
 class TestDay(unittest.TestCase):
@@ -116,6 +39,26 @@ class TestDay(unittest.TestCase):
         apply_commands_9001(state, commands)
         self.assertEqual(state, expected)
 
+    def test_move_onto_same_stack(self):
+        commands = [Command(2, 0, 0), Command(1, 1, 0)]
+        for apply, keep_order in [(apply_commands_9000, False), (apply_commands_9001, True)]:
+            state = [['A', 'B', 'C'], ['D', 'E']]
+            ropes = [Rope(stack) for stack in state]
+            tops = tops_backwards(state, commands, keep_order)
+            apply(state, commands)
+            apply_commands_rope(ropes, commands, keep_order)
+            self.assertEqual(state, [['A', 'B', 'C', 'E'], ['D']])
+            self.assertEqual([list(rope) for rope in ropes], state)
+            self.assertEqual(tops, "ED")
+
+    def test_invalid_move(self):
+        for apply in [apply_commands_9000, apply_commands_9001]:
+            for command in [Command(5, 0, 1), Command(4, 0, 0)]:
+                state = [['A', 'B', 'C'], ['D']]
+                with self.assertRaises(Exception):
+                    apply(state, [command])
+                self.assertEqual(state, [['A', 'B', 'C'], ['D']])
+
     def test_string_of_tops(self):
         state = [['C'], ['M'], ['P', 'D', 'N', 'Z']]
         self.assertEqual(string_of_tops(state), "CMZ")
@@ -124,6 +67,88 @@ class TestDay(unittest.TestCase):
         self.assertEqual(solve_file("input-test.txt"), ("CMZ", "MCD"))
 
 
+class TestStream(unittest.TestCase):
+
+    def test_parse_stacks(self):
+        lines = [b"    [D]", b"[N] [C]    ", b"[Z] [M] [P]", b" 1   2   3 "]
+        self.assertEqual(parse_stacks(lines), [bytearray(b"ZN"), bytearray(b"MCD"), bytearray(b"P")])
+
+    def test_solve_stream(self):
+        self.assertEqual(solve_stream(read_lines("input-test.txt")), ("CMZ", "MCD"))
+
+    def test_same_as_lists(self):
+        lines = list(generate(20, random.Random(25)))
+        state_lines, command_lines = separate_state_and_command_lines(lines)
+        commands = list(parse_commands(command_lines))
+        state_9000 = parse_state(state_lines)
+        state_9001 = [stack.copy() for stack in state_9000]
+        apply_commands_9000(state_9000, commands)
+        apply_commands_9001(state_9001, commands)
+        self.assertEqual(solve_stream(lines), (string_of_tops(state_9000), string_of_tops(state_9001)))
+
+    def test_move_onto_same_stack(self):
+        self.assertEqual(solve_stream(["[C]", "[B]    ", "[A] [D]", " 1   2 ", "", "move 2 from 1 to 1"]), ("CD", "CD"))
+
+    def test_invalid_move(self):
+        with self.assertRaises(Exception):
+            solve_stream(["[A]", " 1 ", "", "move 2 from 1 to 1"])
+
+
+class TestBackwards(unittest.TestCase):
+
+    def test_tops_backwards(self):
+        state = [['Z', 'N'], ['M', 'C', 'D'], ['P']]
+        commands = [Command(1, 1, 0), Command(3, 0, 2), Command(2, 1, 0), Command(1, 0, 1)]
+        self.assertEqual(final_heights(state, commands), [1, 1, 4])
+        self.assertEqual(tops_backwards(state, commands, False), "CMZ")
+        self.assertEqual(tops_backwards(state, commands, True), "MCD")
+        self.assertEqual(solve_file("input-test.txt", backwards=True), ("CMZ", "MCD"))
+
+    def test_same_as_simulation(self):
+        state_lines, command_lines = separate_state_and_command_lines(generate(20, random.Random(24)))
+        commands = list(parse_commands(command_lines))
+        for apply, keep_order in [(apply_commands_9000, False), (apply_commands_9001, True)]:
+            state = parse_state(state_lines)
+            tops = tops_backwards(state, commands, keep_order)
+            apply(state, commands)
+            self.assertEqual(tops, string_of_tops(state))
+
+    def test_invalid_commands(self):
+        with self.assertRaises(Exception):
+            tops_backwards([['A'], ['B']], [Command(2, 0, 1)], True)
+        with self.assertRaises(Exception):
+            tops_backwards([['A'], ['B']], [Command(1, 0, 1)], True)
+
+
+class TestRope(unittest.TestCase):
+
+    def test_take_and_put(self):
+        source, target = Rope("ABCDE"), Rope("XY")
+        target.put(source.take(3))
+        self.assertEqual((list(source), list(target), len(target)), (["A", "B"], list("XYCDE"), 5))
+        source.put(reversed_segments(target.take(4)))
+        self.assertEqual((list(source), list(target)), (list("ABEDCY"), ["X"]))
+        with self.assertRaises(Exception):
+            target.take(2)
+
+    def test_apply_commands_rope(self):
+        commands = [Command(1, 1, 0), Command(3, 0, 2), Command(2, 1, 0), Command(1, 0, 1)]
+        for keep_order, expected in [(False, "CMZ"), (True, "MCD")]:
+            ropes = [Rope("ZN"), Rope("MCD"), Rope("P")]
+            apply_commands_rope(ropes, commands, keep_order)
+            self.assertEqual(string_of_rope_tops(ropes), expected)
+
+    def test_same_as_lists(self):
+        state_lines, command_lines = separate_state_and_command_lines(generate(20, random.Random(5)))
+        commands = list(parse_commands(command_lines))
+        for apply, keep_order in [(apply_commands_9000, False), (apply_commands_9001, True)]:
+            state = parse_state(state_lines)
+            ropes = [Rope(stack) for stack in state]
+            apply(state, commands)
+            apply_commands_rope(ropes, commands, keep_order)
+            self.assertEqual([list(rope) for rope in ropes], state)
+
+
 if __name__ == '__main__':
     print(solve_file("input.txt"))
     print("=====")
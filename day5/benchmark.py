@@ -0,0 +1,93 @@
+"""
+Compares the crane simulations on lists, on ropes and backwards for growing stacks:
+python -m day5.benchmark --height 1000 100000
+"""
+from string import ascii_uppercase
+import argparse
+import random
+import time
+
+from day5.generate import STACKS
+from day5.solver import (
+    Command, Rope, apply_commands_9000, apply_commands_9001, apply_commands_rope, string_of_rope_tops,
+    string_of_tops, tops_backwards
+)
+
+
+def apply_commands_copying(state, commands):
+    """The 9001 before it deleted the moved crates in place, copying the rest of the source stack on every move"""
+    for command in commands:
+        moved = state[command.source][-command.amount:]
+        state[command.source] = state[command.source][:-command.amount]
+        state[command.target].extend(moved)
+
+
+def generate_tall(height, moves, rng):
+    """Stacks of height crates, every move takes a random part of its source stack"""
+    state = [[rng.choice(ascii_uppercase) for _ in range(height)] for _ in range(STACKS)]
+    heights = [height] * STACKS
+    commands = []
+    for _ in range(moves):
+        source = rng.choice([i for i, h in enumerate(heights) if h > 1])
+        target = rng.choice([i for i in range(STACKS) if i != source])
+        amount = rng.randint(1, heights[source] - 1)
+        heights[source] -= amount
+        heights[target] += amount
+        commands.append(Command(amount, source, target))
+    return state, commands
+
+
+def time_lists(apply, state, commands):
+    state = [stack.copy() for stack in state]
+    begin = time.perf_counter()
+    apply(state, commands)
+    return time.perf_counter() - begin, string_of_tops(state)
+
+
+def time_ropes(keep_order, state, commands):
+    ropes = [Rope(stack) for stack in state]
+    begin = time.perf_counter()
+    apply_commands_rope(ropes, commands, keep_order)
+    return time.perf_counter() - begin, string_of_rope_tops(ropes)
+
+
+def time_backwards(keep_order, state, commands):
+    begin = time.perf_counter()
+    tops = tops_backwards(state, commands, keep_order)
+    return time.perf_counter() - begin, tops
+
+
+def compare(heights, moves, seed=0):
+    rows = []
+    for height in heights:
+        state, commands = generate_tall(height, moves, random.Random(seed))
+        timings = [
+            time_lists(apply_commands_copying, state, commands),
+            time_lists(apply_commands_9001, state, commands),
+            time_ropes(True, state, commands),
+            time_backwards(True, state, commands),
+            time_lists(apply_commands_9000, state, commands),
+            time_ropes(False, state, commands),
+            time_backwards(False, state, commands),
+        ]
+        if len({tops for _, tops in timings[:4]}) > 1 or len({tops for _, tops in timings[4:]}) > 1:
+            raise Exception(f"Stacks differ for height {height}")
+        rows.append((height, *(seconds for seconds, _ in timings)))
+    return rows
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmarks crate stacks of day 5")
+    parser.add_argument("--height", type=int, nargs="+", default=[100, 1000, 10000, 100000],
+                        help="crates per stack at the start")
+    parser.add_argument("--moves", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    columns = ["9001 copy", "9001 list", "9001 rope", "9001 back", "9000 list", "9000 rope", "9000 back"]
+    print(f"{'height':>7}" + "".join(f"{column:>11}" for column in columns))
+    for row in compare(args.height, args.moves, args.seed):
+        print(f"{row[0]:>7}" + "".join(f"{seconds:>10.3f}s" for seconds in row[1:]))
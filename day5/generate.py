@@ -0,0 +1,23 @@
+from string import ascii_uppercase
+
+STACKS = 9
+
+
+def generate(scale, rng):
+    """Stacks of up to 8 * scale crates and 500 moves per scale unit. Every stack keeps at least one crate."""
+    heights = [rng.randint(1, max(2, int(8 * scale))) for _ in range(STACKS)]
+    heights[0] = max(2, heights[0])
+    stacks = [[rng.choice(ascii_uppercase) for _ in range(h)] for h in heights]
+
+    for row in range(max(heights) - 1, -1, -1):
+        yield " ".join(f"[{s[row]}]" if row < len(s) else "   " for s in stacks)
+    yield " ".join(f" {i + 1} " for i in range(STACKS))
+    yield ""
+
+    for _ in range(max(1, int(500 * scale))):
+        source = rng.choice([i for i, h in enumerate(heights) if h > 1])
+        target = rng.choice([i for i in range(STACKS) if i != source])
+        amount = rng.randint(1, heights[source] - 1)
+        heights[source] -= amount
+        heights[target] += amount
+        yield f"move {amount} from {source + 1} to {target + 1}"
@@ -0,0 +1,245 @@
+from dataclasses import dataclass
+from itertools import chain, takewhile
+
+from aoc.inputs import as_lines, iter_lines, resolve
+from aoc.instrument import hot
+
+
+MAX_SEGMENTS_MOVED = 256
+SPACE = ord(" ")
+
+
+@dataclass
+class Command:
+    amount: int
+    source: int
+    target: int
+
+
+def parse_state(lines):
+    value_lines = lines[:-1]
+    numbers_line = lines[-1]
+    number = len(numbers_line.split())
+    state = []
+    for i in range(number):
+        state.append([])
+    for line in reversed(value_lines):
+        for i in range(number):
+            pos = 4 * i + 1
+            value = line[pos]
+            if value != ' ':
+                state[i].append(value)
+    return state
+
+
+def parse_commands(lines):
+    for line in lines:
+        parts = line.split()
+        yield Command(int(parts[1]), int(parts[3]) - 1, int(parts[5]) - 1)
+
+
+def read_lines(fname):
+    for line in iter_lines(resolve(__file__, fname)):
+        yield line.decode()
+
+
+def separate_state_and_command_lines(lines):
+    state = []
+    commands = []
+    commands_mode = False
+    for line in lines:
+        if len(line.strip()) == 0:
+            commands_mode = True
+        elif commands_mode:
+            commands.append(line)
+        else:
+            state.append(line)
+    return state, commands
+
+
+class Rope:
+    """
+    Crate stack made of (crates, begin, end, flipped) views on shared tuples, bottom first. Moving the top crates
+    only splits one view and moves whole views, so a move costs O(views moved) whatever the amount.
+    """
+
+    def __init__(self, crates=()):
+        crates = tuple(crates)
+        self.segments = [(crates, 0, len(crates), False)] if crates else []
+        self.size = len(crates)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for crates, begin, end, flipped in self.segments:
+            yield from reversed(crates[begin:end]) if flipped else crates[begin:end]
+
+    def top(self):
+        crates, begin, end, flipped = self.segments[-1]
+        return crates[begin] if flipped else crates[end - 1]
+
+    def take(self, amount):
+        """Removes the top amount crates, returns their views bottom first"""
+        if amount > self.size:
+            raise Exception(f"Cannot take {amount} crates from a stack of {self.size}")
+        self.size -= amount
+        taken = []
+        while amount:
+            crates, begin, end, flipped = self.segments.pop()
+            if end - begin > amount:
+                keep = end - begin - amount
+                if flipped:
+                    self.segments.append((crates, end - keep, end, True))
+                    taken.append((crates, begin, end - keep, True))
+                else:
+                    self.segments.append((crates, begin, begin + keep, False))
+                    taken.append((crates, begin + keep, end, False))
+                break
+            taken.append((crates, begin, end, flipped))
+            amount -= end - begin
+        taken.reverse()
+        if len(taken) > MAX_SEGMENTS_MOVED:
+            crates = tuple(chain.from_iterable(reversed(c[b:e]) if f else c[b:e] for c, b, e, f in taken))
+            return [(crates, 0, len(crates), False)]
+        return taken
+
+    def put(self, segments):
+        self.segments.extend(segments)
+        self.size += sum(end - begin for _, begin, end, _ in segments)
+
+
+def reversed_segments(segments):
+    return [(crates, begin, end, not flipped) for crates, begin, end, flipped in reversed(segments)]
+
+
+def moves_crates(command):
+    """A move onto the stack it takes from leaves the stack as it was, like the crate by crate crane does"""
+    return command.source != command.target
+
+
+@hot
+def apply_commands_9000(state, commands):
+    for command in commands:
+        source = state[command.source]
+        split = len(source) - command.amount
+        if split < 0:
+            raise Exception(f"Cannot move {command.amount} crates from stack {command.source + 1}")
+        if not moves_crates(command):
+            continue
+        state[command.target].extend(reversed(source[split:]))
+        del source[split:]
+
+
+@hot
+def apply_commands_9001(state, commands):
+    for command in commands:
+        source = state[command.source]
+        split = len(source) - command.amount
+        if split < 0:
+            raise Exception(f"Cannot move {command.amount} crates from stack {command.source + 1}")
+        if not moves_crates(command):
+            continue
+        state[command.target].extend(source[split:])
+        del source[split:]
+
+
+@hot
+def apply_commands_rope(ropes, commands, keep_order):
+    """Both crane models on Rope stacks, the 9000 moves crates one by one so their order is reversed"""
+    for command in filter(moves_crates, commands):
+        moved = ropes[command.source].take(command.amount)
+        ropes[command.target].put(moved if keep_order else reversed_segments(moved))
+
+
+def final_heights(state, commands):
+    heights = [len(stack) for stack in state]
+    for command in commands:
+        if command.amount > heights[command.source]:
+            raise Exception(f"Cannot move {command.amount} crates from stack {command.source + 1}")
+        heights[command.source] -= command.amount
+        heights[command.target] += command.amount
+    return heights
+
+
+@hot
+def tops_backwards(state, commands, keep_order):
+    """
+    Tops after the commands without moving any crate: the final top positions are followed back through the commands
+    to the positions they had in the initial state, so the cost does not depend on the amounts moved
+    """
+    heights = final_heights(state, commands)
+    for i, height in enumerate(heights):
+        if height == 0:
+            raise Exception(f"Stack {i + 1} ends empty")
+    positions = [(i, height - 1) for i, height in enumerate(heights)]
+    for command in reversed(commands):
+        source, target, amount = command.source, command.target, command.amount
+        heights[target] -= amount
+        heights[source] += amount
+        for k, (stack, index) in enumerate(positions):
+            if stack == target and index >= heights[target]:
+                offset = index - heights[target]
+                moved_from = heights[source] - amount + offset if keep_order else heights[source] - 1 - offset
+                positions[k] = source, moved_from
+    return "".join(state[stack][index] for stack, index in positions)
+
+
+def parse_stacks(lines):
+    """Stacks of the bytes state lines as bytearrays, one byte per crate"""
+    stacks = [bytearray() for _ in lines[-1].split()]
+    for line in reversed(lines[:-1]):
+        for i, crate in enumerate(line[1::4]):
+            if crate != SPACE:
+                stacks[i].append(crate)
+    return stacks
+
+
+@hot
+def apply_command_lines(stacks_9000, stacks_9001, lines):
+    """Runs both crane models at once (their stacks always have the same heights), parsing the bytes lines directly"""
+    for line in lines:
+        if not line:
+            continue
+        _, amount, _, source, _, target = line.split()
+        source_9000, source_9001 = stacks_9000[int(source) - 1], stacks_9001[int(source) - 1]
+        split = len(source_9000) - int(amount)
+        if split < 0:
+            raise Exception(f"Cannot move {int(amount)} crates from stack {int(source)}")
+        if source == target:
+            continue
+        moved = source_9000[split:]
+        moved.reverse()
+        stacks_9000[int(target) - 1] += moved
+        stacks_9001[int(target) - 1] += source_9001[split:]
+        del source_9000[split:]
+        del source_9001[split:]
+
+
+def solve_stream(lines):
+    lines = as_lines(lines)
+    stacks_9000 = parse_stacks(list(takewhile(bytes.strip, lines)))
+    stacks_9001 = [stack.copy() for stack in stacks_9000]
+    apply_command_lines(stacks_9000, stacks_9001, lines)
+    return string_of_byte_tops(stacks_9000), string_of_byte_tops(stacks_9001)
+
+
+def string_of_byte_tops(stacks):
+    return bytes(stack[-1] for stack in stacks).decode()
+
+
+def string_of_tops(state):
+    return "".join(map(lambda s: s[-1], state))
+
+
+def string_of_rope_tops(ropes):
+    return "".join(rope.top() for rope in ropes)
+
+
+def solve_file(fname, backwards=False):
+    if not backwards:
+        return solve_stream(iter_lines(resolve(__file__, fname)))
+    state_lines, command_lines = separate_state_and_command_lines(read_lines(fname))
+    state = parse_state(state_lines)
+    commands = list(parse_commands(command_lines))
+    return tops_backwards(state, commands, False), tops_backwards(state, commands, True)
@@ -1,32 +1,6 @@
-from os import path
 import unittest
 
-WINDOW_1 = 4
-WINDOW_2 = 14
-
-
-def windows(source, size):
-    for i in range(len(source) - size + 1):
-        begin, end = i, i + size
-        yield begin, end, source[begin: end]
-
-
-def solve(string, window_size):
-    for _, end, window in windows(string, window_size):
-        if len(set(window)) == window_size:
-            return end
-    raise Exception("Start position not found")
-
-
-def read_string(fname):
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        return file.read().strip()
-
-
-def solve_file(fname, window_size):
-    string = read_string(fname)
-    return solve(string, window_size)
+from day6.solver import WINDOW_1, WINDOW_2, solve, solve_file, windows
 
 
 class TestDay(unittest.TestCase):
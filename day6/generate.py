@@ -0,0 +1,11 @@
+from string import ascii_lowercase
+
+MARKER = 14
+
+
+def generate(scale, rng):
+    """4096 characters per scale unit. Only the tail contains the markers, so the whole stream is scanned."""
+    length = max(MARKER, int(4096 * scale))
+    noise = "".join(rng.choice("abc") for _ in range(length - MARKER))
+    marker = rng.sample(ascii_lowercase[3:], MARKER)
+    yield noise + "".join(marker)
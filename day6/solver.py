@@ -0,0 +1,29 @@
+from aoc.inputs import read_text, resolve
+from aoc.instrument import hot
+
+
+WINDOW_1 = 4
+WINDOW_2 = 14
+
+
+def windows(source, size):
+    for i in range(len(source) - size + 1):
+        begin, end = i, i + size
+        yield begin, end, source[begin: end]
+
+
+@hot
+def solve(string, window_size):
+    for _, end, window in windows(string, window_size):
+        if len(set(window)) == window_size:
+            return end
+    raise Exception("Start position not found")
+
+
+def read_string(fname):
+    return read_text(resolve(__file__, fname)).strip()
+
+
+def solve_file(fname, window_size):
+    string = read_string(fname)
+    return solve(string, window_size)
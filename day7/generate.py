@@ -0,0 +1,35 @@
+from string import ascii_lowercase
+
+USED_SPACE = 50000000
+
+
+def generate_name(rng, used):
+    while True:
+        name = "".join(rng.choice(ascii_lowercase) for _ in range(rng.randint(1, 8)))
+        if name not in used:
+            used.add(name)
+            return name
+
+
+def generate(scale, rng):
+    """About 180 directories per scale unit nested up to 12 levels. The total size is kept under the disk size."""
+    dirs = max(2, int(180 * scale))
+    file_size = 2 * USED_SPACE // (dirs * 5)
+    depth = 0
+    yield "$ cd /"
+    for _ in range(dirs):
+        used = set()
+        children = [generate_name(rng, used) for _ in range(rng.randint(0, 3))]
+        yield "$ ls"
+        for child in children:
+            yield f"dir {child}"
+        for _ in range(rng.randint(0, 9)):
+            yield f"{rng.randint(1, file_size)} {generate_name(rng, used)}.{rng.choice(ascii_lowercase)}"
+        if children and depth < 12:
+            yield f"$ cd {rng.choice(children)}"
+            depth += 1
+        elif depth > 0:
+            up = rng.randint(1, depth)
+            for _ in range(up):
+                yield "$ cd .."
+            depth -= up
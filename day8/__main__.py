@@ -1,106 +1,10 @@
-from os import path
 import unittest
 
-
-def read_lines(fname):
-    norm_file_name = path.join(path.dirname(__file__), fname)
-    with open(norm_file_name, "r", encoding="utf-8") as file:
-        return [list(map(int, line.rstrip())) for line in file]
-
-
-def init_bool_map_by_size(rows, cols):
-    result = [[True] * cols]
-    for _ in range(rows - 2):
-        line = [True]
-        line.extend([False] * (cols - 2))
-        line.append(True)
-        result.append(line)
-    result.append([True] * cols)
-    return result
-
-
-def count_visible_from_outside(forest):
-    rows = len(forest)
-    cols = len(forest[0])
-    bool_map = init_bool_map_by_size(rows, cols)
-
-    for row, bool_row in zip(forest, bool_map):
-        fill_bool_row(row, bool_row, 0, 1, cols, 1)
-        fill_bool_row(row, bool_row, cols - 1, cols - 2, -1, -1)
-
-    for col in range(0, cols):
-        fill_bool_col(forest, bool_map, col, 0, 1, rows, 1)
-        fill_bool_col(forest, bool_map, col, rows - 1, rows - 2, -1, -1)
-
-    return count_bool_map(bool_map)
-
-
-def count_bool_map(bool_map):
-    return sum((sum(row) for row in bool_map))
-
-
-def fill_bool_row(row, bool_row, first_pos, begin, end, delta):
-    max_h = row[first_pos]
-    for i in range(begin, end, delta):
-        cur = row[i]
-        if cur > max_h:
-            max_h = cur
-            bool_row[i] = True
-
-
-def fill_bool_col(forest, bool_map, col, first_pos, begin, end, delta):
-    max_h = forest[first_pos][col]
-    for i in range(begin, end, delta):
-        cur = forest[i][col]
-        if cur > max_h:
-            max_h = cur
-            bool_map[i][col] = True
-
-
-def score_tree(forest, row_index, col_index):
-    """There a lot of room for optimisation"""
-    row = forest[row_index]
-    cur_val = row[col_index]
-    rows = len(forest)
-    cols = len(row)
-
-    score = score_tree_in_row(row, cur_val, col_index + 1, cols, 1)
-    score *= score_tree_in_row(row, cur_val, col_index - 1, -1, -1)
-    score *= score_tree_in_col(forest, col_index, cur_val, row_index + 1, rows, 1)
-    score *= score_tree_in_col(forest, col_index, cur_val, row_index - 1, -1, -1)
-
-    return score
-
-
-def score_tree_in_row(row, cur_val, begin, end, delta):
-    i = - 1
-    for i, col_index in enumerate(range(begin, end, delta)):
-        val = row[col_index]
-        if val >= cur_val:
-            return i + 1
-    else:
-        return i + 1
-
-
-def score_tree_in_col(forest, col_index, cur_val, begin, end, delta):
-    i = - 1
-    for i, row_index in enumerate(range(begin, end, delta)):
-        val = forest[row_index][col_index]
-        if val >= cur_val:
-            return i + 1
-    else:
-        return i + 1
-
-
-def max_score_tree(forest):
-    rows = len(forest)
-    cols = len(forest[0])
-    return max((score_tree(forest, r, c) for c in range(1, cols - 1) for r in range(1, rows - 1)))
-
-
-def solve_file(fname):
-    forest = read_lines(fname)
-    return count_visible_from_outside(forest), max_score_tree(forest)
+from aoc.grid import Grid, np
+from day8.solver import (
+    count_visible_from_outside, count_visible_grid, max_score_grid, max_score_tree, read_grid, read_lines, score_tree,
+    solve_file,
+)
 
 
 class TestDay(unittest.TestCase):
@@ -122,6 +26,19 @@ class TestDay(unittest.TestCase):
     def test_max_score_tree(self):
         self.assertEqual(max_score_tree(self.FOREST), 8)
 
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_grid(self):
+        grid = Grid.digits(self.FOREST)
+        self.assertEqual(count_visible_grid(grid), 21)
+        self.assertEqual(max_score_grid(grid), 8)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_grid_same_as_lists(self):
+        forest = read_lines("input.txt")
+        grid = read_grid("input.txt")
+        self.assertEqual(count_visible_grid(grid), count_visible_from_outside(forest))
+        self.assertEqual(max_score_grid(grid), max_score_tree(forest))
+
 
 if __name__ == '__main__':
     print(solve_file("input.txt"))
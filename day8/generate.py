@@ -0,0 +1,8 @@
+from math import sqrt
+
+
+def generate(scale, rng):
+    """A square forest with 99 * sqrt(scale) trees per side, so the number of trees grows linearly"""
+    side = max(3, int(99 * sqrt(scale)))
+    for _ in range(side):
+        yield "".join(str(rng.randint(0, 9)) for _ in range(side))
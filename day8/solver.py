@@ -0,0 +1,148 @@
+from aoc.grid import Grid, np
+from aoc.inputs import iter_lines, resolve
+from aoc.instrument import hot
+
+
+ZERO = ord("0")
+
+
+def read_lines(fname):
+    return [[char - ZERO for char in line.rstrip()] for line in iter_lines(resolve(__file__, fname))]
+
+
+def init_bool_map_by_size(rows, cols):
+    result = [[True] * cols]
+    for _ in range(rows - 2):
+        line = [True]
+        line.extend([False] * (cols - 2))
+        line.append(True)
+        result.append(line)
+    result.append([True] * cols)
+    return result
+
+
+@hot
+def count_visible_from_outside(forest):
+    rows = len(forest)
+    cols = len(forest[0])
+    bool_map = init_bool_map_by_size(rows, cols)
+
+    for row, bool_row in zip(forest, bool_map):
+        fill_bool_row(row, bool_row, 0, 1, cols, 1)
+        fill_bool_row(row, bool_row, cols - 1, cols - 2, -1, -1)
+
+    for col in range(0, cols):
+        fill_bool_col(forest, bool_map, col, 0, 1, rows, 1)
+        fill_bool_col(forest, bool_map, col, rows - 1, rows - 2, -1, -1)
+
+    return count_bool_map(bool_map)
+
+
+def count_bool_map(bool_map):
+    return sum((sum(row) for row in bool_map))
+
+
+def fill_bool_row(row, bool_row, first_pos, begin, end, delta):
+    max_h = row[first_pos]
+    for i in range(begin, end, delta):
+        cur = row[i]
+        if cur > max_h:
+            max_h = cur
+            bool_row[i] = True
+
+
+def fill_bool_col(forest, bool_map, col, first_pos, begin, end, delta):
+    max_h = forest[first_pos][col]
+    for i in range(begin, end, delta):
+        cur = forest[i][col]
+        if cur > max_h:
+            max_h = cur
+            bool_map[i][col] = True
+
+
+@hot
+def score_tree(forest, row_index, col_index):
+    """There a lot of room for optimisation"""
+    row = forest[row_index]
+    cur_val = row[col_index]
+    rows = len(forest)
+    cols = len(row)
+
+    score = score_tree_in_row(row, cur_val, col_index + 1, cols, 1)
+    score *= score_tree_in_row(row, cur_val, col_index - 1, -1, -1)
+    score *= score_tree_in_col(forest, col_index, cur_val, row_index + 1, rows, 1)
+    score *= score_tree_in_col(forest, col_index, cur_val, row_index - 1, -1, -1)
+
+    return score
+
+
+def score_tree_in_row(row, cur_val, begin, end, delta):
+    i = - 1
+    for i, col_index in enumerate(range(begin, end, delta)):
+        val = row[col_index]
+        if val >= cur_val:
+            return i + 1
+    else:
+        return i + 1
+
+
+def score_tree_in_col(forest, col_index, cur_val, begin, end, delta):
+    i = - 1
+    for i, row_index in enumerate(range(begin, end, delta)):
+        val = forest[row_index][col_index]
+        if val >= cur_val:
+            return i + 1
+    else:
+        return i + 1
+
+
+def max_score_tree(forest):
+    rows = len(forest)
+    cols = len(forest[0])
+    return max((score_tree(forest, r, c) for c in range(1, cols - 1) for r in range(1, rows - 1)))
+
+
+def read_grid(fname):
+    return Grid.digits(iter_lines(resolve(__file__, fname)))
+
+
+def shift_right(array, fill):
+    result = np.full_like(array, fill)
+    result[:, 1:] = array[:, :-1]
+    return result
+
+
+@hot
+def count_visible_grid(grid):
+    """Looks from the left side of the grid rotated to every direction"""
+    heights = grid.data.astype(np.int8)
+    visible = np.zeros(heights.shape, dtype=bool)
+    for k in range(4):
+        rotated = np.rot90(heights, k)
+        highest_before = shift_right(np.maximum.accumulate(rotated, axis=1), -1)
+        visible |= np.rot90(rotated > highest_before, -k)
+    return int(visible.sum())
+
+
+@hot
+def max_score_grid(grid):
+    """For every height finds the last not lower tree to the left, the edge counts as such tree"""
+    heights = grid.data
+    score = np.ones(heights.shape, dtype=np.int64)
+    for k in range(4):
+        rotated = np.rot90(heights, k)
+        cols = np.arange(rotated.shape[1])
+        distance = np.zeros(rotated.shape, dtype=np.int64)
+        for height in range(10):
+            blocker = np.maximum.accumulate(np.where(rotated >= height, cols, 0), axis=1)
+            distance = np.where(rotated == height, cols - shift_right(blocker, 0), distance)
+        score *= np.rot90(distance, -k)
+    return int(score.max())
+
+
+def solve_file(fname):
+    if np is not None:
+        grid = read_grid(fname)
+        return count_visible_grid(grid), max_score_grid(grid)
+    forest = read_lines(fname)
+    return count_visible_from_outside(forest), max_score_tree(forest)
@@ -0,0 +1,4 @@
+def generate(scale, rng):
+    """2000 motions per scale unit"""
+    for _ in range(max(1, int(2000 * scale))):
+        yield f"{rng.choice('UDLR')} {rng.randint(1, 20)}"
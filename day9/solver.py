@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from enum import Enum
+
+from aoc.inputs import as_lines, iter_lines, resolve
+from aoc.instrument import hot
+
+
+class Direction(Enum):
+    UP = ("U", 0, -1)
+    DOWN = ("D", 0, 1)
+    LEFT = ("L", -1, 0)
+    RIGHT = ("R", 1, 0)
+
+    def __init__(self, code, x_diff, y_diff):
+        super().__init__()
+        self.code = code
+        self.diff = (x_diff, y_diff)
+
+    @staticmethod
+    def from_code(code):
+        for direction in Direction:
+            if direction.code == code:
+                return direction
+        raise Exception(f"Unknown code {code}")
+
+
+@dataclass
+class Command:
+    direction: Direction
+    distance: int
+
+    @staticmethod
+    def parse(string):
+        parts = string.split()
+        return Command(Direction.from_code(parts[0]), int(parts[1]))
+
+
+def parse_commands(lines):
+    for s in lines:
+        yield Command.parse(s.decode().rstrip())
+
+
+def read_commands(fname):
+    return parse_commands(iter_lines(resolve(__file__, fname)))
+
+
+@hot
+def get_next_tail_position(cur_tail, head):
+    diff = (head[0] - cur_tail[0], head[1] - cur_tail[1])
+    abs_diff = (abs(diff[0]), abs(diff[1]))
+
+    if abs_diff[0] > 1:
+        if abs_diff[1] == 0:
+            return cur_tail[0] + normalize(diff[0]), cur_tail[1]
+        else:
+            return cur_tail[0] + normalize(diff[0]), cur_tail[1] + normalize(diff[1])
+
+    if abs_diff[1] > 1:
+        if abs_diff[0] == 0:
+            return cur_tail[0], cur_tail[1] + normalize(diff[1])
+        else:
+            return cur_tail[0] + normalize(diff[0]), cur_tail[1] + normalize(diff[1])
+
+    return cur_tail
+
+
+@hot
+def count_tail_positions(commands, length):
+    positions = set()
+    rope = [(0, 0)] * length
+    positions.add(rope[-1])
+
+    for command in commands:
+        diff = command.direction.diff
+        for _ in range(command.distance):
+            head = rope[0]
+            head = (head[0] + diff[0], head[1] + diff[1])
+            rope[0] = head
+            for i in range(length - 1):
+                head, tail = rope[i], rope[i + 1]
+                tail = get_next_tail_position(tail, head)
+                rope[i], rope[i + 1] = head, tail
+            positions.add(rope[-1])
+
+    return len(positions)
+
+
+def normalize(value):
+    if value > 0:
+        return 1
+    if value < 0:
+        return -1
+    return 0
+
+
+def solve_stream(lines, length):
+    return count_tail_positions(parse_commands(as_lines(lines)), length)
+
+
+def score_file(fname, length):
+    commands = read_commands(fname)
+    return count_tail_positions(commands, length)